@@ -5,6 +5,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from api.routers import coaches, members, plans
+from api.streaming import NEXT_CURSOR_HEADER
+from api.unit_of_work import UnitOfWorkMiddleware
 from bootstrap.context import ApiApplicationContext
 
 
@@ -22,11 +24,13 @@ def create_api(ctx: ApiApplicationContext | None = None) -> FastAPI:
     app = FastAPI(title="Personal Training Studio API", lifespan=lifespan)
 
     app.container = ctx.container  # type: ignore[attr-defined]
+    app.add_middleware(UnitOfWorkMiddleware, container=ctx.container)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["http://localhost:5173"],
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
     app.include_router(members.router)
     app.include_router(coaches.router)
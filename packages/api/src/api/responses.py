@@ -0,0 +1,23 @@
+from collections.abc import Mapping
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def json_response[T](
+    content: T,
+    adapter: TypeAdapter[T],
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Serialize response models straight to JSON bytes with ``adapter``.
+
+    FastAPI re-validates a returned value against the route's ``response_model``
+    before serializing it; a ``Response`` is sent as is. Routes build their
+    response models from already validated domain objects, so the second pass
+    is skipped. ``response_model`` stays on the route for the OpenAPI schema,
+    but the status code and headers must be passed here.
+    """
+    return Response(adapter.dump_json(content), status_code=status_code, headers=headers, media_type=JSON_MEDIA_TYPE)
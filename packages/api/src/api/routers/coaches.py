@@ -1,8 +1,19 @@
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
-from api.schemas.coach_schemas import CoachCreate, CoachResponse
+from api.responses import json_response
+from api.schemas.coach_schemas import (
+    COACH_LIST_RESPONSE,
+    COACH_MATCH_RESULTS,
+    COACH_RESPONSE,
+    OPTIONAL_COACH_RESPONSE,
+    CoachCreate,
+    CoachMatchBatchRequest,
+    CoachMatchResult,
+    CoachResponse,
+)
+from api.streaming import NEXT_CURSOR_HEADER, ndjson_response
 from application.coaches.coach_service import CoachService
 from bootstrap.containers import Container
 
@@ -14,7 +25,7 @@ router = APIRouter(prefix="/coaches", tags=["coaches"])
 async def register_coach(
     body: CoachCreate,
     coach_service: CoachService = Depends(Provide[Container.coach_service]),
-) -> CoachResponse:
+) -> Response:
     try:
         coach = await coach_service.register(
             first_name=body.first_name,
@@ -27,17 +38,32 @@ async def register_coach(
         )
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc))
-    return CoachResponse.from_domain(coach)
+    return json_response(CoachResponse.from_domain(coach), COACH_RESPONSE, status_code=201)
 
 
 @router.get("/", response_model=list[CoachResponse])
 @inject
 async def list_coaches(
     specialization: str | None = Query(None),
+    limit: int | None = Query(None, ge=1, le=1000),
+    after: int | None = Query(None),
+    stream: bool = Query(False),
     coach_service: CoachService = Depends(Provide[Container.coach_service]),
-) -> list[CoachResponse]:
-    coaches = await coach_service.find_available(specialization)
-    return [CoachResponse.from_domain(c) for c in coaches]
+) -> Response:
+    if specialization and (stream or limit is not None):
+        raise HTTPException(status_code=422, detail="specialization cannot be combined with limit or stream")
+    if after is not None and limit is None:
+        raise HTTPException(status_code=422, detail="after requires limit")
+    if stream:
+        return ndjson_response(coach_service.stream_all(), CoachResponse.from_domain)
+    headers: dict[str, str] = {}
+    if limit is None:
+        coaches = await coach_service.find_available(specialization)
+    else:
+        coaches, next_cursor = await coach_service.get_page(after, limit)
+        if next_cursor is not None:
+            headers[NEXT_CURSOR_HEADER] = str(next_cursor)
+    return json_response([CoachResponse.from_domain(c) for c in coaches], COACH_LIST_RESPONSE, headers=headers)
 
 
 @router.get("/match", response_model=CoachResponse | None)
@@ -45,12 +71,27 @@ async def list_coaches(
 async def match_coach_for_member(
     member_id: int = Query(...),
     coach_service: CoachService = Depends(Provide[Container.coach_service]),
-) -> CoachResponse | None:
+) -> Response:
     try:
         coach = await coach_service.find_best_for_member(member_id)
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc))
-    return CoachResponse.from_domain(coach) if coach else None
+    return json_response(CoachResponse.from_domain(coach) if coach else None, OPTIONAL_COACH_RESPONSE)
+
+
+@router.post("/match/batch", response_model=list[CoachMatchResult])
+@inject
+async def match_coaches_for_members(
+    body: CoachMatchBatchRequest,
+    coach_service: CoachService = Depends(Provide[Container.coach_service]),
+) -> Response:
+    matches = await coach_service.match_many(body.member_ids)
+    responses = {c.id: CoachResponse.from_domain(c) for c in matches.values() if c is not None}
+    results = [
+        CoachMatchResult.model_construct(member_id=member_id, coach=responses[coach.id] if coach else None)
+        for member_id, coach in matches.items()
+    ]
+    return json_response(results, COACH_MATCH_RESULTS)
 
 
 @router.get("/{coach_id}", response_model=CoachResponse)
@@ -58,11 +99,11 @@ async def match_coach_for_member(
 async def get_coach(
     coach_id: int,
     coach_service: CoachService = Depends(Provide[Container.coach_service]),
-) -> CoachResponse:
+) -> Response:
     coach = await coach_service.get(coach_id)
     if coach is None:
         raise HTTPException(status_code=404, detail=f"Coach {coach_id} not found")
-    return CoachResponse.from_domain(coach)
+    return json_response(CoachResponse.from_domain(coach), COACH_RESPONSE)
 
 
 @router.delete("/{coach_id}", status_code=204)
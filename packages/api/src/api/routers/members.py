@@ -1,8 +1,10 @@
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
-from api.schemas.member_schemas import GoalCreate, MemberCreate, MemberResponse
+from api.responses import json_response
+from api.schemas.member_schemas import MEMBER_LIST_RESPONSE, MEMBER_RESPONSE, GoalCreate, MemberCreate, MemberResponse
+from api.streaming import NEXT_CURSOR_HEADER, ndjson_response
 from application.members.member_service import MemberService
 from bootstrap.containers import Container
 
@@ -14,7 +16,7 @@ router = APIRouter(prefix="/members", tags=["members"])
 async def register_member(
     body: MemberCreate,
     member_service: MemberService = Depends(Provide[Container.member_service]),
-) -> MemberResponse:
+) -> Response:
     try:
         member = await member_service.register(
             first_name=body.first_name,
@@ -27,16 +29,29 @@ async def register_member(
         )
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc))
-    return MemberResponse.from_domain(member)
+    return json_response(MemberResponse.from_domain(member), MEMBER_RESPONSE, status_code=201)
 
 
 @router.get("/", response_model=list[MemberResponse])
 @inject
 async def list_members(
+    limit: int | None = Query(None, ge=1, le=1000),
+    after: int | None = Query(None),
+    stream: bool = Query(False),
     member_service: MemberService = Depends(Provide[Container.member_service]),
-) -> list[MemberResponse]:
-    members = await member_service.get_all()
-    return [MemberResponse.from_domain(m) for m in members]
+) -> Response:
+    if after is not None and limit is None:
+        raise HTTPException(status_code=422, detail="after requires limit")
+    if stream:
+        return ndjson_response(member_service.stream_all(), MemberResponse.from_domain)
+    headers: dict[str, str] = {}
+    if limit is None:
+        members = await member_service.get_all()
+    else:
+        members, next_cursor = await member_service.get_page(after, limit)
+        if next_cursor is not None:
+            headers[NEXT_CURSOR_HEADER] = str(next_cursor)
+    return json_response([MemberResponse.from_domain(m) for m in members], MEMBER_LIST_RESPONSE, headers=headers)
 
 
 @router.get("/{member_id}", response_model=MemberResponse)
@@ -44,9 +59,9 @@ async def list_members(
 async def get_member(
     member_id: int,
     member_service: MemberService = Depends(Provide[Container.member_service]),
-) -> MemberResponse:
+) -> Response:
     member = await member_service.get(member_id)
-    return MemberResponse.from_domain(member)
+    return json_response(MemberResponse.from_domain(member), MEMBER_RESPONSE)
 
 
 @router.post("/{member_id}/goals", response_model=MemberResponse, status_code=201)
@@ -55,7 +70,7 @@ async def add_goal(
     member_id: int,
     body: GoalCreate,
     member_service: MemberService = Depends(Provide[Container.member_service]),
-) -> MemberResponse:
+) -> Response:
     try:
         member = await member_service.add_goal(
             member_id=member_id,
@@ -65,7 +80,7 @@ async def add_goal(
         )
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc))
-    return MemberResponse.from_domain(member)
+    return json_response(MemberResponse.from_domain(member), MEMBER_RESPONSE, status_code=201)
 
 
 @router.delete("/{member_id}", status_code=204)
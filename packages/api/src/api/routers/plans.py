@@ -1,8 +1,11 @@
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
+from api.responses import json_response
 from api.schemas.plan_schemas import (
+    PLAN_PROGRESS_RESPONSE,
+    PLAN_RESPONSE,
     CompleteSession,
     PlanCreate,
     PlanProgressResponse,
@@ -20,7 +23,7 @@ router = APIRouter(prefix="/plans", tags=["plans"])
 async def create_plan(
     body: PlanCreate,
     plan_service: TrainingPlanService = Depends(Provide[Container.plan_service]),
-) -> PlanResponse:
+) -> Response:
     try:
         plan = await plan_service.create_plan(
             member_id=body.member_id,
@@ -31,7 +34,7 @@ async def create_plan(
         )
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc))
-    return PlanResponse.from_domain(plan)
+    return json_response(PlanResponse.from_domain(plan), PLAN_RESPONSE, status_code=201)
 
 
 @router.post("/{plan_id}/activate", response_model=PlanResponse)
@@ -39,12 +42,12 @@ async def create_plan(
 async def activate_plan(
     plan_id: int,
     plan_service: TrainingPlanService = Depends(Provide[Container.plan_service]),
-) -> PlanResponse:
+) -> Response:
     try:
         plan = await plan_service.activate_plan(plan_id)
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc))
-    return PlanResponse.from_domain(plan)
+    return json_response(PlanResponse.from_domain(plan), PLAN_RESPONSE)
 
 
 @router.get("/{plan_id}", response_model=PlanResponse)
@@ -52,11 +55,11 @@ async def activate_plan(
 async def get_plan(
     plan_id: int,
     plan_service: TrainingPlanService = Depends(Provide[Container.plan_service]),
-) -> PlanResponse:
+) -> Response:
     plan = await plan_service.get(plan_id)
     if plan is None:
         raise HTTPException(status_code=404, detail=f"Plan {plan_id} not found")
-    return PlanResponse.from_domain(plan)
+    return json_response(PlanResponse.from_domain(plan), PLAN_RESPONSE)
 
 
 @router.get("/{plan_id}/progress", response_model=PlanProgressResponse)
@@ -64,12 +67,12 @@ async def get_plan(
 async def get_plan_progress(
     plan_id: int,
     plan_service: TrainingPlanService = Depends(Provide[Container.plan_service]),
-) -> PlanProgressResponse:
+) -> Response:
     try:
         pct = await plan_service.get_progress(plan_id)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc))
-    return PlanProgressResponse(plan_id=plan_id, completion_pct=pct)
+    return json_response(PlanProgressResponse.model_construct(plan_id=plan_id, completion_pct=pct), PLAN_PROGRESS_RESPONSE)
 
 
 @router.post("/{plan_id}/sessions", response_model=PlanResponse, status_code=201)
@@ -78,7 +81,7 @@ async def add_session(
     plan_id: int,
     body: SessionCreate,
     plan_service: TrainingPlanService = Depends(Provide[Container.plan_service]),
-) -> PlanResponse:
+) -> Response:
     try:
         plan = await plan_service.add_session(
             plan_id=plan_id,
@@ -88,7 +91,7 @@ async def add_session(
         )
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc))
-    return PlanResponse.from_domain(plan)
+    return json_response(PlanResponse.from_domain(plan), PLAN_RESPONSE, status_code=201)
 
 
 @router.post("/{plan_id}/sessions/{session_id}/complete", response_model=PlanResponse)
@@ -98,7 +101,7 @@ async def complete_session(
     session_id: int,
     body: CompleteSession,
     plan_service: TrainingPlanService = Depends(Provide[Container.plan_service]),
-) -> PlanResponse:
+) -> Response:
     try:
         plan = await plan_service.complete_session(
             plan_id=plan_id,
@@ -107,4 +110,4 @@ async def complete_session(
         )
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc))
-    return PlanResponse.from_domain(plan)
+    return json_response(PlanResponse.from_domain(plan), PLAN_RESPONSE)
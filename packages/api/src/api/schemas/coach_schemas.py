@@ -1,7 +1,7 @@
 
 from typing import Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 
 from domain.coaches.coach import Coach
 
@@ -31,7 +31,7 @@ class CoachResponse(BaseModel):
 
     @classmethod
     def from_domain(cls, c: Coach) -> Self:
-        return cls(
+        return cls.model_construct(
             id=c.id,
             first_name=c.name.first_name,
             last_name=c.name.last_name,
@@ -42,3 +42,18 @@ class CoachResponse(BaseModel):
             max_clients=c.max_clients,
             current_client_count=c.current_client_count,
         )
+
+
+class CoachMatchBatchRequest(BaseModel):
+    member_ids: list[int] = Field(min_length=1, max_length=10_000)
+
+
+class CoachMatchResult(BaseModel):
+    member_id: int
+    coach: CoachResponse | None
+
+
+COACH_RESPONSE = TypeAdapter(CoachResponse)
+COACH_LIST_RESPONSE = TypeAdapter(list[CoachResponse])
+OPTIONAL_COACH_RESPONSE = TypeAdapter(CoachResponse | None)
+COACH_MATCH_RESULTS = TypeAdapter(list[CoachMatchResult])
@@ -2,7 +2,7 @@
 from datetime import date
 from typing import Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from domain.members.member import Member
 
@@ -49,7 +49,7 @@ class MemberResponse(BaseModel):
 
     @classmethod
     def from_domain(cls, m: Member) -> Self:
-        return cls(
+        return cls.model_construct(
             id=m.id,
             first_name=m.name.first_name,
             last_name=m.name.last_name,
@@ -60,7 +60,7 @@ class MemberResponse(BaseModel):
             membership_valid_until=m.membership.valid_until,
             active_plan_id=m.active_plan_id,
             goals=[
-                GoalResponse(
+                GoalResponse.model_construct(
                     id=g.id,
                     type=g.type.value,
                     description=g.description,
@@ -70,3 +70,7 @@ class MemberResponse(BaseModel):
                 for g in m.goals
             ],
         )
+
+
+MEMBER_RESPONSE = TypeAdapter(MemberResponse)
+MEMBER_LIST_RESPONSE = TypeAdapter(list[MemberResponse])
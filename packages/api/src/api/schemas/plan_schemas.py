@@ -2,7 +2,7 @@
 from datetime import date, datetime
 from typing import Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from domain.plans.training_plan import TrainingPlan
 
@@ -68,7 +68,8 @@ class PlanResponse(BaseModel):
 
     @classmethod
     def from_domain(cls, p: TrainingPlan) -> Self:
-        return cls(
+        # Built from validated domain objects, so skip validating the tree again.
+        return cls.model_construct(
             id=p.id,
             member_id=p.member_id,
             coach_id=p.coach_id,
@@ -77,7 +78,7 @@ class PlanResponse(BaseModel):
             starts_at=p.starts_at,
             ends_at=p.ends_at,
             sessions=[
-                WorkoutSessionResponse(
+                WorkoutSessionResponse.model_construct(
                     id=s.id,
                     name=s.name,
                     scheduled_date=s.scheduled_date,
@@ -85,7 +86,7 @@ class PlanResponse(BaseModel):
                     completed_at=s.completed_at,
                     notes=s.notes,
                     exercises=[
-                        PlannedExerciseResponse(
+                        PlannedExerciseResponse.model_construct(
                             exercise_id=e.exercise_id,
                             name=e.name,
                             sets=e.sets,
@@ -98,3 +99,7 @@ class PlanResponse(BaseModel):
                 for s in p.sessions
             ],
         )
+
+
+PLAN_RESPONSE = TypeAdapter(PlanResponse)
+PLAN_PROGRESS_RESPONSE = TypeAdapter(PlanProgressResponse)
@@ -0,0 +1,18 @@
+
+from collections.abc import AsyncIterator, Callable
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def ndjson_response[T](items: AsyncIterator[T], to_response: Callable[[T], BaseModel]) -> StreamingResponse:
+    """Stream ``items`` as newline-delimited JSON, one response model per line."""
+
+    async def lines() -> AsyncIterator[str]:
+        async for item in items:
+            yield to_response(item).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
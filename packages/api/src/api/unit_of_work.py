@@ -0,0 +1,38 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from application.unit_of_work import unit_of_work
+from bootstrap.containers import Container
+
+
+class UnitOfWorkMiddleware:
+    """Runs every HTTP request in one unit of work.
+
+    The commit happens just before the response starts, so a failing commit
+    still turns into a 500 instead of a success the client already saw. Error
+    responses roll back. Streamed bodies keep reading through the same session
+    after the commit.
+    """
+
+    def __init__(self, app: ASGIApp, container: Container) -> None:
+        self._app = app
+        self._container = container
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        transaction_manager = self._container.transaction_manager()
+        dispatcher = self._container.event_dispatcher()
+        outbox = self._container.outbox()
+        async with unit_of_work(transaction_manager, dispatcher, outbox) as uow:
+
+            async def send_after_commit(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    if message["status"] < 400:
+                        await uow.commit()
+                    else:
+                        await uow.rollback()
+                await send(message)
+
+            await self._app(scope, receive, send_after_commit)
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clean_db():
+    """Benchmarks build their data in memory; there is no database to start or clean."""
+    yield
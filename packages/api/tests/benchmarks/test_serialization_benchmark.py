@@ -0,0 +1,141 @@
+"""Benchmark: response serialization, validated models vs the fast path.
+
+For plans with 10/100/1000 sessions and coach/member listings of 10/1k/10k items, compares
+- the previous path: a validating ``from_domain``, FastAPI's re-validation
+  against ``response_model``, then ``dump_json``,
+- the fast path: ``from_domain`` via ``model_construct`` and one ``dump_json``
+  through the route's ``TypeAdapter``.
+Both must produce the same bytes. Timings are only reported; run with ``-s`` to see them.
+"""
+
+import time
+from collections.abc import Callable
+from datetime import date
+
+import pytest
+from pydantic import BaseModel, TypeAdapter
+
+from api.schemas.coach_schemas import COACH_LIST_RESPONSE, CoachResponse
+from api.schemas.member_schemas import MEMBER_LIST_RESPONSE, MemberResponse
+from api.schemas.plan_schemas import PLAN_RESPONSE, PlanResponse
+from domain.coaches.coach import Coach
+from domain.coaches.value_objects import CoachTier, Specialization
+from domain.members.entities import FitnessGoal
+from domain.members.member import Member
+from domain.members.value_objects import FitnessLevel, GoalType, Membership, MembershipTier
+from domain.plans.entities import WorkoutSession
+from domain.plans.training_plan import TrainingPlan
+from domain.plans.value_objects import PlannedExercise, PlanStatus
+from domain.shared.value_objects import Email, FullName, PhoneNumber
+
+_ROUNDS = 5
+
+
+def _plan(sessions: int) -> TrainingPlan:
+    return TrainingPlan(
+        id=1,
+        member_id=1,
+        coach_id=1,
+        name="Strength block",
+        status=PlanStatus.ACTIVE,
+        starts_at=date(2026, 1, 1),
+        ends_at=date(2026, 12, 31),
+        sessions=[
+            WorkoutSession(
+                id=i,
+                name=f"Session {i}",
+                scheduled_date=date(2026, 1, 1),
+                exercises=[
+                    PlannedExercise(exercise_id=str(j), name=f"Exercise {j}", sets=3, reps=10, rest_seconds=60)
+                    for j in range(5)
+                ],
+            )
+            for i in range(1, sessions + 1)
+        ],
+    )
+
+
+def _coaches(n: int) -> list[Coach]:
+    return [
+        Coach(
+            id=i,
+            name=FullName(first_name="Coach", last_name=f"No{i}"),
+            email=Email(value=f"coach{i}@gym.com"),
+            bio="Strength and conditioning",
+            tier=CoachTier.STANDARD,
+            specializations=frozenset({Specialization.STRENGTH, Specialization.CARDIO}),
+            max_clients=10,
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _members(n: int) -> list[Member]:
+    return [
+        Member(
+            id=i,
+            name=FullName(first_name="Member", last_name=f"No{i}"),
+            email=Email(value=f"member{i}@gym.com"),
+            phone=PhoneNumber(value="+48123456789"),
+            fitness_level=FitnessLevel.BEGINNER,
+            membership=Membership(tier=MembershipTier.PREMIUM, valid_until=date(2027, 1, 1)),
+            goals=[FitnessGoal(id=i, type=GoalType.BUILD_MUSCLE, description="Squat 100kg", target_date=date(2026, 6, 1))],
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _best_of(serialize: Callable[[], bytes]) -> tuple[float, bytes]:
+    timings: list[float] = []
+    result = serialize()
+    for _ in range(_ROUNDS):
+        start = time.perf_counter()
+        result = serialize()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def _validated[M: BaseModel](model: type[M], fast: M) -> M:
+    """What ``from_domain`` produced before: a model validated field by field."""
+    return model.model_validate(fast.model_dump())
+
+
+def _compare[T](label: str, adapter: TypeAdapter[T], legacy: Callable[[], T], fast: Callable[[], T]) -> None:
+    # FastAPI validates the returned value against ``response_model`` before dumping it.
+    legacy_s, legacy_json = _best_of(lambda: adapter.dump_json(adapter.validate_python(legacy(), from_attributes=True)))
+    fast_s, fast_json = _best_of(lambda: adapter.dump_json(fast()))
+    print(f"\n{label}: validated={legacy_s * 1e3:.2f}ms fast={fast_s * 1e3:.2f}ms ({len(fast_json)}B)")
+    assert fast_json == legacy_json
+
+
+@pytest.mark.parametrize("n", [10, 100, 1_000])
+def test_plan_response_cost(n):
+    plan = _plan(n)
+    _compare(
+        f"plan with {n:>5} sessions",
+        PLAN_RESPONSE,
+        lambda: _validated(PlanResponse, PlanResponse.from_domain(plan)),
+        lambda: PlanResponse.from_domain(plan),
+    )
+
+
+@pytest.mark.parametrize("n", [10, 1_000, 10_000])
+def test_coach_listing_cost(n):
+    coaches = _coaches(n)
+    _compare(
+        f"{n:>5} coaches",
+        COACH_LIST_RESPONSE,
+        lambda: [_validated(CoachResponse, CoachResponse.from_domain(c)) for c in coaches],
+        lambda: [CoachResponse.from_domain(c) for c in coaches],
+    )
+
+
+@pytest.mark.parametrize("n", [10, 1_000, 10_000])
+def test_member_listing_cost(n):
+    members = _members(n)
+    _compare(
+        f"{n:>5} members",
+        MEMBER_LIST_RESPONSE,
+        lambda: [_validated(MemberResponse, MemberResponse.from_domain(m)) for m in members],
+        lambda: [MemberResponse.from_domain(m) for m in members],
+    )
@@ -45,12 +45,15 @@ async def client(test_app):
 @pytest.fixture(autouse=True)
 async def _clean_db(api_context):
     yield
+    # Background handlers still writing would deadlock against the TRUNCATE.
+    await api_context.container.event_dispatcher().drain()
     db = api_context.container.database()
     async with db.engine.begin() as conn:
         await conn.execute(text(
             "TRUNCATE planned_exercises, workout_sessions, training_plans, "
-            "coach_spec_rows, availability_slots, certifications, coaches, "
-            "fitness_goals, members RESTART IDENTITY CASCADE"
+            "availability_slots, certifications, coaches, "
+            "fitness_goals, members, outbox RESTART IDENTITY CASCADE"
         ))
     redis_client = await api_context.container.redis_client.async_()
     await redis_client._redis.flushdb()
+    api_context.container.local_cache().clear()
@@ -52,12 +52,14 @@ async def plan_service(app_context):
 @pytest.fixture(autouse=True)
 async def _clean_db(app_context):
     yield
+    # Background handlers still writing would deadlock against the TRUNCATE.
+    await app_context.container.event_dispatcher().drain()
     db = app_context.container.database()
     async with db.engine.begin() as conn:
         await conn.execute(text(
             "TRUNCATE planned_exercises, workout_sessions, training_plans, "
-            "coach_spec_rows, availability_slots, certifications, coaches, "
-            "fitness_goals, members RESTART IDENTITY CASCADE"
+            "availability_slots, certifications, coaches, "
+            "fitness_goals, members, outbox RESTART IDENTITY CASCADE"
         ))
     redis_client = await app_context.container.redis_client.async_()
     await redis_client._redis.flushdb()
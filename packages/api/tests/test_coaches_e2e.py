@@ -41,6 +41,14 @@ class TestListCoaches:
         assert resp.status_code == 200
         assert len(resp.json()) == 1
 
+    async def test_cached_listing_includes_coach_registered_after_it(self, client):
+        await client.post("/coaches/", json=_coach_payload())
+        assert len((await client.get("/coaches/")).json()) == 1
+
+        await client.post("/coaches/", json=_coach_payload(email="second@gym.com"))
+
+        assert len((await client.get("/coaches/")).json()) == 2
+
     async def test_filter_by_specialization(self, client):
         await client.post("/coaches/", json=_coach_payload(specializations=["STRENGTH"]))
         await client.post("/coaches/", json=_coach_payload(
@@ -51,6 +59,31 @@ class TestListCoaches:
         coaches = resp.json()
         assert all("STRENGTH" in c["specializations"] for c in coaches)
 
+    async def test_keyset_pagination(self, client):
+        for i in range(3):
+            await client.post("/coaches/", json=_coach_payload(email=f"c{i}@gym.com"))
+        resp = await client.get("/coaches/?limit=2")
+        assert resp.status_code == 200
+        assert len(resp.json()) == 2
+        cursor = resp.headers["X-Next-Cursor"]
+        resp = await client.get(f"/coaches/?limit=2&after={cursor}")
+        assert [c["email"] for c in resp.json()] == ["c2@gym.com"]
+
+    async def test_stream_ndjson(self, client):
+        await client.post("/coaches/", json=_coach_payload())
+        resp = await client.get("/coaches/?stream=true")
+        assert resp.status_code == 200
+        lines = resp.text.splitlines()
+        assert len(lines) == 1
+
+    async def test_specialization_with_limit_returns_422(self, client):
+        resp = await client.get("/coaches/?specialization=STRENGTH&limit=2")
+        assert resp.status_code == 422
+
+    async def test_after_without_limit_returns_422(self, client):
+        resp = await client.get("/coaches/?after=1")
+        assert resp.status_code == 422
+
 
 class TestGetCoach:
     async def test_returns_coach(self, client):
@@ -90,3 +123,34 @@ class TestMatchCoach:
     async def test_unknown_member_returns_404(self, client):
         resp = await client.get("/coaches/match?member_id=99999")
         assert resp.status_code == 500
+
+    async def test_batch_assigns_within_capacity(self, client):
+        from datetime import date, timedelta
+
+        member_ids = []
+        for i in range(3):
+            resp = await client.post("/members/", json={
+                "first_name": "Jan", "last_name": "Kowalski",
+                "email": f"jan{i}@batch.com", "phone": "+48123456789",
+                "fitness_level": "BEGINNER",
+                "membership_valid_until": (date.today() + timedelta(days=30)).isoformat(),
+            })
+            member_id = resp.json()["id"]
+            await client.post(f"/members/{member_id}/goals", json={
+                "goal_type": "BUILD_MUSCLE", "description": "Lift",
+                "target_date": (date.today() + timedelta(days=90)).isoformat(),
+            })
+            member_ids.append(member_id)
+        coach = (await client.post("/coaches/", json=_coach_payload(max_clients=2))).json()
+
+        resp = await client.post("/coaches/match/batch", json={"member_ids": [*member_ids, 99999]})
+
+        assert resp.status_code == 200
+        results = resp.json()
+        assert [r["member_id"] for r in results] == [*member_ids, 99999]
+        assigned = [r["coach"]["id"] if r["coach"] else None for r in results]
+        assert assigned == [coach["id"], coach["id"], None, None]
+
+    async def test_batch_rejects_empty_request(self, client):
+        resp = await client.post("/coaches/match/batch", json={"member_ids": []})
+        assert resp.status_code == 422
@@ -1,5 +1,6 @@
 """E2E tests for /members endpoints."""
 
+import json
 from datetime import date, timedelta
 
 
@@ -48,6 +49,30 @@ class TestListMembers:
         assert resp.status_code == 200
         assert len(resp.json()) == 2
 
+    async def test_keyset_pagination(self, client):
+        for i in range(3):
+            await client.post("/members/", json=_member_payload(email=f"p{i}@test.com"))
+        resp = await client.get("/members/?limit=2")
+        assert resp.status_code == 200
+        assert len(resp.json()) == 2
+        cursor = resp.headers["X-Next-Cursor"]
+        resp = await client.get(f"/members/?limit=2&after={cursor}")
+        assert [m["email"] for m in resp.json()] == ["p2@test.com"]
+        assert "X-Next-Cursor" not in resp.headers
+
+    async def test_stream_ndjson(self, client):
+        await client.post("/members/", json=_member_payload())
+        await client.post("/members/", json=_member_payload(email="b@test.com"))
+        resp = await client.get("/members/?stream=true")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert [m["email"] for m in lines] == ["jan@test.com", "b@test.com"]
+
+    async def test_after_without_limit_returns_422(self, client):
+        resp = await client.get("/members/?after=1")
+        assert resp.status_code == 422
+
 
 class TestGetMember:
     async def test_returns_member(self, client):
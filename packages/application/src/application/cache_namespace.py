@@ -0,0 +1,25 @@
+from application.core.ports import ICache
+
+
+class CacheNamespace:
+    """Cache keys under ``prefix`` that are all invalidated by one ``INCR``.
+
+    Every key embeds the namespace's current generation, read from
+    ``<prefix>:generation``. ``invalidate`` bumps it atomically, so readers build
+    fresh keys from then on and the old entries are never read again; they age out
+    with their own TTL. A missing counter reads as generation 0.
+    """
+
+    def __init__(self, cache: ICache, prefix: str) -> None:
+        self._cache = cache
+        self._prefix = prefix
+        self._generation_key = f"{prefix}:generation"
+
+    async def generation(self) -> int:
+        return int(await self._cache.get(self._generation_key) or 0)
+
+    async def key(self, suffix: str) -> str:
+        return f"{self._prefix}:v{await self.generation()}:{suffix}"
+
+    async def invalidate(self) -> int:
+        return await self._cache.incr(self._generation_key)
@@ -0,0 +1,15 @@
+from collections.abc import Sequence
+from typing import override
+
+from application.core.logger import ILogger
+from application.core.ports import IChannelHandler
+
+
+class LoggingChannelHandler(IChannelHandler):
+    def __init__(self, app_logger: ILogger) -> None:
+        self._log = app_logger.get_logger(__name__)
+
+    @override
+    async def handle(self, channel: str, messages: Sequence[str]) -> None:
+        for message in messages:
+            self._log.info("Received pub/sub [%s]: %s", channel, message)
@@ -1,16 +1,29 @@
 
-import json
+import asyncio
+import contextvars
+from collections.abc import AsyncIterator, Sequence
 
+from pydantic import TypeAdapter
+
+from application.cache_namespace import CacheNamespace
+from application.coaches.matching_index import CoachMatchingIndex
 from application.core.events import IEventDispatcher
 from application.core.logger import ILogger
 from application.core.ports import ICache
+from application.stale_while_revalidate import CacheTtl, StaleWhileRevalidateCache
 from domain.coaches.coach import Coach
+from domain.coaches.events import CoachDeleted
 from domain.coaches.repositories import ICoachRepository
 from domain.coaches.value_objects import CoachTier, Specialization
 from domain.members.repositories import IMemberRepository
+from domain.members.value_objects import GoalType, MembershipTier
 from domain.services.coach_matching import CoachMatchingService
 
-_CACHE_TTL = 300
+COACH_LISTINGS_PREFIX = "coaches:available"
+COACH_INDEX_PREFIX = "coaches:index"
+_CACHE_TTL = CacheTtl(soft_seconds=300, hard_seconds=1800)
+_COACH_LIST = TypeAdapter(list[Coach])
+_MATCH_CANDIDATES = 3
 
 
 class CoachService:
@@ -21,10 +34,18 @@ class CoachService:
             cache: ICache,
             dispatcher: IEventDispatcher,
             app_logger: ILogger,
+            matching_index: CoachMatchingIndex,
+            refreshing_cache: StaleWhileRevalidateCache | None = None,
+            listings: CacheNamespace | None = None,
+            index_versions: CacheNamespace | None = None,
     ) -> None:
         self._repo = coach_repo
         self._member_repo = member_repo
-        self._cache = cache
+        self._listings = listings or CacheNamespace(cache, COACH_LISTINGS_PREFIX)
+        self._refreshing_cache = refreshing_cache or StaleWhileRevalidateCache(cache)
+        self._index = matching_index
+        self._index_versions = index_versions
+        self._rebuilding: asyncio.Task[None] | None = None
         self._dispatcher = dispatcher
         self._logger = app_logger.get_logger(__name__)
 
@@ -38,7 +59,7 @@ class CoachService:
             specializations: list[str],
             max_clients: int,
     ) -> Coach:
-        if await self._repo.get_by_email(email) is not None:
+        if await self._repo.exists_by_email(email):
             raise ValueError(f"Email {email!r} already registered")
 
         coach = Coach.create(
@@ -55,50 +76,151 @@ class CoachService:
 
         self._logger.info("Coach registered: %s (id=%s)", saved.email.value, saved.id)
 
-        for spec in saved.specializations:
-            await self._cache.delete(f"coaches:available:{spec.value}")
-
         for event in coach.pull_events():
             self._dispatcher.run_in_background(event)
 
         return saved
 
     async def find_available(self, specialization: str | None = None) -> list[Coach]:
-        """Return coaches, using Redis cache keyed by specialization."""
-        cache_key = f"coaches:available:{specialization or 'ALL'}"
-        cached = await self._cache.get(cache_key)
-        if cached is not None:
-            return self._deserialize_coaches(cached)
+        """Return coaches, using Redis cache keyed by specialization.
+
+        Past the soft TTL the cached list is served while one background
+        refresh reloads it. Coach events invalidate all listings at once by
+        bumping the namespace generation (see ``CoachListingsInvalidationHandler``).
+        Listings carry no certifications or availability slots.
+        """
+        cache_key = await self._listings.key(specialization or "ALL")
+
+        async def load() -> list[Coach]:
+            if specialization:
+                return await self._repo.find_by_specialization(Specialization(specialization), with_children=False)
+            return await self._repo.get_all(with_children=False)
+
+        return await self._refreshing_cache.get_or_load(cache_key, _COACH_LIST, load, _CACHE_TTL)
 
-        if specialization:
-            coaches = await self._repo.find_by_specialization(Specialization(specialization))
-        else:
-            coaches = await self._repo.get_all()
+    async def get_page(self, after: int | None, limit: int) -> tuple[list[Coach], int | None]:
+        """Return up to ``limit`` coaches after the ``after`` cursor and the cursor of the next page."""
+        coaches = await self._repo.get_page(after, limit + 1, with_children=False)
+        if len(coaches) > limit:
+            return coaches[:limit], coaches[limit - 1].id
+        return coaches, None
 
-        await self._cache.set(cache_key, self._serialize_coaches(coaches), _CACHE_TTL)
-        return coaches
+    def stream_all(self) -> AsyncIterator[Coach]:
+        return self._repo.stream_all(with_children=False)
 
     async def get(self, coach_id: int) -> Coach | None:
         return await self._repo.get_by_id(coach_id)
 
     async def find_best_for_member(self, member_id: int) -> Coach | None:
-        """Return the best matching coach for a member based on their goals and tier."""
+        """Return the best matching coach for a member based on their goals and tier.
+
+        When the matching index is built and in sync with the shared coach-change
+        generation it proposes a few candidates, which are loaded by id and compared
+        with their stored state. The index answer is only used if every proposal is
+        still current; a deleted coach or a changed capacity or specialization set
+        means a better coach may not have been proposed at all. Then, and when the
+        index is missing or behind, the database ranks the candidates and only the
+        top few are loaded. An index left behind by another process's changes is
+        rebuilt in the background.
+        """
         member = await self._member_repo.get_by_id(member_id)
-        coaches = await self._repo.get_all()
-        return CoachMatchingService.find_best_coach(member, coaches)
+        goal_specs = CoachMatchingService.goal_specializations(member)
+        member_tier = member.membership.tier
+        if await self._index_in_sync():
+            ids = self._index.best_matches(goal_specs, member_tier, _MATCH_CANDIDATES)
+            loaded = {c.id: c for c in await self._repo.get_by_ids(ids) if c.id is not None}
+            stale = any(i not in loaded or not self._index.is_current(loaded[i]) for i in ids)
+            for coach_id in ids:
+                if coach_id not in loaded:
+                    self._index.remove(coach_id)
+            for coach in loaded.values():
+                self._index.upsert(coach)
+            if not stale and (best := CoachMatchingService.find_best_coach(member, list(loaded.values()))) is not None:
+                return best
+
+        candidates = await self._repo.find_match_candidates(goal_specs, member_tier, _MATCH_CANDIDATES)
+        if self._index.built:
+            for coach in candidates:
+                self._index.upsert(coach)
+        return CoachMatchingService.find_best_coach(member, candidates)
+
+    async def match_many(self, member_ids: Sequence[int]) -> dict[int, Coach | None]:
+        """Assign a coach to every member in one pass, never past a coach's ``max_clients``.
+
+        Members are served greedily in request order, each taking the best coach
+        that still has room in this batch. Nothing is persisted; unknown member ids
+        map to ``None``.
+
+        Only candidates are loaded: for each distinct (goal specializations, tier)
+        the database's top ``n`` coaches with room, ``n`` being the number of
+        members. Before any member picks, fewer than ``n`` coaches have been taken
+        in this batch, so one of its group's top ``n`` is still untouched and ranks
+        above every coach outside them; the result equals ranking all coaches.
+        """
+        members = {m.id: m for m in await self._member_repo.get_by_ids(member_ids) if m.id is not None}
+        specs_by_goals: dict[frozenset[GoalType], frozenset[Specialization]] = {}
+        groups: dict[tuple[frozenset[Specialization], MembershipTier], None] = {}
+        for member in members.values():
+            goals = frozenset(g.type for g in member.goals)
+            if goals not in specs_by_goals:
+                specs_by_goals[goals] = frozenset(CoachMatchingService.goal_specializations(member))
+            groups[specs_by_goals[goals], member.membership.tier] = None
+
+        coaches: dict[int, Coach] = {}
+        for specs, tier in groups:
+            for coach in await self._repo.find_match_candidates(specs, tier, len(members)):
+                if coach.id is not None:
+                    coaches.setdefault(coach.id, coach)
+        index = CoachMatchingIndex()
+        for coach in coaches.values():
+            index.upsert(coach)
+        client_counts = {coach_id: c.current_client_count for coach_id, c in coaches.items()}
+
+        result: dict[int, Coach | None] = {}
+        for member_id in member_ids:
+            member = members.get(member_id)
+            if member is None or member_id in result:
+                result.setdefault(member_id, None)
+                continue
+            goals = frozenset(g.type for g in member.goals)
+            best = index.best_matches(specs_by_goals[goals], member.membership.tier)
+            if not best:
+                result[member_id] = None
+                continue
+            coach_id = best[0]
+            client_counts[coach_id] += 1
+            index.update_client_count(coach_id, client_counts[coach_id])
+            result[member_id] = coaches[coach_id]
+        self._logger.info(
+            "Matched %d of %d members against %d candidate coaches",
+            sum(c is not None for c in result.values()), len(result), len(coaches),
+        )
+        return result
+
+    async def rebuild_matching_index(self) -> None:
+        # Read the generation first: a change made while streaming moves it past
+        # this value, so the index is rebuilt again instead of missing the change.
+        generation = await self._index_versions.generation() if self._index_versions is not None else None
+        await self._index.rebuild(self._repo.stream_all(with_children=False), generation)
+        self._logger.info("Coach matching index rebuilt: %d coaches (generation=%s)", len(self._index), generation)
 
     async def delete(self, coach_id: int) -> None:
-        coach = await self._repo.get_by_id(coach_id)
-        if coach:
-            for spec in coach.specializations:
-                await self._cache.delete(f"coaches:available:{spec.value}")
-            await self._cache.delete("coaches:available:ALL")
+        await self._repo.get_by_id(coach_id)
         await self._repo.delete(coach_id)
-
-    @staticmethod
-    def _serialize_coaches(coaches: list[Coach]) -> str:
-        return json.dumps([c.model_dump(mode="json") for c in coaches])
-
-    @staticmethod
-    def _deserialize_coaches(data: str) -> list[Coach]:
-        return [Coach.model_validate(item) for item in json.loads(data)]
+        self._dispatcher.run_in_background(CoachDeleted(coach_id=coach_id))
+
+    async def _index_in_sync(self) -> bool:
+        if not self._index.built:
+            return False
+        if self._index_versions is None or await self._index_versions.generation() == self._index.generation:
+            return True
+        if self._rebuilding is None:
+            # Like the listing refreshes, the rebuild must not run in the caller's unit of work.
+            self._rebuilding = asyncio.create_task(self.rebuild_matching_index(), context=contextvars.Context())
+            self._rebuilding.add_done_callback(self._on_rebuild_done)
+        return False
+
+    def _on_rebuild_done(self, task: asyncio.Task[None]) -> None:
+        self._rebuilding = None
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            self._logger.warning("Coach matching index rebuild failed: %s", exc, exc_info=exc)
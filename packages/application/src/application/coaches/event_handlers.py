@@ -1,9 +1,12 @@
 
 from typing import override
 
+from application.cache_namespace import CacheNamespace
+from application.coaches.matching_index import CoachMatchingIndex
 from application.core.events import IApplicationEventHandler
 from application.core.logger import ILogger
-from domain.coaches.events import CoachRegistered
+from domain.coaches.events import CoachClientAccepted, CoachClientReleased, CoachDeleted, CoachRegistered
+from domain.coaches.repositories import ICoachRepository
 
 
 class CoachRegisteredHandler(IApplicationEventHandler[CoachRegistered]):
@@ -18,3 +21,62 @@ class CoachRegisteredHandler(IApplicationEventHandler[CoachRegistered]):
             event.full_name,
             event.email,
         )
+
+
+type CoachIndexEvent = CoachRegistered | CoachClientAccepted | CoachClientReleased | CoachDeleted
+
+
+class CoachMatchingIndexHandler(IApplicationEventHandler[CoachIndexEvent]):
+    """Apply a coach change to this process's matching index, then bump the shared index generation.
+
+    Other processes see the generation move past the one their index is in sync
+    with and rank in the database until they have rebuilt.
+    """
+
+    def __init__(
+        self,
+        index: CoachMatchingIndex,
+        coach_repo: ICoachRepository,
+        app_logger: ILogger,
+        versions: CacheNamespace | None = None,
+    ) -> None:
+        self._index = index
+        self._repo = coach_repo
+        self._versions = versions
+        self._log = app_logger.get_logger(__name__)
+
+    @override
+    async def handle(self, event: CoachIndexEvent) -> None:
+        match event:
+            case CoachRegistered():
+                # Raised before the coach had an id, so resolve it by email.
+                coach = await self._repo.get_by_email(event.email)
+                if coach is not None:
+                    self._index.upsert(coach)
+                    self._log.debug("Indexed coach id=%s for matching", coach.id)
+            case CoachClientAccepted() | CoachClientReleased():
+                self._index.update_client_count(event.coach_id, event.current_client_count)
+            case CoachDeleted():
+                self._index.remove(event.coach_id)
+        if self._versions is not None:
+            self._index.advance(await self._versions.invalidate())
+
+
+type CoachListingEvent = CoachRegistered | CoachClientAccepted | CoachClientReleased | CoachDeleted
+
+
+class CoachListingsInvalidationHandler(IApplicationEventHandler[CoachListingEvent]):
+    """Drop every cached ``coaches:available:*`` listing whenever a coach changes.
+
+    Runs post-commit, so a client listing coaches right after a change already
+    reads the new generation.
+    """
+
+    def __init__(self, listings: CacheNamespace, app_logger: ILogger) -> None:
+        self._listings = listings
+        self._log = app_logger.get_logger(__name__)
+
+    @override
+    async def handle(self, event: CoachListingEvent) -> None:
+        generation = await self._listings.invalidate()
+        self._log.debug("Coach listings invalidated by %s (generation=%s)", type(event).__name__, generation)
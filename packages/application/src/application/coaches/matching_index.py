@@ -0,0 +1,160 @@
+import heapq
+from collections.abc import AsyncIterable, Set
+from dataclasses import dataclass
+
+from domain.coaches.coach import Coach
+from domain.coaches.value_objects import CoachTier, Specialization
+from domain.members.value_objects import MembershipTier
+
+type _GroupKey = tuple[CoachTier, frozenset[Specialization]]
+type _HeapItem = tuple[int, int, int]  # (current_client_count, coach_id, version)
+
+_COMPACT_SLACK = 64
+
+
+@dataclass(slots=True)
+class _IndexedCoach:
+    group: _GroupKey
+    max_clients: int
+    current_client_count: int
+    version: int
+
+
+class CoachMatchingIndex:
+    """In-memory index answering "best coach for these goal specializations and tier".
+
+    Coaches are grouped by ``(tier, specializations)``; each group is a min-heap on
+    ``(current_client_count, coach_id)``. A query peeks the top of every eligible
+    group, so its cost depends on the number of distinct groups, not on the number of
+    coaches. Updates push a new heap item and bump the coach's version; outdated and
+    full items are dropped lazily when they reach the top.
+
+    Ranking matches ``CoachMatchingService.find_best_coach``: most overlapping
+    specializations first, then fewest clients, then lowest id.
+
+    ``generation`` is the shared coach-change counter the index is known to be in
+    sync with, or ``None`` once it may have missed a change; see ``advance``.
+    """
+
+    def __init__(self) -> None:
+        self._coaches: dict[int, _IndexedCoach] = {}
+        self._heaps: dict[_GroupKey, list[_HeapItem]] = {}
+        self._group_sizes: dict[_GroupKey, int] = {}
+        self._version = 0
+        self.built = False
+        self.generation: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._coaches)
+
+    def __contains__(self, coach_id: int) -> bool:
+        return coach_id in self._coaches
+
+    def clear(self) -> None:
+        self._coaches.clear()
+        self._heaps.clear()
+        self._group_sizes.clear()
+
+    async def rebuild(self, coaches: AsyncIterable[Coach], generation: int | None = None) -> None:
+        """Reload the index from ``coaches``, read after the shared counter was at ``generation``."""
+        self.generation = None
+        self.clear()
+        async for coach in coaches:
+            self.upsert(coach)
+        self.generation = generation
+        self.built = True
+
+    def advance(self, generation: int) -> None:
+        """Record that a change, already applied here, moved the shared counter to ``generation``.
+
+        Only a step of exactly one keeps the index in sync; any gap means another
+        process changed a coach this index has not seen.
+        """
+        if self.generation is not None and generation == self.generation + 1:
+            self.generation = generation
+        else:
+            self.generation = None
+
+    def upsert(self, coach: Coach) -> None:
+        assert coach.id is not None
+        self.remove(coach.id)
+        group = (coach.tier, frozenset(coach.specializations))
+        self._version += 1
+        self._coaches[coach.id] = _IndexedCoach(
+            group=group,
+            max_clients=coach.max_clients,
+            current_client_count=coach.current_client_count,
+            version=self._version,
+        )
+        self._group_sizes[group] = self._group_sizes.get(group, 0) + 1
+        self._push(coach.id)
+
+    def update_client_count(self, coach_id: int, current_client_count: int) -> None:
+        entry = self._coaches.get(coach_id)
+        if entry is None or entry.current_client_count == current_client_count:
+            return
+        self._version += 1
+        entry.current_client_count = current_client_count
+        entry.version = self._version
+        self._push(coach_id)
+
+    def is_current(self, coach: Coach) -> bool:
+        """Whether the index holds ``coach`` with its tier, specializations and capacity as given."""
+        entry = self._coaches.get(coach.id) if coach.id is not None else None
+        return (
+            entry is not None
+            and entry.group == (coach.tier, frozenset(coach.specializations))
+            and entry.max_clients == coach.max_clients
+            and entry.current_client_count == coach.current_client_count
+        )
+
+    def remove(self, coach_id: int) -> None:
+        entry = self._coaches.pop(coach_id, None)
+        if entry is not None:
+            self._group_sizes[entry.group] -= 1
+
+    def best_matches(
+        self,
+        goal_specs: Set[Specialization],
+        member_tier: MembershipTier | None,
+        limit: int = 1,
+    ) -> list[int]:
+        """Return up to ``limit`` coach ids, best first, one per matching group."""
+        ranked: list[tuple[int, int, int]] = []
+        for group in self._heaps:
+            tier, specs = group
+            overlap = len(specs & goal_specs)
+            if not overlap or not Coach.tier_serves(tier, member_tier):
+                continue
+            top = self._top(group)
+            if top is not None:
+                count, coach_id, _ = top
+                ranked.append((-overlap, count, coach_id))
+        return [coach_id for _, _, coach_id in heapq.nsmallest(limit, ranked)]
+
+    def _push(self, coach_id: int) -> None:
+        entry = self._coaches[coach_id]
+        if entry.current_client_count >= entry.max_clients:
+            return
+        heap = self._heaps.setdefault(entry.group, [])
+        heapq.heappush(heap, (entry.current_client_count, coach_id, entry.version))
+        if len(heap) > 2 * self._group_sizes[entry.group] + _COMPACT_SLACK:
+            self._compact(entry.group)
+
+    def _top(self, group: _GroupKey) -> _HeapItem | None:
+        heap = self._heaps[group]
+        while heap:
+            _, coach_id, version = heap[0]
+            entry = self._coaches.get(coach_id)
+            if entry is not None and entry.version == version:
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def _compact(self, group: _GroupKey) -> None:
+        heap = [
+            item for item in self._heaps[group]
+            if (entry := self._coaches.get(item[1])) is not None and entry.version == item[2]
+        ]
+        heapq.heapify(heap)
+        self._heaps[group] = heap
@@ -1,17 +1,31 @@
 from application.core.events import IEventDispatcher
 from application.core.logger import ILogger
 from application.core.ports import (
+    ExerciseApiUnavailableError,
     ICache,
+    IChannelHandler,
+    IExerciseCatalog,
     IExerciseClient,
+    ILockManager,
     IMessageBroker,
+    IOutbox,
     ITransactionManager,
+    IUnitOfWork,
+    OutboxMessage,
 )
 
 __all__ = [
+    "ExerciseApiUnavailableError",
     "ICache",
+    "IChannelHandler",
     "IEventDispatcher",
+    "IExerciseCatalog",
     "IExerciseClient",
+    "ILockManager",
     "ILogger",
     "IMessageBroker",
+    "IOutbox",
     "ITransactionManager",
+    "IUnitOfWork",
+    "OutboxMessage",
 ]
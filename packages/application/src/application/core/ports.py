@@ -1,25 +1,77 @@
+from collections.abc import Mapping, Sequence
 from contextlib import AbstractAsyncContextManager
-from typing import Protocol
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from pydantic import TypeAdapter
+
+from domain.shared.events import ApplicationEvent
+
+
+class IUnitOfWork(Protocol):
+    async def commit(self) -> None: ...
+    async def rollback(self) -> None: ...
 
 
 class ITransactionManager(Protocol):
     def transaction(self, new: bool = False) -> AbstractAsyncContextManager[None]: ...
+    def unit_of_work(self) -> AbstractAsyncContextManager[IUnitOfWork]: ...
+    def savepoint(self) -> AbstractAsyncContextManager[None]: ...
 
 
 class ICache(Protocol):
     async def get(self, key: str) -> str | None: ...
     async def set(self, key: str, value: str, ttl_seconds: int) -> None: ...
     async def delete(self, key: str) -> None: ...
+    async def incr(self, key: str) -> int: ...
+    async def get_many(self, keys: Sequence[str]) -> list[str | None]: ...
+    async def set_many(self, items: Mapping[str, str], ttl_seconds: int) -> None: ...
+    async def get_model[T](self, key: str, adapter: TypeAdapter[T]) -> T | None: ...
+    async def set_model[T](self, key: str, value: T, adapter: TypeAdapter[T], ttl_seconds: int) -> None: ...
+
+
+class ILockManager(Protocol):
+    async def try_acquire(self, name: str, ttl_seconds: float) -> str | None: ...
+    async def release(self, name: str, token: str) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxMessage:
+    id: int
+    event_type: str
+    payload: dict[str, Any]
+    attempts: int
+
+
+class IOutbox(Protocol):
+    async def add(self, events: Sequence[ApplicationEvent]) -> None: ...
+    async def claim(self, limit: int, max_attempts: int) -> list[OutboxMessage]: ...
+    async def delete(self, ids: Sequence[int]) -> None: ...
+    async def record_failure(self, id: int, error: str) -> None: ...
 
 
 class IMessageBroker(Protocol):
     async def publish(self, channel: str, message: str) -> None: ...
 
 
+class IChannelHandler(Protocol):
+    """Consumes pub/sub messages of one channel, a batch at a time, in arrival order."""
+
+    async def handle(self, channel: str, messages: Sequence[str]) -> None: ...
+
+
+class ExerciseApiUnavailableError(Exception):
+    """The exercise API could not answer (down, timing out or circuit open)."""
+
+
 class IExerciseClient(Protocol):
     async def get_exercise(self, exercise_id: str) -> dict[str, object] | None: ...
     async def search_exercises(self, name: str) -> list[dict[str, object]]: ...
 
 
+class IExerciseCatalog(Protocol):
+    async def sync(self) -> int: ...
+
+
 class IAsyncTaskDispatcher(Protocol):
     async def dispatch(self, task_name: str, /, **kwargs: object) -> None: ...
@@ -1,6 +1,11 @@
 import asyncio
+import contextvars
+import time
 from collections import defaultdict
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any, cast, override
 
 from application.core.events import IEventDispatcher
@@ -9,11 +14,79 @@ from domain.shared.events import ApplicationEvent
 
 Handler = Callable[[ApplicationEvent], Awaitable[None]]
 
+_held_back: ContextVar[list[ApplicationEvent] | None] = ContextVar("_held_back", default=None)
+
+
+@dataclass(slots=True)
+class DispatchStats:
+    """Background dispatch metrics for one event type; latencies are in seconds."""
+
+    enqueued: int = 0
+    processed: int = 0
+    failed: int = 0
+    depth: int = 0
+    max_depth: int = 0
+    waiting_producers: int = 0
+    dropped: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    total_run: float = 0.0
+    max_run: float = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        return self.total_wait / self.processed if self.processed else 0.0
+
+    @property
+    def avg_run(self) -> float:
+        return self.total_run / self.processed if self.processed else 0.0
+
 
 class EventDispatcher(IEventDispatcher):
-    def __init__(self, app_logger: ILogger) -> None:
+    """Runs registered handlers for application events, inline or in the background.
+
+    With ``queue_size`` > 0 background events go through a bounded queue per event
+    type, consumed by ``workers_per_event`` tasks, so a burst never runs more than
+    that many handlers of one type at a time. ``enqueue`` waits while the queue is
+    full; ``run_in_background`` cannot wait, so it drops the event and counts it in
+    ``DispatchStats.dropped``. A unit of work holds its events back and dispatches
+    them with ``enqueue``, so only events raised outside one can be dropped. With
+    ``queue_size`` 0 every handler gets its own task, as before.
+
+    ``drain`` lets queued and running handlers finish and stops the workers.
+
+    Post-commit handlers (``register_post_commit``) are awaited by the unit of work
+    right after its commit, before the request that raised the event returns.
+    """
+
+    def __init__(
+        self,
+        app_logger: ILogger,
+        queue_size: int = 0,
+        workers_per_event: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._logger = app_logger.get_logger(__name__)
         self._handlers: dict[type[ApplicationEvent], list[Handler]] = defaultdict(list)
+        self._post_commit: dict[type[ApplicationEvent], list[Handler]] = defaultdict(list)
+        self._queue_size = queue_size
+        self._workers_per_event = workers_per_event
+        self._clock = clock
+        self._queues: dict[type[ApplicationEvent], asyncio.Queue[tuple[ApplicationEvent, float]]] = {}
+        self._workers: list[asyncio.Task[None]] = []
+        # Strong references; the event loop only keeps weak ones to running tasks.
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._stats: dict[str, DispatchStats] = defaultdict(DispatchStats)
+
+    @property
+    def stats(self) -> Mapping[str, DispatchStats]:
+        """Queue depth and wait/run latency per event type name (queued mode only)."""
+        return self._stats
+
+    @property
+    def event_types(self) -> Mapping[str, type[ApplicationEvent]]:
+        """Event types with at least one handler, by class name."""
+        return {t.__name__: t for t, handlers in self._handlers.items() if handlers}
 
     def register(self, event_type: type[ApplicationEvent], handler: Handler) -> None:
         self._handlers[event_type].append(handler)
@@ -28,6 +101,22 @@ class EventDispatcher(IEventDispatcher):
             )
         self._logger.debug("Registered handler '%s' for %s", handler_name, event_type.__name__)
 
+    def register_post_commit(self, event_type: type[ApplicationEvent], handler: Handler) -> None:
+        """Run ``handler`` as soon as the unit of work that raised ``event_type`` has committed.
+
+        For short updates that must be visible to the caller's next request, such
+        as bumping a cache generation; anything slower belongs in ``register``.
+        """
+        self._post_commit[event_type].append(handler)
+
+    async def run_post_commit(self, event: ApplicationEvent) -> None:
+        # The writes are committed already, so a failing handler must not fail the request.
+        for handler in self._post_commit[type(event)]:
+            try:
+                await handler(event)
+            except Exception as exc:
+                self._logger.error("Post-commit event handler raised an exception: %s", exc, exc_info=exc)
+
     @override
     async def run(self, event: ApplicationEvent) -> None:
         handlers = self._handlers[type(event)]
@@ -35,17 +124,153 @@ class EventDispatcher(IEventDispatcher):
         for handler in handlers:
             await handler(event)
 
+    @contextmanager
+    def hold_background(self) -> Generator[list[ApplicationEvent], None, None]:
+        """Collect events passed to ``run_in_background`` inside the block instead of scheduling them.
+
+        A unit of work uses this so post-commit and background handlers only start
+        once its writes are committed; it then dispatches or drops the collected events.
+        """
+        held: list[ApplicationEvent] = []
+        token = _held_back.set(held)
+        try:
+            yield held
+        finally:
+            _held_back.reset(token)
+
     @override
     def run_in_background(self, event: ApplicationEvent) -> None:
+        held = _held_back.get()
+        if held is not None:
+            held.append(event)
+            return
+        if self._post_commit[type(event)]:
+            # Outside a unit of work there is no commit to wait for.
+            self._track(asyncio.create_task(self.run_post_commit(event)))
+        self._schedule(event)
+
+    async def enqueue(self, event: ApplicationEvent) -> None:
+        """Schedule background handlers for ``event``, waiting while its queue is full.
+
+        Post-commit handlers are left to the caller, normally the unit of work.
+        """
+        if self._queue_size <= 0 or not self._handlers[type(event)]:
+            self._schedule(event)
+            return
+        await self._put_waiting(self._queue_for(type(event)), event)
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """Wait for queued and running background handlers, then stop the workers."""
+        try:
+            async with asyncio.timeout(timeout):
+                while self._tasks:
+                    await asyncio.wait(set(self._tasks))
+                await asyncio.gather(*(queue.join() for queue in self._queues.values()))
+        except TimeoutError:
+            self._logger.warning(
+                "Event dispatcher drain timed out; abandoning %d queued event(s)",
+                sum(queue.qsize() for queue in self._queues.values()),
+            )
+        for task in [*self._workers, *self._tasks]:
+            task.cancel()
+        await asyncio.gather(*self._workers, *self._tasks, return_exceptions=True)
+        self._workers.clear()
+        self._queues.clear()
+        for name, stats in self._stats.items():
+            self._logger.info(
+                "Events %s: processed=%d failed=%d dropped=%d max_depth=%d avg_wait=%.3fs max_wait=%.3fs avg_run=%.3fs",
+                name, stats.processed, stats.failed, stats.dropped, stats.max_depth, stats.avg_wait, stats.max_wait,
+                stats.avg_run,
+            )
+
+    def _schedule(self, event: ApplicationEvent) -> None:
         handlers = self._handlers[type(event)]
-        self._logger.debug(
-            "Scheduling %d background handler(s) for %s", len(handlers), type(event).__name__
-        )
-        for handler in handlers:
-            task = asyncio.create_task(cast("Coroutine[Any, Any, None]", handler(event)))
-            task.add_done_callback(self._on_task_done)
+        if not handlers:
+            return
+        if self._queue_size <= 0:
+            self._logger.debug(
+                "Scheduling %d background handler(s) for %s", len(handlers), type(event).__name__
+            )
+            for handler in handlers:
+                self._track(asyncio.create_task(cast("Coroutine[Any, Any, None]", handler(event))))
+            return
+        queue = self._queue_for(type(event))
+        try:
+            queue.put_nowait((event, self._clock()))
+        except asyncio.QueueFull:
+            # Parking a put per event would just move the unbounded backlog into tasks.
+            self._stats[type(event).__name__].dropped += 1
+            self._logger.warning("Event queue for %s is full; dropping the event", type(event).__name__)
+            return
+        self._on_enqueued(type(event))
+
+    def _queue_for(self, event_type: type[ApplicationEvent]) -> asyncio.Queue[tuple[ApplicationEvent, float]]:
+        queue = self._queues.get(event_type)
+        if queue is None:
+            queue = self._queues[event_type] = asyncio.Queue(maxsize=self._queue_size)
+            for i in range(self._workers_per_event):
+                # Workers outlive the request that happened to start them, so
+                # they must not inherit its context (e.g. its database session).
+                self._workers.append(
+                    asyncio.create_task(
+                        self._consume(event_type, queue),
+                        name=f"events-{event_type.__name__}-{i}",
+                        context=contextvars.Context(),
+                    )
+                )
+        return queue
+
+    async def _put_waiting(
+        self, queue: asyncio.Queue[tuple[ApplicationEvent, float]], event: ApplicationEvent
+    ) -> None:
+        stats = self._stats[type(event).__name__]
+        stats.waiting_producers += 1
+        try:
+            await queue.put((event, self._clock()))
+        finally:
+            stats.waiting_producers -= 1
+        self._on_enqueued(type(event))
+
+    def _on_enqueued(self, event_type: type[ApplicationEvent]) -> None:
+        stats = self._stats[event_type.__name__]
+        stats.enqueued += 1
+        stats.depth = self._queues[event_type].qsize()
+        stats.max_depth = max(stats.max_depth, stats.depth)
+
+    async def _consume(
+        self, event_type: type[ApplicationEvent], queue: asyncio.Queue[tuple[ApplicationEvent, float]]
+    ) -> None:
+        stats = self._stats[event_type.__name__]
+        while True:
+            event, enqueued_at = await queue.get()
+            started = self._clock()
+            stats.depth = queue.qsize()
+            try:
+                for handler in self._handlers[event_type]:
+                    try:
+                        await handler(event)
+                    except Exception as exc:
+                        stats.failed += 1
+                        self._logger.error(
+                            "Background event handler raised an exception: %s", exc, exc_info=exc
+                        )
+            finally:
+                wait, run = started - enqueued_at, self._clock() - started
+                stats.processed += 1
+                stats.total_wait += wait
+                stats.max_wait = max(stats.max_wait, wait)
+                stats.total_run += run
+                stats.max_run = max(stats.max_run, run)
+                queue.task_done()
+
+    def _track(self, task: asyncio.Task[None]) -> None:
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
 
     def _on_task_done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
         exc = task.exception()
         if exc:
             self._logger.error(
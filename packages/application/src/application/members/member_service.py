@@ -1,4 +1,6 @@
 
+from collections.abc import AsyncIterator
+
 from application.core.events import IEventDispatcher
 from application.core.logger import ILogger
 from application.core.ports import IAsyncTaskDispatcher
@@ -40,7 +42,7 @@ class MemberService:
 
         logger = self._logger.get_logger(__name__)
 
-        if await self._repo.get_by_email(email) is not None:
+        if await self._repo.exists_by_email(email):
             raise ValueError(f"Email {email!r} already registered")
 
         valid_until = (
@@ -78,6 +80,16 @@ class MemberService:
     async def get_all(self) -> list[Member]:
         return await self._repo.get_all()
 
+    async def get_page(self, after: int | None, limit: int) -> tuple[list[Member], int | None]:
+        """Return up to ``limit`` members after the ``after`` cursor and the cursor of the next page."""
+        members = await self._repo.get_page(after, limit + 1)
+        if len(members) > limit:
+            return members[:limit], members[limit - 1].id
+        return members, None
+
+    def stream_all(self) -> AsyncIterator[Member]:
+        return self._repo.stream_all()
+
     async def add_goal(
         self,
         member_id: int,
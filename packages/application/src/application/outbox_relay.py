@@ -0,0 +1,71 @@
+import asyncio
+
+from application.core.logger import ILogger
+from application.core.ports import IOutbox, ITransactionManager
+from application.event_dispatcher import EventDispatcher
+
+
+class OutboxRelay:
+    """Delivers events from the outbox to the handlers registered on ``dispatcher``.
+
+    Each batch is claimed, handled and deleted in one transaction, so a crash
+    redelivers it: handlers get every event at least once and must tolerate
+    repeats. Each message is handled in its own savepoint, so a handler's failed
+    writes are undone without aborting the batch. A message whose handler fails
+    is kept, with its attempt count and error, and retried on a later pass until
+    it reaches ``max_attempts``; it then stays in the table for inspection.
+    Messages for event types nobody handles are deleted.
+    """
+
+    def __init__(
+        self,
+        outbox: IOutbox,
+        transaction_manager: ITransactionManager,
+        dispatcher: EventDispatcher,
+        app_logger: ILogger,
+        batch_size: int = 100,
+        poll_interval_seconds: float = 0.5,
+        max_attempts: int = 5,
+    ) -> None:
+        self._outbox = outbox
+        self._tm = transaction_manager
+        self._dispatcher = dispatcher
+        self._log = app_logger.get_logger(__name__)
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval_seconds
+        self._max_attempts = max_attempts
+
+    async def relay_once(self) -> int:
+        """Handle one batch; returns how many messages were claimed."""
+        event_types = self._dispatcher.event_types
+        async with self._tm.transaction(new=True):
+            messages = await self._outbox.claim(self._batch_size, self._max_attempts)
+            done: list[int] = []
+            for message in messages:
+                event_type = event_types.get(message.event_type)
+                try:
+                    async with self._tm.savepoint():
+                        if event_type is not None:
+                            await self._dispatcher.run(event_type.model_validate(message.payload))
+                except Exception as exc:
+                    self._log.warning(
+                        "Outbox message %s (%s) failed on attempt %d: %s",
+                        message.id, message.event_type, message.attempts + 1, exc, exc_info=exc,
+                    )
+                    await self._outbox.record_failure(message.id, repr(exc))
+                else:
+                    done.append(message.id)
+            await self._outbox.delete(done)
+        return len(messages)
+
+    async def run(self) -> None:
+        """Relay until cancelled, polling while the outbox is empty."""
+        self._log.info("Outbox relay started (batch_size=%d)", self._batch_size)
+        while True:
+            try:
+                claimed = await self.relay_once()
+            except Exception as exc:
+                self._log.error("Outbox relay pass failed: %s", exc, exc_info=exc)
+                claimed = 0
+            if claimed < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
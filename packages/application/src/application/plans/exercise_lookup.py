@@ -0,0 +1,80 @@
+import asyncio
+import contextvars
+from collections.abc import Iterable
+
+from pydantic import TypeAdapter
+
+from application.core.ports import ExerciseApiUnavailableError, IExerciseClient
+from application.stale_while_revalidate import CacheTtl, StaleWhileRevalidateCache
+
+type ExerciseData = dict[str, object]
+
+EXERCISE_TTL = CacheTtl(soft_seconds=3600, hard_seconds=24 * 3600)
+NEGATIVE_TTL_SECONDS = 300
+DEFAULT_MAX_CONCURRENCY = 8
+
+_EXERCISE = TypeAdapter(dict[str, object])
+
+
+def exercise_cache_key(name: str) -> str:
+    return f"exercise:{name.lower()}"
+
+
+class ExerciseLookup:
+    """Resolves exercise names to catalog data through the cache, then the exercise API.
+
+    All names of one ``resolve`` call are read from the cache in a single round
+    trip, the misses are searched concurrently (at most ``max_concurrency``
+    upstream calls in flight per process) and the results are written back in
+    one batch. Concurrent searches for the same name share a single upstream call.
+    Entries past their soft TTL are served stale and refreshed in the background.
+
+    Names the API does not know, or could not answer for, resolve to a
+    placeholder that is cached only for ``negative_ttl_seconds`` so a wger
+    outage does not pin placeholders for long.
+    """
+
+    def __init__(
+        self,
+        cache: StaleWhileRevalidateCache,
+        exercise_client: IExerciseClient,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        negative_ttl_seconds: int = NEGATIVE_TTL_SECONDS,
+    ) -> None:
+        self._cache = cache
+        self._exercise_client = exercise_client
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._negative_ttl = CacheTtl(soft_seconds=negative_ttl_seconds, hard_seconds=negative_ttl_seconds)
+        self._in_flight: dict[str, asyncio.Task[tuple[ExerciseData, bool]]] = {}
+
+    async def resolve(self, names: Iterable[str]) -> dict[str, ExerciseData]:
+        """Map each distinct cache key of ``names`` to its exercise data."""
+        by_key = {exercise_cache_key(name): name for name in names}
+
+        async def load(key: str) -> tuple[ExerciseData, CacheTtl]:
+            data, found = await self._search(key, by_key[key])
+            return data, EXERCISE_TTL if found else self._negative_ttl
+
+        return await self._cache.get_many_or_load(list(by_key), _EXERCISE, load)
+
+    async def _search(self, key: str, name: str) -> tuple[ExerciseData, bool]:
+        task = self._in_flight.get(key)
+        if task is None:
+            # A fresh context keeps the shared search off the first caller's unit
+            # of work; concurrent searches must not share one database session.
+            task = asyncio.create_task(self._search_upstream(name), context=contextvars.Context())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded so one cancelled caller does not cancel the search for the others.
+        return await asyncio.shield(task)
+
+    async def _search_upstream(self, name: str) -> tuple[ExerciseData, bool]:
+        """The best match and whether it came from the catalog (``False`` for the placeholder)."""
+        try:
+            async with self._semaphore:
+                results = await self._exercise_client.search_exercises(name)
+        except ExerciseApiUnavailableError:
+            results = []
+        if results:
+            return results[0], True
+        return {"exercise_id": "0", "name": name}, False
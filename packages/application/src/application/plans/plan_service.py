@@ -1,10 +1,11 @@
 
-import json
 from datetime import date
 
 from application.core.events import IEventDispatcher
 from application.core.logger import ILogger
 from application.core.ports import ICache, IExerciseClient
+from application.plans.exercise_lookup import ExerciseLookup, exercise_cache_key
+from application.stale_while_revalidate import StaleWhileRevalidateCache
 from domain.members.repositories import IMemberRepository
 from domain.plans.entities import WorkoutSession
 from domain.plans.repositories import ITrainingPlanRepository
@@ -12,8 +13,6 @@ from domain.plans.training_plan import TrainingPlan
 from domain.plans.value_objects import PlannedExercise
 from domain.services.plan_progress import PlanProgressService
 
-_EXERCISE_TTL = 3600  # 1 hour
-
 
 class TrainingPlanService:
     def __init__(
@@ -24,11 +23,11 @@ class TrainingPlanService:
         exercise_client: IExerciseClient,
         dispatcher: IEventDispatcher,
         app_logger: ILogger,
+        exercise_lookup: ExerciseLookup | None = None,
     ) -> None:
         self._plan_repo = plan_repo
         self._member_repo = member_repo
-        self._cache = cache
-        self._exercise_client = exercise_client
+        self._exercise_lookup = exercise_lookup or ExerciseLookup(StaleWhileRevalidateCache(cache), exercise_client)
         self._dispatcher = dispatcher
         self._logger = app_logger
 
@@ -87,20 +86,16 @@ class TrainingPlanService:
         exercises: list[dict[str, object]],
     ) -> TrainingPlan:
         """Add a workout session with exercises (looked up / cached from wger)."""
+        # Look the exercises up first: the request's session only takes a pooled
+        # connection at its first query, so none is held while wger answers.
+        names = [str(ex.get("name", "Unknown")) for ex in exercises]
+        catalog = await self._exercise_lookup.resolve(names)
+
         plan = await self._plan_repo.get_by_id(plan_id)
 
         planned_exercises: list[PlannedExercise] = []
-        for ex in exercises:
-            ex_name = str(ex.get("name", "Unknown"))
-            cache_key = f"exercise:{ex_name.lower()}"
-            cached = await self._cache.get(cache_key)
-            if cached is not None:
-                ex_data: dict[str, object] = json.loads(cached)
-            else:
-                results = await self._exercise_client.search_exercises(ex_name)
-                ex_data = results[0] if results else {"exercise_id": "0", "name": ex_name}
-                await self._cache.set(cache_key, json.dumps(ex_data), _EXERCISE_TTL)
-
+        for ex, ex_name in zip(exercises, names, strict=True):
+            ex_data = catalog[exercise_cache_key(ex_name)]
             planned_exercises.append(
                 PlannedExercise(
                     exercise_id=str(ex_data.get("exercise_id", ex.get("exercise_id", "0"))),
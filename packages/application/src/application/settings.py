@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,13 +30,65 @@ class RedisSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="REDIS_")
 
     url: str = "redis://localhost:6379/0"
+    pubsub_max_batch: int = 100
+    pubsub_reconnect_delay_seconds: float = 0.5
+    pubsub_reconnect_delay_max_seconds: float = 30.0
+
+
+class BrokerSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="BROKER_")
+
+    backend: Literal["pubsub", "streams"] = "pubsub"
+    batch_size: int = 100  # 1 publishes every message on its own
+    batch_delay_seconds: float = 0.005
+    stream_group: str = "app"
+    stream_maxlen: int = 100_000
+    stream_block_ms: int = 5000
+    stream_read_count: int = 100  # entries per XREADGROUP and per reclaim pass
+    stream_reclaim_idle_seconds: float = 60.0
+    stream_max_deliveries: int = 5
+
+
+class CacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="CACHE_")
+
+    local_max_bytes: int = 16 * 1024 * 1024
+    local_ttl_seconds: float = 30.0
+    local_keep_decoded: bool = False  # hits are copied, which costs about as much as decoding
+    invalidation_channel: str = "cache.invalidate"
+    refresh_beta: float = 1.0
+    refresh_lock_ttl_seconds: float = 30.0
+
+
+class EventSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="EVENTS_")
+
+    queue_size: int = 1000  # 0 runs every background handler in its own task
+    workers_per_event: int = 4
+    drain_timeout_seconds: float = 10.0
+    outbox_batch_size: int = 100
+    outbox_poll_interval_seconds: float = 0.5
+    outbox_max_attempts: int = 5
 
 
 class ExerciseApiSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="EXERCISE_API_")
 
     base_url: str = "https://wger.de/api/v2"
-    timeout: float = 10.0
+    timeout: float = 3.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    retry_attempts: int = 2
+    retry_backoff_seconds: float = 0.2
+    retry_backoff_max_seconds: float = 2.0
+    hedge_after_seconds: float = 1.0  # 0 disables hedging
+    breaker_failure_threshold: int = 5
+    breaker_reset_seconds: float = 30.0
+    negative_cache_ttl_seconds: int = 300
+    catalog_sync_cron: str = "0 3 * * *"
+    catalog_page_size: int = 200
 
 
 class Settings(BaseSettings):
@@ -48,4 +101,7 @@ class Settings(BaseSettings):
 
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     redis: RedisSettings = Field(default_factory=RedisSettings)
+    broker: BrokerSettings = Field(default_factory=BrokerSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
+    events: EventSettings = Field(default_factory=EventSettings)
     exercise_api: ExerciseApiSettings = Field(default_factory=ExerciseApiSettings)
@@ -0,0 +1,165 @@
+import asyncio
+import contextvars
+import json
+import math
+import random
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Sequence
+from typing import NamedTuple
+
+from pydantic import TypeAdapter
+
+from application.core.logger import ILogger
+from application.core.ports import ICache, ILockManager
+
+DEFAULT_BETA = 1.0
+DEFAULT_LOCK_TTL_SECONDS = 30.0
+
+
+class CacheTtl(NamedTuple):
+    soft_seconds: float
+    hard_seconds: int
+
+
+def _meta_key(key: str) -> str:
+    return f"{key}:swr"
+
+
+class StaleWhileRevalidateCache:
+    """Soft/hard TTL caching on top of an ``ICache``.
+
+    A value is stored for its hard TTL next to a small ``<key>:swr`` entry with
+    its soft expiry and how long it took to load. Past the soft expiry the
+    stale value is still returned at once while one background refresh, guarded
+    by ``locks`` across processes, reloads it. Refreshes also start early with a
+    probability that grows towards the soft expiry (XFetch, scaled by ``beta``
+    and the load time), so keys written together do not all refresh together.
+    Only a hard miss makes the caller wait for the loader.
+
+    Refreshes run in an empty context, outside the caller's unit of work.
+    """
+
+    def __init__(
+        self,
+        cache: ICache,
+        locks: ILockManager | None = None,
+        app_logger: ILogger | None = None,
+        beta: float = DEFAULT_BETA,
+        lock_ttl_seconds: float = DEFAULT_LOCK_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        self._cache = cache
+        self._locks = locks
+        self._log = app_logger.get_logger(__name__) if app_logger is not None else None
+        self._beta = beta
+        self._lock_ttl = lock_ttl_seconds
+        self._clock = clock
+        self._rand = rand
+        self._refreshing: dict[str, asyncio.Task[None]] = {}
+
+    async def get_or_load[T](
+        self,
+        key: str,
+        adapter: TypeAdapter[T],
+        loader: Callable[[], Awaitable[T]],
+        ttl: CacheTtl,
+    ) -> T:
+        value = await self._cache.get_model(key, adapter)
+        if value is None:
+            return await self._load(key, adapter, loader, ttl)
+        if self._is_due(await self._cache.get(_meta_key(key))):
+            self._refresh_in_background(key, lambda: self._load(key, adapter, loader, ttl))
+        return value
+
+    async def get_many_or_load[T](
+        self,
+        keys: Sequence[str],
+        adapter: TypeAdapter[T],
+        loader: Callable[[str], Awaitable[tuple[T, CacheTtl]]],
+    ) -> dict[str, T]:
+        """Like ``get_or_load`` for many keys: one batched read, misses loaded concurrently.
+
+        ``loader`` picks the TTL per key, e.g. a shorter one for negative results.
+        """
+        if not keys:
+            return {}
+        raw = await self._cache.get_many([*keys, *map(_meta_key, keys)])
+        values, metas = raw[: len(keys)], raw[len(keys) :]
+        found: dict[str, T] = {}
+        misses: list[str] = []
+        for key, value, meta in zip(keys, values, metas, strict=True):
+            if value is None:
+                misses.append(key)
+                continue
+            found[key] = adapter.validate_json(value)
+            if self._is_due(meta):
+                self._refresh_in_background(key, lambda k=key: self._load_many([k], adapter, loader))
+        if misses:
+            found.update(await self._load_many(misses, adapter, loader))
+        return found
+
+    def _is_due(self, meta: str | None) -> bool:
+        # Values cached without metadata (e.g. before this wrapper) count as stale.
+        if meta is None:
+            return True
+        soft_expires_at, load_seconds = json.loads(meta)
+        # XFetch: -log(u) for u in (0, 1] is an exponential draw, so a refresh
+        # starts early with a probability that rises towards the soft expiry.
+        early = -load_seconds * self._beta * math.log(1.0 - self._rand())
+        return self._clock() + early >= soft_expires_at
+
+    async def _load[T](self, key: str, adapter: TypeAdapter[T], loader: Callable[[], Awaitable[T]], ttl: CacheTtl) -> T:
+        started = self._clock()
+        value = await loader()
+        now = self._clock()
+        await self._cache.set_model(key, value, adapter, ttl.hard_seconds)
+        await self._cache.set(_meta_key(key), json.dumps([now + ttl.soft_seconds, now - started]), ttl.hard_seconds)
+        return value
+
+    async def _load_many[T](
+        self,
+        keys: Sequence[str],
+        adapter: TypeAdapter[T],
+        loader: Callable[[str], Awaitable[tuple[T, CacheTtl]]],
+    ) -> dict[str, T]:
+        async def timed(key: str) -> tuple[T, CacheTtl, float, float]:
+            started = self._clock()
+            value, ttl = await loader(key)
+            return value, ttl, started, self._clock()
+
+        loaded = await asyncio.gather(*(timed(k) for k in keys))
+        writes: dict[int, dict[str, str]] = defaultdict(dict)
+        for key, (value, ttl, started, now) in zip(keys, loaded, strict=True):
+            batch = writes[ttl.hard_seconds]
+            batch[key] = adapter.dump_json(value).decode()
+            batch[_meta_key(key)] = json.dumps([now + ttl.soft_seconds, now - started])
+        for hard_seconds, items in writes.items():
+            await self._cache.set_many(items, hard_seconds)
+        return {key: value for key, (value, *_) in zip(keys, loaded, strict=True)}
+
+    def _refresh_in_background(self, key: str, refresh: Callable[[], Awaitable[object]]) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(key, refresh), context=contextvars.Context())
+        self._refreshing[key] = task
+        task.add_done_callback(lambda t: self._on_refresh_done(key, t))
+
+    async def _refresh(self, key: str, refresh: Callable[[], Awaitable[object]]) -> None:
+        if self._locks is None:
+            await refresh()
+            return
+        lock = f"lock:{key}"
+        token = await self._locks.try_acquire(lock, self._lock_ttl)
+        if token is None:
+            return  # another process is already refreshing this key
+        try:
+            await refresh()
+        finally:
+            await self._locks.release(lock, token)
+
+    def _on_refresh_done(self, key: str, task: asyncio.Task[None]) -> None:
+        self._refreshing.pop(key, None)
+        if not task.cancelled() and (exc := task.exception()) is not None and self._log is not None:
+            self._log.warning("Background refresh of %r failed: %s", key, exc, exc_info=exc)
@@ -0,0 +1,77 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import override
+
+from application.core.ports import IOutbox, ITransactionManager, IUnitOfWork
+from application.event_dispatcher import EventDispatcher
+from domain.shared.events import ApplicationEvent
+
+
+class _DispatchingUnitOfWork(IUnitOfWork):
+    def __init__(
+        self,
+        inner: IUnitOfWork,
+        held: list[ApplicationEvent],
+        dispatcher: EventDispatcher,
+        outbox: IOutbox | None,
+    ) -> None:
+        self._inner = inner
+        self._held = held
+        self._dispatcher = dispatcher
+        self._outbox = outbox
+        self._stored = 0
+        self._post_committed = 0
+        self.rolled_back = False
+
+    async def store_events(self) -> None:
+        """Write the events raised since the last call to the outbox, inside the transaction."""
+        if self._outbox is not None and len(self._held) > self._stored:
+            await self._outbox.add(self._held[self._stored :])
+            self._stored = len(self._held)
+
+    async def run_post_commit(self) -> None:
+        """Run post-commit handlers for the events committed since the last call."""
+        events, self._post_committed = self._held[self._post_committed :], len(self._held)
+        for event in events:
+            await self._dispatcher.run_post_commit(event)
+
+    @override
+    async def commit(self) -> None:
+        await self.store_events()
+        await self._inner.commit()
+        await self.run_post_commit()
+
+    @override
+    async def rollback(self) -> None:
+        await self._inner.rollback()
+        self.rolled_back = True
+
+
+@asynccontextmanager
+async def unit_of_work(
+    transaction_manager: ITransactionManager,
+    dispatcher: EventDispatcher,
+    outbox: IOutbox | None = None,
+) -> AsyncGenerator[IUnitOfWork, None]:
+    """Run the block as one unit of work: one session, one identity map, one commit.
+
+    Background events raised inside the block are held back and dispatched only
+    after the writes are committed, so their handlers read committed state.
+    Their post-commit handlers run right after each commit, before the block
+    goes on. They are dropped when the block raises or rolls back. Dispatching waits while
+    the dispatcher's queues are full, which slows down the producer instead of
+    piling up handlers.
+
+    With an ``outbox`` the held events are also written to it in the same
+    transaction, for the outbox relay to deliver to durable handlers.
+    """
+    with dispatcher.hold_background() as held:
+        async with transaction_manager.unit_of_work() as inner:
+            uow = _DispatchingUnitOfWork(inner, held, dispatcher, outbox)
+            yield uow
+            if not uow.rolled_back:
+                await uow.store_events()
+    if not uow.rolled_back:
+        await uow.run_post_commit()
+        for event in held:
+            await dispatcher.enqueue(event)
@@ -1,5 +1,6 @@
 
 import logging
+from collections.abc import AsyncIterator, Collection
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -10,6 +11,7 @@ from domain.coaches.repositories import ICoachRepository
 from domain.coaches.value_objects import Specialization
 from domain.members.member import Member
 from domain.members.repositories import IMemberRepository
+from domain.members.value_objects import MembershipTier
 from domain.plans.repositories import ITrainingPlanRepository
 from domain.plans.training_plan import TrainingPlan
 
@@ -36,16 +38,37 @@ class InMemoryMemberRepository(IMemberRepository):
             raise ValueError()
         return r
 
+    async def get_by_ids(self, ids: Collection[int]) -> list[Member]:
+        return [self._store[i] for i in ids if i in self._store]
+
     async def get_by_email(self, email: str) -> Member | None:
         return next((m for m in self._store.values() if m.email.value == email), None)
 
+    async def exists_by_email(self, email: str) -> bool:
+        return await self.get_by_email(email) is not None
+
     async def get_all(self) -> list[Member]:
         return list(self._store.values())
 
+    async def get_page(self, after: int | None, limit: int) -> list[Member]:
+        ids = sorted(i for i in self._store if after is None or i > after)
+        return [self._store[i] for i in ids[:limit]]
+
+    async def stream_all(self) -> AsyncIterator[Member]:
+        for i in sorted(self._store):
+            yield self._store[i]
+
     async def delete(self, id: int) -> None:
         self._store.pop(id, None)
 
 
+def _listed(coach: Coach, with_children: bool) -> Coach:
+    """A shallow listing leaves certifications and availability slots out, like the real repository."""
+    if with_children:
+        return coach
+    return coach.model_copy(update={"certifications": [], "available_slots": []})
+
+
 class InMemoryCoachRepository(ICoachRepository):
     def __init__(self) -> None:
         self._store: dict[int, Coach] = {}
@@ -64,14 +87,42 @@ class InMemoryCoachRepository(ICoachRepository):
             raise ValueError()
         return r
 
+    async def get_by_ids(self, ids: Collection[int]) -> list[Coach]:
+        return [self._store[i] for i in ids if i in self._store]
+
     async def get_by_email(self, email: str) -> Coach | None:
         return next((c for c in self._store.values() if c.email.value == email), None)
 
-    async def find_by_specialization(self, spec: Specialization) -> list[Coach]:
-        return [c for c in self._store.values() if spec in c.specializations]
-
-    async def get_all(self) -> list[Coach]:
-        return list(self._store.values())
+    async def exists_by_email(self, email: str) -> bool:
+        return await self.get_by_email(email) is not None
+
+    async def find_by_specialization(self, spec: Specialization, with_children: bool = True) -> list[Coach]:
+        return [_listed(c, with_children) for c in self._store.values() if spec in c.specializations]
+
+    async def find_match_candidates(
+        self,
+        goal_specs: Collection[Specialization],
+        member_tier: MembershipTier | None,
+        limit: int,
+    ) -> list[Coach]:
+        specs = set(goal_specs)
+        matches = [
+            c for c in self._store.values()
+            if c.can_accept_client(member_tier) and c.specializations & specs
+        ]
+        matches.sort(key=lambda c: (-len(c.specializations & specs), c.current_client_count, c.id or 0))
+        return matches[:limit]
+
+    async def get_all(self, with_children: bool = True) -> list[Coach]:
+        return [_listed(c, with_children) for c in self._store.values()]
+
+    async def get_page(self, after: int | None, limit: int, with_children: bool = True) -> list[Coach]:
+        ids = sorted(i for i in self._store if after is None or i > after)
+        return [_listed(self._store[i], with_children) for i in ids[:limit]]
+
+    async def stream_all(self, with_children: bool = True) -> AsyncIterator[Coach]:
+        for i in sorted(self._store):
+            yield _listed(self._store[i], with_children)
 
     async def delete(self, id: int) -> None:
         self._store.pop(id, None)
@@ -140,6 +191,10 @@ def fake_cache():
     mock.get.return_value = None
     mock.set.return_value = None
     mock.delete.return_value = None
+    mock.get_many.side_effect = lambda keys: [None] * len(keys)
+    mock.set_many.return_value = None
+    mock.get_model.return_value = None
+    mock.set_model.return_value = None
     return mock
 
 
@@ -0,0 +1,201 @@
+"""Unit tests for CoachMatchingIndex and the handler that maintains it."""
+
+import random
+from collections.abc import AsyncIterator
+from datetime import date, timedelta
+
+import pytest
+
+from application.cache_namespace import CacheNamespace
+from application.coaches.event_handlers import CoachMatchingIndexHandler
+from application.coaches.matching_index import CoachMatchingIndex
+from domain.coaches.coach import Coach
+from domain.coaches.events import CoachClientAccepted, CoachClientReleased, CoachDeleted, CoachRegistered
+from domain.coaches.value_objects import CoachTier, Specialization
+from domain.members.entities import FitnessGoal
+from domain.members.member import Member
+from domain.members.value_objects import GoalType, Membership, MembershipTier
+from domain.services.coach_matching import CoachMatchingService
+
+
+def _coach(
+    id: int,
+    specs: set[Specialization],
+    tier: CoachTier = CoachTier.STANDARD,
+    clients: int = 0,
+    max_clients: int = 5,
+) -> Coach:
+    coach = Coach.create(
+        first_name="Coach",
+        last_name=f"No{id}",
+        email=f"coach{id}@gym.com",
+        bio="",
+        tier=tier,
+        specializations=frozenset(specs),
+        max_clients=max_clients,
+    )
+    coach.id = id
+    coach.current_client_count = clients
+    return coach
+
+
+def _member(tier: MembershipTier, goals: list[GoalType]) -> Member:
+    member = Member.create(
+        first_name="Jan",
+        last_name="Kowalski",
+        email="jan@test.com",
+        phone="+48123456789",
+        fitness_level="BEGINNER",
+        membership=Membership(tier=tier, valid_until=date.today() + timedelta(days=30)),
+    )
+    for goal in goals:
+        member.goals.append(FitnessGoal(type=goal, description="", target_date=date.today() + timedelta(days=30)))
+    return member
+
+
+async def _stream(coaches: list[Coach]) -> AsyncIterator[Coach]:
+    for coach in coaches:
+        yield coach
+
+
+class _CounterCache:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def incr(self, key: str) -> int:
+        value = int(self.values.get(key, "0")) + 1
+        self.values[key] = str(value)
+        return value
+
+
+class TestCoachMatchingIndex:
+    async def test_prefers_overlap_then_fewest_clients(self):
+        index = CoachMatchingIndex()
+        await index.rebuild(
+            _stream(
+                [
+                    _coach(1, {Specialization.CARDIO}, clients=0),
+                    _coach(2, {Specialization.CARDIO, Specialization.NUTRITION}, clients=3),
+                    _coach(3, {Specialization.CARDIO, Specialization.NUTRITION}, clients=1),
+                ]
+            )
+        )
+        goal_specs = {Specialization.CARDIO, Specialization.NUTRITION}
+        assert index.best_matches(goal_specs, MembershipTier.FREE, limit=2) == [3, 1]
+
+    def test_vip_coaches_only_serve_vip_members(self):
+        index = CoachMatchingIndex()
+        index.upsert(_coach(1, {Specialization.YOGA}, tier=CoachTier.VIP))
+        assert index.best_matches({Specialization.YOGA}, MembershipTier.PREMIUM) == []
+        assert index.best_matches({Specialization.YOGA}, MembershipTier.VIP) == [1]
+
+    def test_full_coach_is_skipped_until_released(self):
+        index = CoachMatchingIndex()
+        index.upsert(_coach(1, {Specialization.YOGA}, clients=0, max_clients=1))
+        index.upsert(_coach(2, {Specialization.YOGA}, clients=0, max_clients=1))
+        index.update_client_count(1, 1)
+        assert index.best_matches({Specialization.YOGA}, MembershipTier.FREE) == [2]
+        index.update_client_count(1, 0)
+        assert index.best_matches({Specialization.YOGA}, MembershipTier.FREE) == [1]
+
+    def test_removed_coach_is_not_returned(self):
+        index = CoachMatchingIndex()
+        index.upsert(_coach(1, {Specialization.YOGA}))
+        index.remove(1)
+        assert index.best_matches({Specialization.YOGA}, MembershipTier.FREE) == []
+
+    async def test_rebuild_records_generation_and_advance_follows_single_steps(self):
+        index = CoachMatchingIndex()
+        await index.rebuild(_stream([]), generation=4)
+        assert index.generation == 4
+
+        index.advance(5)
+        assert index.generation == 5
+
+        index.advance(7)
+        assert index.generation is None
+        index.advance(8)
+        assert index.generation is None
+
+    def test_is_current_compares_tier_specializations_and_capacity(self):
+        index = CoachMatchingIndex()
+        index.upsert(_coach(1, {Specialization.YOGA}, clients=1))
+        assert index.is_current(_coach(1, {Specialization.YOGA}, clients=1))
+        assert not index.is_current(_coach(1, {Specialization.YOGA}, clients=2))
+        assert not index.is_current(_coach(1, {Specialization.YOGA}, clients=1, max_clients=3))
+        assert not index.is_current(_coach(1, {Specialization.CARDIO}, clients=1))
+        assert not index.is_current(_coach(1, {Specialization.YOGA}, tier=CoachTier.VIP, clients=1))
+        assert not index.is_current(_coach(2, {Specialization.YOGA}, clients=1))
+
+    @pytest.mark.parametrize("seed", range(5))
+    async def test_agrees_with_linear_matching(self, seed):
+        rng = random.Random(seed)
+        coaches = [
+            _coach(
+                i,
+                set(rng.sample(list(Specialization), rng.randint(1, 3))),
+                tier=rng.choice(list(CoachTier)),
+                clients=rng.randint(0, 5),
+            )
+            for i in range(1, 200)
+        ]
+        index = CoachMatchingIndex()
+        await index.rebuild(_stream(coaches))
+        for _ in range(300):
+            coach = rng.choice(coaches)
+            coach.current_client_count = rng.randint(0, coach.max_clients)
+            index.update_client_count(coach.id, coach.current_client_count)
+
+        for tier in MembershipTier:
+            for goal in GoalType:
+                member = _member(tier, [goal])
+                expected = CoachMatchingService.find_best_coach(member, coaches)
+                found = index.best_matches(CoachMatchingService.goal_specializations(member), tier)
+                assert found == ([expected.id] if expected else [])
+
+
+class TestCoachMatchingIndexHandler:
+    async def test_indexes_registered_coach_and_tracks_capacity(self, coach_repo, fake_logger):
+        index = CoachMatchingIndex()
+        handler = CoachMatchingIndexHandler(index=index, coach_repo=coach_repo, app_logger=fake_logger)
+        coach = _coach(0, {Specialization.YOGA}, max_clients=1)
+        coach.id = None
+        saved = await coach_repo.save(coach)
+
+        await handler.handle(CoachRegistered(coach_id=None, email=saved.email.value, full_name=saved.name.full))
+        assert index.best_matches({Specialization.YOGA}, MembershipTier.FREE) == [saved.id]
+
+        await handler.handle(CoachClientAccepted(coach_id=saved.id, current_client_count=1))
+        assert index.best_matches({Specialization.YOGA}, MembershipTier.FREE) == []
+
+        await handler.handle(CoachClientReleased(coach_id=saved.id, current_client_count=0))
+        assert index.best_matches({Specialization.YOGA}, MembershipTier.FREE) == [saved.id]
+
+        await handler.handle(CoachDeleted(coach_id=saved.id))
+        assert saved.id not in index
+
+    async def test_every_change_bumps_the_shared_generation(self, coach_repo, fake_logger):
+        index = CoachMatchingIndex()
+        versions = CacheNamespace(_CounterCache(), "coaches:index")
+        handler = CoachMatchingIndexHandler(index=index, coach_repo=coach_repo, app_logger=fake_logger, versions=versions)
+        await index.rebuild(_stream([_coach(1, {Specialization.YOGA})]), generation=0)
+
+        await handler.handle(CoachClientAccepted(coach_id=1, current_client_count=1))
+        await handler.handle(CoachDeleted(coach_id=1))
+
+        assert await versions.generation() == 2
+        assert index.generation == 2
+
+    async def test_change_from_another_process_leaves_index_out_of_sync(self, coach_repo, fake_logger):
+        index = CoachMatchingIndex()
+        versions = CacheNamespace(_CounterCache(), "coaches:index")
+        handler = CoachMatchingIndexHandler(index=index, coach_repo=coach_repo, app_logger=fake_logger, versions=versions)
+        await index.rebuild(_stream([_coach(1, {Specialization.YOGA})]), generation=0)
+
+        await versions.invalidate()  # e.g. a coach registered by the worker
+        await handler.handle(CoachClientAccepted(coach_id=1, current_client_count=1))
+
+        assert index.generation is None
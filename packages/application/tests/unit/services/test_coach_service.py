@@ -5,16 +5,23 @@ from datetime import date, timedelta
 import pytest
 
 from application.coaches.coach_service import CoachService
+from application.coaches.matching_index import CoachMatchingIndex
 
 
 @pytest.fixture()
-def coach_service(coach_repo, member_repo, fake_cache, fake_dispatcher, fake_logger):
+def matching_index():
+    return CoachMatchingIndex()
+
+
+@pytest.fixture()
+def coach_service(coach_repo, member_repo, fake_cache, fake_dispatcher, fake_logger, matching_index):
     return CoachService(
         coach_repo=coach_repo,
         member_repo=member_repo,
         cache=fake_cache,
         dispatcher=fake_dispatcher,
         app_logger=fake_logger,
+        matching_index=matching_index,
     )
 
 
@@ -62,6 +69,11 @@ class TestRegister:
         await _register(coach_service)
         fake_dispatcher.run_in_background.assert_called_once()
 
+    async def test_leaves_listing_invalidation_to_event_handlers(self, coach_service, fake_cache):
+        await _register(coach_service)
+        fake_cache.delete.assert_not_awaited()
+        fake_cache.incr.assert_not_awaited()
+
 
 class TestFindAvailable:
     async def test_cache_miss_fetches_from_repo(self, coach_service, fake_cache):
@@ -69,29 +81,64 @@ class TestFindAvailable:
         coaches = await coach_service.find_available()
         assert len(coaches) >= 1
 
+    async def test_cache_miss_stores_coaches(self, coach_service, fake_cache):
+        await _register(coach_service)
+        coaches = await coach_service.find_available()
+        key, stored = fake_cache.set_model.await_args.args[:2]
+        assert key == "coaches:available:v0:ALL"
+        assert stored == coaches
+
     async def test_cache_hit_returns_cached(self, coach_service, fake_cache):
         """If cache returns data, repo is not queried."""
-        import json
-
-        cached_data = json.dumps(
-            [
-                {
-                    "id": 99,
-                    "name": {"first_name": "Cached", "last_name": "Coach"},
-                    "email": {"value": "cached@gym.com"},
-                    "bio": "",
-                    "tier": "STANDARD",
-                    "specializations": ["STRENGTH"],
-                    "max_clients": 5,
-                    "current_client_count": 0,
-                    "certifications": [],
-                    "available_slots": [],
-                }
-            ]
+        from domain.coaches.coach import Coach
+
+        cached = Coach.model_validate(
+            {
+                "id": 99,
+                "name": {"first_name": "Cached", "last_name": "Coach"},
+                "email": {"value": "cached@gym.com"},
+                "bio": "",
+                "tier": "STANDARD",
+                "specializations": ["STRENGTH"],
+                "max_clients": 5,
+            }
         )
-        fake_cache.get.return_value = cached_data
+        fake_cache.get_model.return_value = [cached]
         coaches = await coach_service.find_available("STRENGTH")
         assert coaches[0].id == 99
+        assert fake_cache.get_model.await_args.args[0] == "coaches:available:v0:STRENGTH"
+
+    async def test_lists_coaches_without_their_children(self, coach_service, coach_repo):
+        from domain.coaches.entities import Certification
+
+        coach = await _register(coach_service)
+        coach.add_certification(Certification(name="CPT", issuing_body="NASM", issued_at=date(2020, 1, 1)))
+        await coach_repo.save(coach)
+
+        [listed] = await coach_service.find_available("STRENGTH")
+        page, _ = await coach_service.get_page(None, 10)
+
+        assert listed.certifications == []
+        assert page[0].certifications == []
+        assert len((await coach_service.get(coach.id)).certifications) == 1
+
+    async def test_keys_follow_listing_generation(self, coach_service, fake_cache):
+        fake_cache.get.side_effect = lambda key: "7" if key == "coaches:available:generation" else None
+        await coach_service.find_available("STRENGTH")
+        assert fake_cache.get_model.await_args.args[0] == "coaches:available:v7:STRENGTH"
+
+
+class TestDelete:
+    async def test_removes_coach_and_dispatches_deleted_event(self, coach_service, coach_repo, fake_dispatcher):
+        from domain.coaches.events import CoachDeleted
+
+        coach = await _register(coach_service)
+        fake_dispatcher.run_in_background.reset_mock()
+
+        await coach_service.delete(coach.id)
+
+        assert await coach_repo.get_all() == []
+        fake_dispatcher.run_in_background.assert_called_once_with(CoachDeleted(coach_id=coach.id))
 
 
 class TestFindBestForMember:
@@ -123,3 +170,266 @@ class TestFindBestForMember:
     async def test_raises_when_member_not_found(self, coach_service):
         with pytest.raises(ValueError):
             await coach_service.find_best_for_member(999)
+
+    async def test_uses_index_instead_of_loading_all_coaches(
+        self, coach_service, coach_repo, member_repo, matching_index
+    ):
+        member = await _register_member(member_repo)
+        from domain.members.entities import FitnessGoal
+        from domain.members.value_objects import GoalType
+
+        member.goals.append(
+            FitnessGoal(type=GoalType.FLEXIBILITY, description="Bend", target_date=date.today() + timedelta(days=90))
+        )
+        await coach_service.rebuild_matching_index()
+        yoga = await coach_service.register(
+            first_name="Yo", last_name="Ga", email="yoga@gym.com", bio="", tier="STANDARD",
+            specializations=["YOGA"], max_clients=5,
+        )
+        matching_index.upsert(yoga)
+
+        async def _fail():
+            raise AssertionError("get_all must not be called")
+
+        coach_repo.get_all = _fail
+        coach = await coach_service.find_best_for_member(member.id)
+        assert coach is not None
+        assert coach.id == yoga.id
+
+    async def test_without_index_ranks_in_repository(self, coach_service, coach_repo, member_repo):
+        member = await _register_member(member_repo)
+        from domain.members.entities import FitnessGoal
+        from domain.members.value_objects import GoalType
+
+        member.goals.append(
+            FitnessGoal(type=GoalType.BUILD_MUSCLE, description="Lift", target_date=date.today() + timedelta(days=90))
+        )
+        coach = await _register(coach_service)
+
+        async def _fail():
+            raise AssertionError("get_all must not be called")
+
+        coach_repo.get_all = _fail
+        best = await coach_service.find_best_for_member(member.id)
+        assert best is not None
+        assert best.id == coach.id
+
+    async def test_stale_index_entry_is_dropped(self, coach_service, coach_repo, member_repo, matching_index):
+        member = await _register_member(member_repo)
+        from domain.members.entities import FitnessGoal
+        from domain.members.value_objects import GoalType
+
+        member.goals.append(
+            FitnessGoal(type=GoalType.BUILD_MUSCLE, description="Lift", target_date=date.today() + timedelta(days=90))
+        )
+        coach = await _register(coach_service)
+        await coach_service.rebuild_matching_index()
+        await coach_repo.delete(coach.id)
+
+        assert await coach_service.find_best_for_member(member.id) is None
+        assert coach.id not in matching_index
+
+    async def test_index_behind_another_process_ranks_in_repository_and_rebuilds(
+        self, coach_repo, member_repo, fake_cache, fake_dispatcher, fake_logger, matching_index
+    ):
+        import asyncio
+
+        from application.cache_namespace import CacheNamespace
+        from domain.members.entities import FitnessGoal
+        from domain.members.value_objects import GoalType
+
+        generation = {"coaches:index:generation": "3"}
+        fake_cache.get.side_effect = generation.get
+        service = CoachService(
+            coach_repo=coach_repo, member_repo=member_repo, cache=fake_cache, dispatcher=fake_dispatcher,
+            app_logger=fake_logger, matching_index=matching_index,
+            index_versions=CacheNamespace(fake_cache, "coaches:index"),
+        )
+        member = await _register_member(member_repo)
+        member.goals.append(
+            FitnessGoal(type=GoalType.FLEXIBILITY, description="Bend", target_date=date.today() + timedelta(days=90))
+        )
+        busy = await service.register(
+            first_name="Bu", last_name="Sy", email="busy@gym.com", bio="", tier="STANDARD",
+            specializations=["YOGA"], max_clients=5,
+        )
+        busy.current_client_count = 3
+        await service.rebuild_matching_index()
+        assert matching_index.generation == 3
+        # Registered by another process: this index never saw it, but the generation moved.
+        yoga = await service.register(
+            first_name="Yo", last_name="Ga", email="yoga@gym.com", bio="", tier="STANDARD",
+            specializations=["YOGA"], max_clients=5,
+        )
+        generation["coaches:index:generation"] = "4"
+
+        best = await service.find_best_for_member(member.id)
+        assert best is not None
+        assert best.id == yoga.id
+
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert matching_index.generation == 4
+        assert yoga.id in matching_index
+
+    async def _strength_member_and_two_coaches(self, coach_service, member_repo):
+        from domain.members.entities import FitnessGoal
+        from domain.members.value_objects import GoalType
+
+        member = await _register_member(member_repo)
+        member.goals.append(
+            FitnessGoal(type=GoalType.BUILD_MUSCLE, description="Lift", target_date=date.today() + timedelta(days=90))
+        )
+        first, second = [
+            await coach_service.register(
+                first_name="Anna", last_name="Trainer", email=email, bio="", tier="STANDARD",
+                specializations=["STRENGTH", "CROSSFIT"], max_clients=10,
+            )
+            for email in ("first@gym.com", "second@gym.com")
+        ]
+        second.current_client_count = 1
+        await coach_service.rebuild_matching_index()
+        return member, first, second
+
+    async def test_changed_capacity_falls_back_to_repository_ranking(self, coach_service, coach_repo, member_repo):
+        member, first, second = await self._strength_member_and_two_coaches(coach_service, member_repo)
+        # Another process gave the proposed coach more clients than the index knows of.
+        first.current_client_count = 5
+
+        best = await coach_service.find_best_for_member(member.id)
+
+        assert best is not None
+        assert best.id == second.id
+
+    async def test_changed_specializations_fall_back_to_repository_ranking(self, coach_service, member_repo):
+        from domain.coaches.value_objects import Specialization
+
+        member, first, second = await self._strength_member_and_two_coaches(coach_service, member_repo)
+        # Still a match, but now a weaker one than the coach queued behind it.
+        first.specializations = frozenset({Specialization.STRENGTH})
+
+        best = await coach_service.find_best_for_member(member.id)
+
+        assert best is not None
+        assert best.id == second.id
+
+
+class TestMatchMany:
+    async def _member_with_goal(self, member_repo, email: str, tier=None):
+        from domain.members.entities import FitnessGoal
+        from domain.members.value_objects import GoalType, MembershipTier
+
+        member = await _register_member(member_repo, email)
+        member.membership = member.membership.model_copy(update={"tier": tier or MembershipTier.FREE})
+        member.goals.append(
+            FitnessGoal(type=GoalType.BUILD_MUSCLE, description="Lift", target_date=date.today() + timedelta(days=90))
+        )
+        return member
+
+    async def test_respects_capacity_across_batch(self, coach_service, member_repo):
+        members = [await self._member_with_goal(member_repo, f"m{i}@test.com") for i in range(5)]
+        small = await coach_service.register(
+            first_name="Small", last_name="Coach", email="small@gym.com", bio="", tier="STANDARD",
+            specializations=["STRENGTH"], max_clients=2,
+        )
+        big = await coach_service.register(
+            first_name="Big", last_name="Coach", email="big@gym.com", bio="", tier="STANDARD",
+            specializations=["STRENGTH"], max_clients=2,
+        )
+
+        result = await coach_service.match_many([m.id for m in members])
+
+        assigned = [c.id if c else None for c in result.values()]
+        assert assigned.count(small.id) == 2
+        assert assigned.count(big.id) == 2
+        assert assigned.count(None) == 1
+
+    async def test_unknown_member_maps_to_none(self, coach_service, member_repo):
+        member = await self._member_with_goal(member_repo, "known@test.com")
+        coach = await _register(coach_service)
+
+        result = await coach_service.match_many([member.id, 999])
+
+        assert result[member.id].id == coach.id
+        assert result[999] is None
+
+    async def test_does_not_persist_assignments(self, coach_service, coach_repo, member_repo):
+        member = await self._member_with_goal(member_repo, "np@test.com")
+        coach = await _register(coach_service)
+
+        await coach_service.match_many([member.id])
+
+        assert (await coach_repo.get_by_id(coach.id)).current_client_count == 0
+
+
+    async def test_loads_candidates_instead_of_every_coach(self, coach_service, coach_repo, member_repo):
+        member = await self._member_with_goal(member_repo, "c@test.com")
+        coach = await _register(coach_service)
+
+        async def _fail():
+            raise AssertionError("get_all must not be called")
+
+        coach_repo.get_all = _fail
+        result = await coach_service.match_many([member.id])
+
+        assert result[member.id].id == coach.id
+
+    @pytest.mark.parametrize("seed", range(5))
+    async def test_agrees_with_greedy_over_all_coaches(self, seed, coach_service, coach_repo, member_repo):
+        import random
+
+        from domain.coaches.coach import Coach
+        from domain.coaches.value_objects import CoachTier, Specialization
+        from domain.members.entities import FitnessGoal
+        from domain.members.value_objects import GoalType, MembershipTier
+        from domain.services.coach_matching import CoachMatchingService
+
+        rng = random.Random(seed)
+        coaches = []
+        for i in range(25):
+            coach = Coach.create(
+                first_name="C", last_name=str(i), email=f"c{i}@gym.com", bio="",
+                tier=rng.choice(list(CoachTier)),
+                specializations=frozenset(rng.sample(list(Specialization), rng.randint(1, 3))),
+                max_clients=rng.randint(1, 3),
+            )
+            coach.current_client_count = rng.randint(0, coach.max_clients)
+            coaches.append(await coach_repo.save(coach))
+        members = []
+        for i in range(20):
+            member = await self._member_with_goal(member_repo, f"m{i}@test.com", rng.choice(list(MembershipTier)))
+            member.goals = [
+                FitnessGoal(type=goal, description="", target_date=date.today() + timedelta(days=90))
+                for goal in rng.sample(list(GoalType), rng.randint(1, 2))
+            ]
+            members.append(member)
+
+        counts = {c.id: c.current_client_count for c in coaches}
+        expected = {}
+        for member in members:
+            pool = [c.model_copy(update={"current_client_count": counts[c.id]}) for c in coaches]
+            best = CoachMatchingService.find_best_coach(member, pool)
+            expected[member.id] = best.id if best else None
+            if best is not None:
+                counts[best.id] += 1
+
+        result = await coach_service.match_many([m.id for m in members])
+
+        assert {member_id: c.id if c else None for member_id, c in result.items()} == expected
+
+
+class TestCoachListingsInvalidationHandler:
+    async def test_every_coach_event_bumps_the_listing_generation(self, fake_cache, fake_logger):
+        from application.cache_namespace import CacheNamespace
+        from application.coaches.event_handlers import CoachListingsInvalidationHandler
+        from domain.coaches.events import CoachDeleted, CoachRegistered
+
+        handler = CoachListingsInvalidationHandler(CacheNamespace(fake_cache, "coaches:available"), fake_logger)
+        events = [
+            CoachRegistered(coach_id=None, email="anna@gym.com", full_name="Anna Trainer"),
+            CoachDeleted(coach_id=1),
+        ]
+        for event in events:
+            await handler.handle(event)
+
+        assert [c.args for c in fake_cache.incr.await_args_list] == [("coaches:available:generation",)] * 2
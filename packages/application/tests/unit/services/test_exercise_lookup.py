@@ -0,0 +1,150 @@
+import asyncio
+import json
+
+import pytest
+
+from application.core.ports import ExerciseApiUnavailableError
+from application.plans.exercise_lookup import EXERCISE_TTL, ExerciseLookup
+from application.stale_while_revalidate import StaleWhileRevalidateCache
+
+FRESH = json.dumps([float("inf"), 0.0])
+
+
+class SlowExerciseClient:
+    """Records concurrency and blocks each search until ``release`` is set."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+        self.release = asyncio.Event()
+
+    async def get_exercise(self, exercise_id: str) -> dict[str, object] | None:
+        return None
+
+    async def search_exercises(self, name: str) -> list[dict[str, object]]:
+        self.calls.append(name)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await self.release.wait()
+        finally:
+            self.in_flight -= 1
+        return [{"exercise_id": str(len(self.calls)), "name": name}]
+
+
+@pytest.fixture()
+def slow_client() -> SlowExerciseClient:
+    return SlowExerciseClient()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestResolve:
+    async def test_reads_all_names_in_one_batch_and_writes_misses_in_one_batch(self, fake_cache, fake_exercise_client):
+        cached = {
+            "exercise:bench press": json.dumps({"exercise_id": "7", "name": "Bench Press"}),
+            "exercise:bench press:swr": FRESH,
+        }
+        fake_cache.get_many.side_effect = lambda keys: [cached.get(k) for k in keys]
+        lookup = ExerciseLookup(StaleWhileRevalidateCache(fake_cache), fake_exercise_client)
+
+        resolved = await lookup.resolve(["Squat", "Bench Press", "Deadlift"])
+
+        fake_cache.get_many.assert_awaited_once()
+        assert fake_cache.get_many.await_args.args[0][:3] == ["exercise:squat", "exercise:bench press", "exercise:deadlift"]
+        assert resolved["exercise:bench press"] == {"exercise_id": "7", "name": "Bench Press"}
+        assert fake_exercise_client.search_exercises.await_count == 2
+        fake_cache.set_many.assert_awaited_once()
+        written, ttl = fake_cache.set_many.await_args.args
+        assert set(written) == {"exercise:squat", "exercise:squat:swr", "exercise:deadlift", "exercise:deadlift:swr"}
+        assert ttl == EXERCISE_TTL.hard_seconds
+
+    async def test_duplicate_names_are_looked_up_once(self, fake_cache, fake_exercise_client):
+        lookup = ExerciseLookup(StaleWhileRevalidateCache(fake_cache), fake_exercise_client)
+
+        resolved = await lookup.resolve(["Squat", "squat", "SQUAT"])
+
+        assert list(resolved) == ["exercise:squat"]
+        fake_exercise_client.search_exercises.assert_awaited_once()
+
+    async def test_unknown_exercise_falls_back_to_placeholder(self, fake_cache, fake_exercise_client):
+        fake_exercise_client.search_exercises.return_value = []
+        lookup = ExerciseLookup(StaleWhileRevalidateCache(fake_cache), fake_exercise_client)
+
+        resolved = await lookup.resolve(["Mystery Move"])
+
+        assert resolved["exercise:mystery move"] == {"exercise_id": "0", "name": "Mystery Move"}
+
+    async def test_placeholders_are_cached_with_the_negative_ttl(self, fake_cache, fake_exercise_client):
+        async def search(name: str) -> list[dict[str, object]]:
+            return [{"exercise_id": "42", "name": "Squat"}] if name == "Squat" else []
+
+        fake_exercise_client.search_exercises.side_effect = search
+        lookup = ExerciseLookup(StaleWhileRevalidateCache(fake_cache), fake_exercise_client, negative_ttl_seconds=30)
+
+        await lookup.resolve(["Squat", "Mystery Move"])
+
+        writes = {ttl: set(items) for items, ttl in (c.args for c in fake_cache.set_many.await_args_list)}
+        assert writes == {
+            EXERCISE_TTL.hard_seconds: {"exercise:squat", "exercise:squat:swr"},
+            30: {"exercise:mystery move", "exercise:mystery move:swr"},
+        }
+
+    async def test_unavailable_api_resolves_to_short_lived_placeholder(self, fake_cache, fake_exercise_client):
+        fake_exercise_client.search_exercises.side_effect = ExerciseApiUnavailableError("circuit open")
+        lookup = ExerciseLookup(StaleWhileRevalidateCache(fake_cache), fake_exercise_client, negative_ttl_seconds=30)
+
+        resolved = await lookup.resolve(["Squat"])
+
+        assert resolved["exercise:squat"] == {"exercise_id": "0", "name": "Squat"}
+        fake_cache.set_many.assert_awaited_once()
+        assert fake_cache.set_many.await_args.args[1] == 30
+
+    async def test_nothing_to_resolve_skips_the_cache(self, fake_cache, fake_exercise_client):
+        assert await ExerciseLookup(StaleWhileRevalidateCache(fake_cache), fake_exercise_client).resolve([]) == {}
+        fake_cache.get_many.assert_not_awaited()
+
+
+class TestConcurrency:
+    async def test_misses_are_searched_concurrently_up_to_the_limit(self, fake_cache, slow_client):
+        lookup = ExerciseLookup(StaleWhileRevalidateCache(fake_cache), slow_client, max_concurrency=3)
+
+        pending = asyncio.create_task(lookup.resolve([f"Exercise {i}" for i in range(12)]))
+        await _settle()
+        assert slow_client.in_flight == 3
+
+        slow_client.release.set()
+        resolved = await pending
+
+        assert len(resolved) == 12
+        assert slow_client.peak == 3
+        assert len(slow_client.calls) == 12
+
+    async def test_concurrent_requests_for_the_same_name_share_one_upstream_call(self, fake_cache, slow_client):
+        lookup = ExerciseLookup(StaleWhileRevalidateCache(fake_cache), slow_client)
+
+        first = asyncio.create_task(lookup.resolve(["Squat"]))
+        second = asyncio.create_task(lookup.resolve(["squat", "Lunge"]))
+        await _settle()
+        slow_client.release.set()
+        a, b = await asyncio.gather(first, second)
+
+        assert slow_client.calls.count("Squat") + slow_client.calls.count("squat") == 1
+        assert a["exercise:squat"] == b["exercise:squat"]
+
+    async def test_cancelled_caller_does_not_cancel_shared_search(self, fake_cache, slow_client):
+        lookup = ExerciseLookup(StaleWhileRevalidateCache(fake_cache), slow_client)
+
+        first = asyncio.create_task(lookup.resolve(["Squat"]))
+        second = asyncio.create_task(lookup.resolve(["Squat"]))
+        await _settle()
+        first.cancel()
+        await _settle()
+        slow_client.release.set()
+
+        assert (await second)["exercise:squat"]["name"] == "Squat"
+        assert len(slow_client.calls) == 1
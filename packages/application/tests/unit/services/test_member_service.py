@@ -55,6 +55,35 @@ class TestGetAll:
         assert len(members) == 2
 
 
+class TestGetPage:
+    async def test_pages_by_id_cursor(self, member_service):
+        for i in range(5):
+            await _register(member_service, f"m{i}@test.com")
+        first, cursor = await member_service.get_page(None, 2)
+        assert [m.id for m in first] == [1, 2]
+        assert cursor == 2
+        second, cursor = await member_service.get_page(cursor, 2)
+        assert [m.id for m in second] == [3, 4]
+        last, cursor = await member_service.get_page(cursor, 2)
+        assert [m.id for m in last] == [5]
+        assert cursor is None
+
+    async def test_exact_fit_has_no_next_cursor(self, member_service):
+        await _register(member_service, "a@test.com")
+        await _register(member_service, "b@test.com")
+        members, cursor = await member_service.get_page(None, 2)
+        assert len(members) == 2
+        assert cursor is None
+
+
+class TestStreamAll:
+    async def test_yields_every_member(self, member_service):
+        await _register(member_service, "a@test.com")
+        await _register(member_service, "b@test.com")
+        emails = [m.email.value async for m in member_service.stream_all()]
+        assert emails == ["a@test.com", "b@test.com"]
+
+
 class TestAddGoal:
     async def test_adds_goal_to_member(self, member_service):
         member = await _register(member_service)
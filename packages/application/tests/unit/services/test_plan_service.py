@@ -96,12 +96,46 @@ class TestAddSession:
         assert len(updated.sessions) == 1
         fake_exercise_client.search_exercises.assert_called_once_with("Squat")
 
+    async def test_looks_up_exercises_before_loading_the_plan(
+        self, plan_service, plan_repo, member_repo, fake_exercise_client
+    ):
+        member = await _make_member(member_repo)
+        plan = await plan_service.create_plan(
+            member_id=member.id,
+            coach_id=1,
+            name="My Plan",
+            starts_at=date.today().isoformat(),
+            ends_at=(date.today() + timedelta(weeks=4)).isoformat(),
+        )
+        calls: list[str] = []
+        load_plan = plan_repo.get_by_id
+
+        async def get_by_id(id: int):
+            calls.append("load plan")
+            return await load_plan(id)
+
+        async def search_exercises(name: str):
+            calls.append(f"search {name}")
+            return [{"exercise_id": "42", "name": name}]
+
+        plan_repo.get_by_id = get_by_id
+        fake_exercise_client.search_exercises.side_effect = search_exercises
+        await plan_service.add_session(
+            plan_id=plan.id,
+            session_name="Leg Day",
+            scheduled_date=(date.today() + timedelta(days=1)).isoformat(),
+            exercises=[{"name": "Squat"}, {"name": "Lunge"}],
+        )
+        assert calls == ["search Squat", "search Lunge", "load plan"]
+
     async def test_uses_cache_on_second_call(
         self, plan_service, member_repo, fake_cache, fake_exercise_client
     ):
         import json
 
-        fake_cache.get.return_value = json.dumps({"exercise_id": "42", "name": "Squat"})
+        cached = json.dumps({"exercise_id": "42", "name": "Squat"})
+        fresh = json.dumps([float("inf"), 0.0])
+        fake_cache.get_many.side_effect = lambda keys: [fresh if k.endswith(":swr") else cached for k in keys]
         member = await _make_member(member_repo)
         plan = await plan_service.create_plan(
             member_id=member.id,
@@ -0,0 +1,32 @@
+from application.cache_namespace import CacheNamespace
+
+
+class _CounterCache:
+    """Just the ``get``/``incr`` part of ``ICache`` a namespace relies on."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def incr(self, key: str) -> int:
+        value = int(self.values.get(key, "0")) + 1
+        self.values[key] = str(value)
+        return value
+
+
+class TestCacheNamespace:
+    async def test_missing_generation_reads_as_zero(self):
+        listings = CacheNamespace(_CounterCache(), "coaches:available")
+        assert await listings.key("ALL") == "coaches:available:v0:ALL"
+
+    async def test_invalidate_moves_every_key_to_the_next_generation(self):
+        listings = CacheNamespace(_CounterCache(), "coaches:available")
+        before = {await listings.key(s) for s in ("ALL", "YOGA")}
+
+        assert await listings.invalidate() == 1
+
+        after = {await listings.key(s) for s in ("ALL", "YOGA")}
+        assert after == {"coaches:available:v1:ALL", "coaches:available:v1:YOGA"}
+        assert before.isdisjoint(after)
@@ -0,0 +1,174 @@
+import asyncio
+from contextvars import ContextVar
+
+import pytest
+
+from application.event_dispatcher import EventDispatcher
+from domain.members.events import MembershipUpgraded
+from domain.shared.events import ApplicationEvent
+
+_request: ContextVar[str | None] = ContextVar("_request", default=None)
+
+
+def _event(member_id: int = 1) -> MembershipUpgraded:
+    return MembershipUpgraded(member_id=member_id, old_tier="FREE", new_tier="PREMIUM")
+
+
+class Gate:
+    """Handler that blocks until released and records peak concurrency."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.running = 0
+        self.peak = 0
+        self.handled: list[int] = []
+
+    async def __call__(self, event: ApplicationEvent) -> None:
+        assert isinstance(event, MembershipUpgraded)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await self.release.wait()
+        finally:
+            self.running -= 1
+        self.handled.append(event.member_id)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture()
+def gate() -> Gate:
+    return Gate()
+
+
+@pytest.fixture()
+def queued(fake_logger, gate) -> EventDispatcher:
+    dispatcher = EventDispatcher(fake_logger, queue_size=2, workers_per_event=2)
+    dispatcher.register(MembershipUpgraded, gate)
+    return dispatcher
+
+
+class TestQueuedDispatch:
+    async def test_concurrency_is_bounded_by_workers(self, queued, gate):
+        for i in range(4):  # two running, two queued
+            queued.run_in_background(_event(i))
+            await _settle()
+        assert gate.peak == 2
+
+        gate.release.set()
+        for i in range(4, 10):
+            await queued.enqueue(_event(i))
+
+        await queued.drain()
+        assert sorted(gate.handled) == list(range(10))
+        assert gate.peak == 2
+
+    async def test_enqueue_waits_for_room(self, queued, gate):
+        for i in range(4):  # two running, two queued
+            await queued.enqueue(_event(i))
+            await _settle()
+
+        blocked = asyncio.create_task(queued.enqueue(_event(4)))
+        await _settle()
+        assert not blocked.done()
+        assert queued.stats["MembershipUpgraded"].waiting_producers == 1
+
+        gate.release.set()
+        await blocked
+        await queued.drain()
+        assert len(gate.handled) == 5
+
+    async def test_run_in_background_drops_events_when_full(self, queued, gate):
+        for i in range(6):
+            queued.run_in_background(_event(i))
+            await _settle()
+
+        stats = queued.stats["MembershipUpgraded"]
+        assert stats.depth == 2
+        assert stats.dropped == 2
+        assert stats.waiting_producers == 0
+
+        gate.release.set()
+        await queued.drain()
+        assert sorted(gate.handled) == list(range(4))
+        assert stats.enqueued == stats.processed == 4
+
+    async def test_drain_times_out_and_stops_workers(self, queued, gate):
+        queued.run_in_background(_event())
+        await _settle()
+
+        await queued.drain(timeout=0.01)
+
+        assert gate.handled == []
+        assert gate.running == 0
+
+    async def test_failing_handler_is_counted_and_does_not_stop_the_worker(self, fake_logger):
+        dispatcher = EventDispatcher(fake_logger, queue_size=10)
+        seen: list[int] = []
+
+        async def flaky(event: ApplicationEvent) -> None:
+            assert isinstance(event, MembershipUpgraded)
+            if event.member_id == 1:
+                raise RuntimeError("broker down")
+            seen.append(event.member_id)
+
+        dispatcher.register(MembershipUpgraded, flaky)
+        dispatcher.run_in_background(_event(1))
+        dispatcher.run_in_background(_event(2))
+        await dispatcher.drain()
+
+        assert seen == [2]
+        assert dispatcher.stats["MembershipUpgraded"].failed == 1
+
+    async def test_records_wait_and_run_latency(self, fake_logger):
+        now = [0.0]
+        dispatcher = EventDispatcher(fake_logger, queue_size=10, clock=lambda: now[0])
+
+        async def slow(event: ApplicationEvent) -> None:
+            now[0] += 2.0
+
+        dispatcher.register(MembershipUpgraded, slow)
+        dispatcher.run_in_background(_event())
+        now[0] = 0.5
+        await dispatcher.drain()
+
+        stats = dispatcher.stats["MembershipUpgraded"]
+        assert (stats.max_wait, stats.max_run, stats.max_depth) == (0.5, 2.0, 1)
+
+    async def test_workers_do_not_inherit_the_callers_context(self, fake_logger):
+        dispatcher = EventDispatcher(fake_logger, queue_size=10)
+        seen: list[str | None] = []
+
+        async def handler(event: ApplicationEvent) -> None:
+            seen.append(_request.get())
+
+        dispatcher.register(MembershipUpgraded, handler)
+        token = _request.set("request-1")
+        try:
+            dispatcher.run_in_background(_event())
+        finally:
+            _request.reset(token)
+        await dispatcher.drain()
+
+        assert seen == [None]
+
+    async def test_events_without_handlers_are_not_queued(self, fake_logger):
+        dispatcher = EventDispatcher(fake_logger, queue_size=10)
+        dispatcher.run_in_background(_event())
+        assert dict(dispatcher.stats) == {}
+
+
+async def test_unqueued_mode_keeps_handler_tasks_until_drained(fake_logger, gate):
+    dispatcher = EventDispatcher(fake_logger)
+    dispatcher.register(MembershipUpgraded, gate)
+    for i in range(3):
+        dispatcher.run_in_background(_event(i))
+    await _settle()
+    assert gate.running == 3
+
+    gate.release.set()
+    await dispatcher.drain()
+    assert sorted(gate.handled) == [0, 1, 2]
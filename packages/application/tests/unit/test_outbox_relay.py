@@ -0,0 +1,110 @@
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+
+import pytest
+
+from application.core.ports import OutboxMessage
+from application.event_dispatcher import EventDispatcher
+from application.outbox_relay import OutboxRelay
+from domain.members.events import MembershipUpgraded
+from domain.shared.events import ApplicationEvent
+
+
+class FakeOutbox:
+    def __init__(self, messages: list[OutboxMessage]) -> None:
+        self.messages = {m.id: m for m in messages}
+        self.failures: dict[int, str] = {}
+
+    async def add(self, events: Sequence[ApplicationEvent]) -> None:
+        raise NotImplementedError
+
+    async def claim(self, limit: int, max_attempts: int) -> list[OutboxMessage]:
+        ready = [m for m in self.messages.values() if m.attempts < max_attempts]
+        return sorted(ready, key=lambda m: m.id)[:limit]
+
+    async def delete(self, ids: Sequence[int]) -> None:
+        for id in ids:
+            del self.messages[id]
+
+    async def record_failure(self, id: int, error: str) -> None:
+        m = self.messages[id]
+        self.messages[id] = OutboxMessage(id=m.id, event_type=m.event_type, payload=m.payload, attempts=m.attempts + 1)
+        self.failures[id] = error
+
+
+class FakeTransactionManager:
+    def __init__(self) -> None:
+        self.transactions = 0
+
+    @asynccontextmanager
+    async def transaction(self, new: bool = False) -> AsyncIterator[None]:
+        self.transactions += 1
+        yield
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[None]:
+        yield
+
+
+def _message(id: int, member_id: int, event_type: str = "MembershipUpgraded") -> OutboxMessage:
+    payload = {"member_id": member_id, "old_tier": "FREE", "new_tier": "PREMIUM"}
+    return OutboxMessage(id=id, event_type=event_type, payload=payload, attempts=0)
+
+
+@pytest.fixture()
+def handled() -> list[int]:
+    return []
+
+
+@pytest.fixture()
+def dispatcher(fake_logger, handled) -> EventDispatcher:
+    async def handler(event: ApplicationEvent) -> None:
+        assert isinstance(event, MembershipUpgraded)
+        if event.member_id < 0:
+            raise RuntimeError("broker down")
+        handled.append(event.member_id)
+
+    dispatcher = EventDispatcher(fake_logger)
+    dispatcher.register(MembershipUpgraded, handler)
+    return dispatcher
+
+
+def _relay(outbox, dispatcher, fake_logger, batch_size: int = 2, max_attempts: int = 2) -> OutboxRelay:
+    return OutboxRelay(
+        outbox, FakeTransactionManager(), dispatcher, fake_logger, batch_size=batch_size, max_attempts=max_attempts
+    )
+
+
+async def test_relays_a_batch_in_order_and_deletes_it(dispatcher, handled, fake_logger):
+    outbox = FakeOutbox([_message(1, 10), _message(2, 20), _message(3, 30)])
+    relay = _relay(outbox, dispatcher, fake_logger)
+
+    assert await relay.relay_once() == 2
+    assert handled == [10, 20]
+    assert list(outbox.messages) == [3]
+
+    assert await relay.relay_once() == 1
+    assert handled == [10, 20, 30]
+    assert outbox.messages == {}
+
+
+async def test_failed_message_is_kept_and_retried_up_to_max_attempts(dispatcher, handled, fake_logger):
+    outbox = FakeOutbox([_message(1, -1), _message(2, 20)])
+    relay = _relay(outbox, dispatcher, fake_logger)
+
+    await relay.relay_once()
+    assert handled == [20]
+    assert outbox.messages[1].attempts == 1
+    assert "broker down" in outbox.failures[1]
+
+    await relay.relay_once()
+    assert outbox.messages[1].attempts == 2
+    assert await relay.relay_once() == 0
+
+
+async def test_messages_without_a_handler_are_dropped(dispatcher, handled, fake_logger):
+    outbox = FakeOutbox([_message(1, 10, event_type="SomethingElse")])
+
+    assert await _relay(outbox, dispatcher, fake_logger).relay_once() == 1
+    assert handled == []
+    assert outbox.messages == {}
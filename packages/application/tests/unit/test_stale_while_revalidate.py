@@ -0,0 +1,226 @@
+import asyncio
+import json
+
+import pytest
+from pydantic import TypeAdapter
+
+from application.stale_while_revalidate import CacheTtl, StaleWhileRevalidateCache
+
+_INTS = TypeAdapter(list[int])
+_TTL = CacheTtl(soft_seconds=10, hard_seconds=100)
+
+
+class DictCache:
+    """Just enough of ``ICache`` to observe what the wrapper stores."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self.values[key], self.ttls[key] = value, ttl_seconds
+
+    async def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+    async def get_many(self, keys):
+        return [self.values.get(k) for k in keys]
+
+    async def set_many(self, items, ttl_seconds: int) -> None:
+        for key, value in items.items():
+            await self.set(key, value, ttl_seconds)
+
+    async def get_model(self, key, adapter):
+        raw = self.values.get(key)
+        return None if raw is None else adapter.validate_json(raw)
+
+    async def set_model(self, key, value, adapter, ttl_seconds: int) -> None:
+        await self.set(key, adapter.dump_json(value).decode(), ttl_seconds)
+
+
+class FakeLocks:
+    def __init__(self) -> None:
+        self.held: set[str] = set()
+        self.acquired: list[str] = []
+
+    async def try_acquire(self, name: str, ttl_seconds: float) -> str | None:
+        if name in self.held:
+            return None
+        self.held.add(name)
+        self.acquired.append(name)
+        return "token"
+
+    async def release(self, name: str, token: str) -> None:
+        self.held.discard(name)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Loader:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.gate: asyncio.Event | None = None
+
+    async def __call__(self) -> list[int]:
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        return [self.calls]
+
+
+@pytest.fixture()
+def cache() -> DictCache:
+    return DictCache()
+
+
+@pytest.fixture()
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture()
+def locks() -> FakeLocks:
+    return FakeLocks()
+
+
+def _swr(cache, clock, locks=None, rand=lambda: 0.0) -> StaleWhileRevalidateCache:
+    # rand() == 0.0 makes the early-expiry draw zero, i.e. no early refresh.
+    return StaleWhileRevalidateCache(cache, locks, clock=clock, rand=rand)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestGetOrLoad:
+    async def test_miss_loads_and_stores_value_with_hard_ttl(self, cache, clock):
+        loader = Loader()
+
+        assert await _swr(cache, clock).get_or_load("k", _INTS, loader, _TTL) == [1]
+
+        assert cache.ttls == {"k": 100, "k:swr": 100}
+        soft_expires_at, _ = json.loads(cache.values["k:swr"])
+        assert soft_expires_at == clock.now + 10
+
+    async def test_fresh_hit_does_not_reload(self, cache, clock):
+        loader = Loader()
+        swr = _swr(cache, clock)
+        await swr.get_or_load("k", _INTS, loader, _TTL)
+
+        clock.now += 9
+        assert await swr.get_or_load("k", _INTS, loader, _TTL) == [1]
+        await _settle()
+
+        assert loader.calls == 1
+
+    async def test_stale_value_is_served_while_one_refresh_runs(self, cache, clock, locks):
+        loader = Loader()
+        swr = _swr(cache, clock, locks)
+        await swr.get_or_load("k", _INTS, loader, _TTL)
+
+        clock.now += 11
+        loader.gate = asyncio.Event()
+        results = [await swr.get_or_load("k", _INTS, loader, _TTL) for _ in range(5)]
+        await _settle()
+
+        assert results == [[1]] * 5
+        assert loader.calls == 2
+        assert locks.acquired == ["lock:k"]
+
+        loader.gate.set()
+        await _settle()
+        assert await swr.get_or_load("k", _INTS, loader, _TTL) == [2]
+        assert locks.held == set()
+
+    async def test_refresh_is_skipped_while_another_process_holds_the_lock(self, cache, clock, locks):
+        loader = Loader()
+        swr = _swr(cache, clock, locks)
+        await swr.get_or_load("k", _INTS, loader, _TTL)
+        locks.held.add("lock:k")
+
+        clock.now += 11
+        assert await swr.get_or_load("k", _INTS, loader, _TTL) == [1]
+        await _settle()
+
+        assert loader.calls == 1
+
+    async def test_early_refresh_grows_likelier_towards_soft_expiry(self, cache, clock):
+        async def slow_loader() -> list[int]:
+            clock.now += 2  # a 2s load makes the early-expiry window a few seconds wide
+            return [0]
+
+        swr = _swr(cache, clock, rand=lambda: 0.5)
+        await swr.get_or_load("k", _INTS, slow_loader, _TTL)
+        soft_expires_at, load_seconds = json.loads(cache.values["k:swr"])
+        assert load_seconds == 2
+
+        # -2 * ln(0.5) ~= 1.39s early.
+        clock.now = soft_expires_at - 2
+        assert not swr._is_due(cache.values["k:swr"])
+        clock.now = soft_expires_at - 1
+        assert swr._is_due(cache.values["k:swr"])
+
+    async def test_value_without_metadata_is_served_and_refreshed(self, cache, clock):
+        cache.values["k"] = "[7]"
+        loader = Loader()
+
+        assert await _swr(cache, clock).get_or_load("k", _INTS, loader, _TTL) == [7]
+        await _settle()
+
+        assert loader.calls == 1
+        assert cache.values["k"] == "[1]"
+
+    async def test_failed_refresh_keeps_stale_value(self, cache, clock):
+        swr = _swr(cache, clock)
+        await swr.get_or_load("k", _INTS, Loader(), _TTL)
+
+        async def broken() -> list[int]:
+            raise RuntimeError("db down")
+
+        clock.now += 11
+        assert await swr.get_or_load("k", _INTS, broken, _TTL) == [1]
+        await _settle()
+
+        assert cache.values["k"] == "[1]"
+
+
+class TestGetManyOrLoad:
+    async def test_reads_values_and_metadata_in_one_batch(self, cache, clock):
+        swr = _swr(cache, clock)
+        loaded: list[str] = []
+
+        async def load(key: str) -> tuple[list[int], CacheTtl]:
+            loaded.append(key)
+            return [len(key)], _TTL if key != "bad" else CacheTtl(1, 5)
+
+        assert await swr.get_many_or_load(["a", "bad"], _INTS, load) == {"a": [1], "bad": [3]}
+        assert cache.ttls == {"a": 100, "a:swr": 100, "bad": 5, "bad:swr": 5}
+
+        assert await swr.get_many_or_load(["a", "bad"], _INTS, load) == {"a": [1], "bad": [3]}
+        assert loaded == ["a", "bad"]
+
+    async def test_stale_keys_refresh_in_background(self, cache, clock):
+        swr = _swr(cache, clock)
+        loaded: list[str] = []
+
+        async def load(key: str) -> tuple[list[int], CacheTtl]:
+            loaded.append(key)
+            return [len(loaded)], _TTL
+
+        await swr.get_many_or_load(["a"], _INTS, load)
+        clock.now += 11
+        assert await swr.get_many_or_load(["a", "b"], _INTS, load) == {"a": [1], "b": [2]}
+        await _settle()
+
+        assert loaded == ["a", "b", "a"]
+        assert cache.values["a"] == "[3]"
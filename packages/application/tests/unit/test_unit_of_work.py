@@ -0,0 +1,192 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+
+from application.core.ports import IUnitOfWork, OutboxMessage
+from application.event_dispatcher import EventDispatcher
+from application.unit_of_work import unit_of_work
+from domain.members.events import MembershipUpgraded
+from domain.shared.events import ApplicationEvent
+
+
+class FakeUnitOfWork(IUnitOfWork):
+    def __init__(self, log: list[str]) -> None:
+        self._log = log
+
+    async def commit(self) -> None:
+        self._log.append("commit")
+
+    async def rollback(self) -> None:
+        self._log.append("rollback")
+
+
+class FakeTransactionManager:
+    def __init__(self) -> None:
+        self.log: list[str] = []
+
+    @asynccontextmanager
+    async def transaction(self, new: bool = False) -> AsyncIterator[None]:
+        yield
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[IUnitOfWork]:
+        try:
+            yield FakeUnitOfWork(self.log)
+            self.log.append("commit")
+        except Exception:
+            self.log.append("rollback")
+            raise
+
+
+class FakeOutbox:
+    def __init__(self, log: list[str]) -> None:
+        self._log = log
+
+    async def add(self, events) -> None:
+        self._log.append(f"outbox {[type(e).__name__ for e in events]}")
+
+    async def claim(self, limit: int, max_attempts: int) -> list[OutboxMessage]:
+        return []
+
+    async def delete(self, ids) -> None: ...
+
+    async def record_failure(self, id: int, error: str) -> None: ...
+
+
+def _event() -> MembershipUpgraded:
+    return MembershipUpgraded(member_id=1, old_tier="FREE", new_tier="PREMIUM")
+
+
+@pytest.fixture()
+def tm() -> FakeTransactionManager:
+    return FakeTransactionManager()
+
+
+@pytest.fixture()
+def dispatcher(fake_logger) -> EventDispatcher:
+    return EventDispatcher(fake_logger)
+
+
+@pytest.fixture()
+def handled(dispatcher, tm) -> list[str]:
+    async def handler(event: ApplicationEvent) -> None:
+        tm.log.append(f"handled {type(event).__name__}")
+
+    dispatcher.register(MembershipUpgraded, handler)
+    return tm.log
+
+
+async def test_background_events_start_after_commit(tm, dispatcher, handled):
+    async with unit_of_work(tm, dispatcher):
+        dispatcher.run_in_background(_event())
+        await asyncio.sleep(0)
+        assert handled == []
+
+    await asyncio.sleep(0)
+    assert handled == ["commit", "handled MembershipUpgraded"]
+
+
+async def test_background_events_are_dropped_when_block_raises(tm, dispatcher, handled):
+    with pytest.raises(ValueError):
+        async with unit_of_work(tm, dispatcher):
+            dispatcher.run_in_background(_event())
+            raise ValueError("boom")
+
+    await asyncio.sleep(0)
+    assert handled == ["rollback"]
+
+
+async def test_background_events_are_dropped_after_explicit_rollback(tm, dispatcher, handled):
+    async with unit_of_work(tm, dispatcher) as uow:
+        dispatcher.run_in_background(_event())
+        await uow.rollback()
+
+    await asyncio.sleep(0)
+    assert handled == ["rollback", "commit"]
+
+
+async def test_run_in_background_outside_unit_of_work_is_not_held(dispatcher, handled):
+    dispatcher.run_in_background(_event())
+    await asyncio.sleep(0)
+    assert handled == ["handled MembershipUpgraded"]
+
+
+async def test_held_events_are_written_to_the_outbox_before_commit(tm, dispatcher, handled):
+    async with unit_of_work(tm, dispatcher, FakeOutbox(tm.log)) as uow:
+        dispatcher.run_in_background(_event())
+        await uow.commit()
+        dispatcher.run_in_background(_event())
+
+    await asyncio.sleep(0)
+    assert handled == [
+        "outbox ['MembershipUpgraded']",
+        "commit",
+        "outbox ['MembershipUpgraded']",
+        "commit",
+        "handled MembershipUpgraded",
+        "handled MembershipUpgraded",
+    ]
+
+
+async def test_rolled_back_events_never_reach_the_outbox(tm, dispatcher, handled):
+    async with unit_of_work(tm, dispatcher, FakeOutbox(tm.log)) as uow:
+        dispatcher.run_in_background(_event())
+        await uow.rollback()
+
+    assert handled == ["rollback", "commit"]
+
+
+@pytest.fixture()
+def post_committed(dispatcher, tm) -> list[str]:
+    async def handler(event: ApplicationEvent) -> None:
+        tm.log.append(f"post-commit {type(event).__name__}")
+
+    dispatcher.register_post_commit(MembershipUpgraded, handler)
+    return tm.log
+
+
+async def test_post_commit_handlers_run_right_after_an_explicit_commit(tm, dispatcher, handled, post_committed):
+    async with unit_of_work(tm, dispatcher) as uow:
+        dispatcher.run_in_background(_event())
+        await uow.commit()
+        assert tm.log == ["commit", "post-commit MembershipUpgraded"]
+
+    await asyncio.sleep(0)
+    assert tm.log == ["commit", "post-commit MembershipUpgraded", "commit", "handled MembershipUpgraded"]
+
+
+async def test_post_commit_handlers_run_once_the_block_commits(tm, dispatcher, post_committed):
+    async with unit_of_work(tm, dispatcher):
+        dispatcher.run_in_background(_event())
+
+    assert tm.log == ["commit", "post-commit MembershipUpgraded"]
+
+
+async def test_post_commit_handlers_skip_rolled_back_events(tm, dispatcher, post_committed):
+    async with unit_of_work(tm, dispatcher) as uow:
+        dispatcher.run_in_background(_event())
+        await uow.rollback()
+
+    assert tm.log == ["rollback", "commit"]
+
+
+async def test_failing_post_commit_handler_does_not_fail_the_unit_of_work(tm, dispatcher, handled):
+    async def broken(event: ApplicationEvent) -> None:
+        raise RuntimeError("redis down")
+
+    dispatcher.register_post_commit(MembershipUpgraded, broken)
+    async with unit_of_work(tm, dispatcher):
+        dispatcher.run_in_background(_event())
+
+    await asyncio.sleep(0)
+    assert handled == ["commit", "handled MembershipUpgraded"]
+
+
+async def test_post_commit_handlers_outside_unit_of_work_run_in_background(dispatcher, post_committed):
+    dispatcher.run_in_background(_event())
+    assert post_committed == []
+
+    await asyncio.sleep(0)
+    assert post_committed == ["post-commit MembershipUpgraded"]
@@ -1,3 +1,18 @@
+from taskiq import TaskiqScheduler
+from taskiq.schedule_sources import LabelScheduleSource
+
+from bootstrap.containers import Container
 from infrastructure.taskiq.broker import broker
+from infrastructure.taskiq.schedule_source import ConfiguredCronSource
+
+SYNC_EXERCISE_CATALOG = "sync_exercise_catalog"
+
+
+def _crons() -> dict[str, str]:
+    config = Container().config
+    return {SYNC_EXERCISE_CATALOG: config.exercise_api.catalog_sync_cron()}
+
+
+scheduler = TaskiqScheduler(broker=broker, sources=[LabelScheduleSource(broker), ConfiguredCronSource(_crons)])
 
-__all__ = ["broker"]
+__all__ = ["SYNC_EXERCISE_CATALOG", "broker", "scheduler"]
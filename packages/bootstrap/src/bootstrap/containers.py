@@ -3,28 +3,47 @@ from collections.abc import AsyncIterator
 
 from dependency_injector import containers, providers
 
-from application.coaches.coach_service import CoachService
-from application.coaches.event_handlers import CoachRegisteredHandler
+from application.cache_namespace import CacheNamespace
+from application.channel_handlers import LoggingChannelHandler
+from application.coaches.coach_service import COACH_INDEX_PREFIX, COACH_LISTINGS_PREFIX, CoachService
+from application.coaches.event_handlers import (
+    CoachListingsInvalidationHandler,
+    CoachMatchingIndexHandler,
+    CoachRegisteredHandler,
+)
+from application.coaches.matching_index import CoachMatchingIndex
 from application.event_dispatcher import EventDispatcher
 from application.logger import ApplicationLogger
 from application.members.event_handlers import MemberRegisteredHandler
 from application.members.member_service import MemberService
+from application.outbox_relay import OutboxRelay
 from application.plans.event_handlers import (
     PlanCompletedHandler,
     SessionCompletedHandler,
 )
+from application.plans.exercise_lookup import ExerciseLookup
 from application.plans.plan_service import TrainingPlanService
 from application.settings import Settings
+from application.stale_while_revalidate import StaleWhileRevalidateCache
 from infrastructure.adapters.broker_adapter import RedisBrokerAdapter
-from infrastructure.adapters.cache_adapter import RedisCacheAdapter
+from infrastructure.adapters.cache_adapter import RedisCacheAdapter, TwoTierCacheAdapter
 from infrastructure.adapters.exercise_adapter import WgerAdapter
+from infrastructure.adapters.exercise_catalog import ExerciseCatalogSync, LocalExerciseClient
+from infrastructure.adapters.lock_adapter import RedisLockManager
+from infrastructure.adapters.stream_broker import RedisStreamBroker
 from infrastructure.adapters.task_dispatcher import TaskiqTaskDispatcher
+from infrastructure.cache.local_cache import LocalCache
+from infrastructure.clients.circuit_breaker import CircuitBreaker
 from infrastructure.clients.exercise_client import WgerClient
 from infrastructure.database.session import Database
 from infrastructure.database.transaction_manager import TransactionManager
+from infrastructure.redis.pubsub_listener import PubSubListener
 from infrastructure.redis.redis_client import RedisClient
+from infrastructure.redis.stream_consumer import StreamConsumer
 from infrastructure.repositories.coach_repository import CoachRepository, PostgresCoachRepository
+from infrastructure.repositories.exercise_catalog_repository import PostgresExerciseCatalogRepository
 from infrastructure.repositories.member_repository import MemberRepository, PostgresMemberRepository
+from infrastructure.repositories.outbox_repository import PostgresOutbox
 from infrastructure.repositories.plan_repository import PostgresTrainingPlanRepository, TrainingPlanRepository
 from infrastructure.taskiq.broker import broker as _taskiq_broker
 
@@ -35,8 +54,33 @@ async def init_redis_client(url: str) -> AsyncIterator[RedisClient]:
     await client.close()
 
 
-async def init_wger_client(base_url: str, timeout: float) -> AsyncIterator[WgerClient]:
-    client = WgerClient(base_url=base_url, timeout=timeout)
+async def init_wger_client(
+    base_url: str,
+    timeout: float,
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+    http2: bool,
+    retry_attempts: int,
+    retry_backoff_seconds: float,
+    retry_backoff_max_seconds: float,
+    hedge_after_seconds: float,
+    breaker_failure_threshold: int,
+    breaker_reset_seconds: float,
+) -> AsyncIterator[WgerClient]:
+    client = WgerClient(
+        base_url=base_url,
+        timeout=timeout,
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+        http2=http2,
+        retry_attempts=retry_attempts,
+        retry_backoff_seconds=retry_backoff_seconds,
+        retry_backoff_max_seconds=retry_backoff_max_seconds,
+        hedge_after_seconds=hedge_after_seconds,
+        breaker=CircuitBreaker(failure_threshold=breaker_failure_threshold, reset_timeout=breaker_reset_seconds),
+    )
     yield client
     await client.close()
 
@@ -45,7 +89,12 @@ class Container(containers.DeclarativeContainer):
     config = providers.Configuration(pydantic_settings=[Settings()])
 
     app_logger = providers.Singleton(ApplicationLogger)
-    event_dispatcher = providers.Singleton(EventDispatcher, app_logger=app_logger)
+    event_dispatcher = providers.Singleton(
+        EventDispatcher,
+        app_logger=app_logger,
+        queue_size=config.events.queue_size,
+        workers_per_event=config.events.workers_per_event,
+    )
 
     database = providers.Singleton(
         Database,
@@ -62,11 +111,90 @@ class Container(containers.DeclarativeContainer):
         init_wger_client,
         base_url=config.exercise_api.base_url,
         timeout=config.exercise_api.timeout,
+        max_connections=config.exercise_api.max_connections,
+        max_keepalive_connections=config.exercise_api.max_keepalive_connections,
+        keepalive_expiry=config.exercise_api.keepalive_expiry,
+        http2=config.exercise_api.http2,
+        retry_attempts=config.exercise_api.retry_attempts,
+        retry_backoff_seconds=config.exercise_api.retry_backoff_seconds,
+        retry_backoff_max_seconds=config.exercise_api.retry_backoff_max_seconds,
+        hedge_after_seconds=config.exercise_api.hedge_after_seconds,
+        breaker_failure_threshold=config.exercise_api.breaker_failure_threshold,
+        breaker_reset_seconds=config.exercise_api.breaker_reset_seconds,
     )
 
-    cache_adapter = providers.Singleton(RedisCacheAdapter, client=redis_client)
-    broker_adapter = providers.Singleton(RedisBrokerAdapter, client=redis_client)
-    exercise_client = providers.Singleton(WgerAdapter, client=wger_client, app_logger=app_logger)
+    redis_cache_adapter = providers.Singleton(RedisCacheAdapter, client=redis_client)
+    local_cache = providers.Singleton(
+        LocalCache,
+        max_bytes=config.cache.local_max_bytes,
+        ttl_seconds=config.cache.local_ttl_seconds,
+    )
+    cache_adapter = providers.Singleton(
+        TwoTierCacheAdapter,
+        remote=redis_cache_adapter,
+        local=local_cache,
+        client=redis_client,
+        channel=config.cache.invalidation_channel,
+        app_logger=app_logger,
+        keep_decoded=config.cache.local_keep_decoded,
+    )
+    # Generations are read from Redis on every use; a locally cached one would
+    # keep serving the old listings or index for the local TTL after a change.
+    coach_listings = providers.Singleton(CacheNamespace, cache=redis_cache_adapter, prefix=COACH_LISTINGS_PREFIX)
+    coach_index_versions = providers.Singleton(CacheNamespace, cache=redis_cache_adapter, prefix=COACH_INDEX_PREFIX)
+    lock_manager = providers.Singleton(RedisLockManager, client=redis_client)
+    refreshing_cache = providers.Singleton(
+        StaleWhileRevalidateCache,
+        cache=cache_adapter,
+        locks=lock_manager,
+        app_logger=app_logger,
+        beta=config.cache.refresh_beta,
+        lock_ttl_seconds=config.cache.refresh_lock_ttl_seconds,
+    )
+    logging_channel_handler = providers.Singleton(LoggingChannelHandler, app_logger=app_logger)
+    channel_handlers = providers.Dict(
+        {
+            "member.registered": logging_channel_handler,
+            "plan.completed": logging_channel_handler,
+        }
+    )
+    message_consumer = providers.Selector(
+        config.broker.backend,
+        pubsub=providers.Singleton(
+            PubSubListener,
+            client=redis_client,
+            handlers=channel_handlers,
+            app_logger=app_logger,
+            max_batch=config.redis.pubsub_max_batch,
+            reconnect_delay_seconds=config.redis.pubsub_reconnect_delay_seconds,
+            reconnect_delay_max_seconds=config.redis.pubsub_reconnect_delay_max_seconds,
+        ),
+        streams=providers.Singleton(
+            StreamConsumer,
+            client=redis_client,
+            handlers=channel_handlers,
+            app_logger=app_logger,
+            group=config.broker.stream_group,
+            batch_size=config.broker.stream_read_count,
+            block_ms=config.broker.stream_block_ms,
+            reclaim_idle_seconds=config.broker.stream_reclaim_idle_seconds,
+            max_deliveries=config.broker.stream_max_deliveries,
+            reconnect_delay_seconds=config.redis.pubsub_reconnect_delay_seconds,
+            reconnect_delay_max_seconds=config.redis.pubsub_reconnect_delay_max_seconds,
+        ),
+    )
+    broker_adapter = providers.Selector(
+        config.broker.backend,
+        pubsub=providers.Singleton(
+            RedisBrokerAdapter,
+            client=redis_client,
+            app_logger=app_logger,
+            max_batch=config.broker.batch_size,
+            max_delay_seconds=config.broker.batch_delay_seconds,
+        ),
+        streams=providers.Singleton(RedisStreamBroker, client=redis_client, maxlen=config.broker.stream_maxlen),
+    )
+    wger_exercise_client = providers.Singleton(WgerAdapter, client=wger_client, app_logger=app_logger)
     taskiq_broker = providers.Object(_taskiq_broker)
     task_dispatcher = providers.Singleton(TaskiqTaskDispatcher, broker=taskiq_broker)
 
@@ -84,6 +212,38 @@ class Container(containers.DeclarativeContainer):
         PostgresTrainingPlanRepository,
         session_factory=database.provided.session,
     )
+    postgres_exercise_catalog_repository = providers.Singleton(
+        PostgresExerciseCatalogRepository,
+        session_factory=database.provided.session,
+    )
+
+    exercise_client = providers.Singleton(
+        LocalExerciseClient,
+        catalog=postgres_exercise_catalog_repository,
+        fallback=wger_exercise_client,
+        app_logger=app_logger,
+    )
+    exercise_catalog = providers.Singleton(
+        ExerciseCatalogSync,
+        catalog=postgres_exercise_catalog_repository,
+        source=wger_exercise_client,
+        app_logger=app_logger,
+        page_size=config.exercise_api.catalog_page_size,
+    )
+
+    outbox = providers.Singleton(PostgresOutbox, session_factory=database.provided.session)
+    # Handlers for events relayed from the outbox, run by the worker only.
+    outbox_dispatcher = providers.Singleton(EventDispatcher, app_logger=app_logger)
+    outbox_relay = providers.Singleton(
+        OutboxRelay,
+        outbox=outbox,
+        transaction_manager=transaction_manager,
+        dispatcher=outbox_dispatcher,
+        app_logger=app_logger,
+        batch_size=config.events.outbox_batch_size,
+        poll_interval_seconds=config.events.outbox_poll_interval_seconds,
+        max_attempts=config.events.outbox_max_attempts,
+    )
 
     member_repository = providers.Singleton(MemberRepository, repo=postgres_member_repository)
     coach_repository = providers.Singleton(CoachRepository, repo=postgres_coach_repository)
@@ -92,9 +252,21 @@ class Container(containers.DeclarativeContainer):
     member_registered_handler = providers.Singleton(
         MemberRegisteredHandler, broker=broker_adapter, app_logger=app_logger
     )
+    coach_matching_index = providers.Singleton(CoachMatchingIndex)
+
     coach_registered_handler = providers.Singleton(
         CoachRegisteredHandler, app_logger=app_logger
     )
+    coach_matching_index_handler = providers.Singleton(
+        CoachMatchingIndexHandler,
+        index=coach_matching_index,
+        coach_repo=coach_repository,
+        app_logger=app_logger,
+        versions=coach_index_versions,
+    )
+    coach_listings_handler = providers.Singleton(
+        CoachListingsInvalidationHandler, listings=coach_listings, app_logger=app_logger
+    )
     session_completed_handler = providers.Singleton(
         SessionCompletedHandler, app_logger=app_logger
     )
@@ -116,6 +288,16 @@ class Container(containers.DeclarativeContainer):
         cache=cache_adapter,
         dispatcher=event_dispatcher,
         app_logger=app_logger,
+        matching_index=coach_matching_index,
+        refreshing_cache=refreshing_cache,
+        listings=coach_listings,
+        index_versions=coach_index_versions,
+    )
+    exercise_lookup = providers.Singleton(
+        ExerciseLookup,
+        cache=refreshing_cache,
+        exercise_client=exercise_client,
+        negative_ttl_seconds=config.exercise_api.negative_cache_ttl_seconds,
     )
     plan_service = providers.Singleton(
         TrainingPlanService,
@@ -125,4 +307,5 @@ class Container(containers.DeclarativeContainer):
         exercise_client=exercise_client,
         dispatcher=event_dispatcher,
         app_logger=app_logger,
+        exercise_lookup=exercise_lookup,
     )
@@ -1,4 +1,5 @@
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -9,6 +10,7 @@ class BaseApplicationContext(ABC):
     def __init__(self) -> None:
         self._container = Container()
         self._logger = self._container.app_logger().get_logger(__name__)
+        self._cache_invalidation_task: asyncio.Task[None] | None = None
 
     @property
     def container(self) -> Container:
@@ -22,10 +24,15 @@ class BaseApplicationContext(ABC):
             await result
 
         await self._register_event_handlers()
+        await self._start_cache_invalidation()
         await self._after_start()
 
     async def stop(self) -> None:
         await self._before_stop()
+        await self._container.event_dispatcher().drain(self._container.config.events.drain_timeout_seconds())
+        broker = await self._container.broker_adapter.async_()
+        await broker.close()
+        await self._stop_cache_invalidation()
 
         result = self._container.shutdown_resources()
         if result is not None:
@@ -42,10 +49,25 @@ class BaseApplicationContext(ABC):
     @abstractmethod
     async def _before_stop(self) -> None: ...
 
+    async def _start_cache_invalidation(self) -> None:
+        cache = await self._container.cache_adapter.async_()
+        self._cache_invalidation_task = asyncio.create_task(
+            cache.listen_for_invalidations(),
+            name="cache-invalidation-listener",
+        )
+
+    async def _stop_cache_invalidation(self) -> None:
+        if self._cache_invalidation_task is not None:
+            self._cache_invalidation_task.cancel()
+            try:
+                await self._cache_invalidation_task
+            except asyncio.CancelledError:
+                pass
+
     async def _register_event_handlers(self) -> None:
         import inspect
 
-        from domain.coaches.events import CoachRegistered
+        from domain.coaches.events import CoachClientAccepted, CoachClientReleased, CoachDeleted, CoachRegistered
         from domain.members.events import MemberRegistered
         from domain.plans.events import PlanCompleted, SessionCompleted
 
@@ -53,8 +75,25 @@ class BaseApplicationContext(ABC):
             result = provider()
             return await result if inspect.isawaitable(result) else result
 
+        # Durable handlers receive events through the outbox relay in the worker,
+        # so they survive a crash and run off the API's event loop.
+        outbox_dispatcher = self._container.outbox_dispatcher()
+        outbox_dispatcher.register(MemberRegistered, (await resolve(self._container.member_registered_handler)).handle)
+        outbox_dispatcher.register(CoachRegistered,  (await resolve(self._container.coach_registered_handler)).handle)
+        outbox_dispatcher.register(SessionCompleted, (await resolve(self._container.session_completed_handler)).handle)
+        outbox_dispatcher.register(PlanCompleted,    (await resolve(self._container.plan_completed_handler)).handle)
+
+        # In-process handlers keep per-process state and caches current right after commit.
         dispatcher = self._container.event_dispatcher()
-        dispatcher.register(MemberRegistered, (await resolve(self._container.member_registered_handler)).handle)
-        dispatcher.register(CoachRegistered,  (await resolve(self._container.coach_registered_handler)).handle)
-        dispatcher.register(SessionCompleted, (await resolve(self._container.session_completed_handler)).handle)
-        dispatcher.register(PlanCompleted,    (await resolve(self._container.plan_completed_handler)).handle)
+        coach_index_handler = await resolve(self._container.coach_matching_index_handler)
+        dispatcher.register(CoachRegistered,     coach_index_handler.handle)
+        dispatcher.register(CoachClientAccepted, coach_index_handler.handle)
+        dispatcher.register(CoachClientReleased, coach_index_handler.handle)
+        dispatcher.register(CoachDeleted,        coach_index_handler.handle)
+
+        # Right after commit, so the writer's next listing read already misses the old entries.
+        listings_handler = await resolve(self._container.coach_listings_handler)
+        dispatcher.register_post_commit(CoachRegistered,     listings_handler.handle)
+        dispatcher.register_post_commit(CoachClientAccepted, listings_handler.handle)
+        dispatcher.register_post_commit(CoachClientReleased, listings_handler.handle)
+        dispatcher.register_post_commit(CoachDeleted,        listings_handler.handle)
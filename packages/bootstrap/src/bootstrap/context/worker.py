@@ -1,18 +1,28 @@
-
+import asyncio
 from typing import override
 
 from bootstrap.context.base import BaseApplicationContext
 
 
 class WorkerApplicationContext(BaseApplicationContext):
+    def __init__(self) -> None:
+        super().__init__()
+        self._relay_task: asyncio.Task[None] | None = None
+
     @override
     async def _before_start(self) -> None:
         pass
 
     @override
     async def _after_start(self) -> None:
-        pass
+        relay = self._container.outbox_relay()
+        self._relay_task = asyncio.create_task(relay.run(), name="outbox-relay")
 
     @override
     async def _before_stop(self) -> None:
-        pass
+        if self._relay_task is not None:
+            self._relay_task.cancel()
+            try:
+                await self._relay_task
+            except asyncio.CancelledError:
+                pass
@@ -23,6 +23,7 @@ class Coach(BaseModel):
     id: int | None = None
 
     _events: list[ApplicationEvent] = PrivateAttr(default_factory=list)  # pyright: ignore[reportUnknownVariableType]
+    _persisted_state: object | None = PrivateAttr(default=None)
 
     @classmethod
     def create(
@@ -57,18 +58,32 @@ class Coach(BaseModel):
     def can_accept_client(self, member_tier: MembershipTier | None = None) -> bool:
         if self.current_client_count >= self.max_clients:
             return False
-        if self.tier == CoachTier.VIP and member_tier != MembershipTier.VIP:
-            return False
-        return True
+        return self.tier_serves(self.tier, member_tier)
+
+    @staticmethod
+    def tier_serves(coach_tier: CoachTier, member_tier: MembershipTier | None) -> bool:
+        return coach_tier != CoachTier.VIP or member_tier == MembershipTier.VIP
 
     def accept_client(self) -> None:
         if self.current_client_count >= self.max_clients:
             raise ValueError("Coach is at full capacity")
         self.current_client_count += 1
+        if self.id is not None:
+            from domain.coaches.events import CoachClientAccepted
+
+            self._events.append(
+                CoachClientAccepted(coach_id=self.id, current_client_count=self.current_client_count)
+            )
 
     def release_client(self) -> None:
         if self.current_client_count > 0:
             self.current_client_count -= 1
+            if self.id is not None:
+                from domain.coaches.events import CoachClientReleased
+
+                self._events.append(
+                    CoachClientReleased(coach_id=self.id, current_client_count=self.current_client_count)
+                )
 
     def add_certification(self, cert: Certification) -> None:
         self.certifications.append(cert)
@@ -79,3 +94,11 @@ class Coach(BaseModel):
     def pull_events(self) -> list[ApplicationEvent]:
         events, self._events = self._events, []
         return events
+
+    @property
+    def persisted_state(self) -> object | None:
+        """Snapshot stored by the repository on load/save, diffed on the next save."""
+        return self._persisted_state
+
+    def mark_persisted(self, state: object) -> None:
+        self._persisted_state = state
@@ -6,3 +6,17 @@ class CoachRegistered(ApplicationEvent):
     coach_id: int | None
     email: str
     full_name: str
+
+
+class CoachClientAccepted(ApplicationEvent):
+    coach_id: int
+    current_client_count: int
+
+
+class CoachClientReleased(ApplicationEvent):
+    coach_id: int
+    current_client_count: int
+
+
+class CoachDeleted(ApplicationEvent):
+    coach_id: int
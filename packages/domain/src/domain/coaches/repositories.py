@@ -1,22 +1,44 @@
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Collection
 
 from domain.coaches.coach import Coach
 from domain.coaches.value_objects import Specialization
+from domain.members.value_objects import MembershipTier
 
 
 class ICoachRepository(ABC):
     @abstractmethod
     async def get_by_id(self, id: int) -> Coach: ...
 
+    @abstractmethod
+    async def get_by_ids(self, ids: Collection[int]) -> list[Coach]: ...
+
     @abstractmethod
     async def get_by_email(self, email: str) -> Coach | None: ...
 
     @abstractmethod
-    async def find_by_specialization(self, spec: Specialization) -> list[Coach]: ...
+    async def exists_by_email(self, email: str) -> bool: ...
+
+    @abstractmethod
+    async def find_by_specialization(self, spec: Specialization, with_children: bool = True) -> list[Coach]: ...
+
+    @abstractmethod
+    async def find_match_candidates(
+        self,
+        goal_specs: Collection[Specialization],
+        member_tier: MembershipTier | None,
+        limit: int,
+    ) -> list[Coach]: ...
+
+    @abstractmethod
+    async def get_all(self, with_children: bool = True) -> list[Coach]: ...
+
+    @abstractmethod
+    async def get_page(self, after: int | None, limit: int, with_children: bool = True) -> list[Coach]: ...
 
     @abstractmethod
-    async def get_all(self) -> list[Coach]: ...
+    def stream_all(self, with_children: bool = True) -> AsyncIterator[Coach]: ...
 
     @abstractmethod
     async def save(self, coach: Coach) -> Coach: ...
@@ -26,6 +26,7 @@ class Member(BaseModel):
     id: int | None = None
 
     _events: list[ApplicationEvent] = PrivateAttr(default_factory=list)  # pyright: ignore[reportUnknownVariableType]
+    _persisted_state: object | None = PrivateAttr(default=None)
 
     @classmethod
     def create(
@@ -113,3 +114,11 @@ class Member(BaseModel):
     def pull_events(self) -> list[ApplicationEvent]:
         events, self._events = self._events, []
         return events
+
+    @property
+    def persisted_state(self) -> object | None:
+        """Snapshot stored by the repository on load/save, diffed on the next save."""
+        return self._persisted_state
+
+    def mark_persisted(self, state: object) -> None:
+        self._persisted_state = state
@@ -1,5 +1,6 @@
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Collection
 
 from domain.members.member import Member
 
@@ -8,9 +9,15 @@ class IMemberRepository(ABC):
     @abstractmethod
     async def get_by_id(self, id: int) -> Member: ...
 
+    @abstractmethod
+    async def get_by_ids(self, ids: Collection[int]) -> list[Member]: ...
+
     @abstractmethod
     async def get_by_email(self, email: str) -> Member | None: ...
 
+    @abstractmethod
+    async def exists_by_email(self, email: str) -> bool: ...
+
     @abstractmethod
     async def save(self, member: Member) -> Member: ...
 
@@ -19,3 +26,9 @@ class IMemberRepository(ABC):
 
     @abstractmethod
     async def get_all(self) -> list[Member]: ...
+
+    @abstractmethod
+    async def get_page(self, after: int | None, limit: int) -> list[Member]: ...
+
+    @abstractmethod
+    def stream_all(self) -> AsyncIterator[Member]: ...
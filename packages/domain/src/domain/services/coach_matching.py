@@ -14,11 +14,16 @@ _GOAL_TO_SPEC: dict[GoalType, set[Specialization]] = {
 
 class CoachMatchingService:
     @staticmethod
-    def find_best_coach(member: Member, coaches: list[Coach]) -> Coach | None:
-        member_tier = member.membership.tier
+    def goal_specializations(member: Member) -> set[Specialization]:
         goal_specs: set[Specialization] = set()
         for goal in member.goals:
             goal_specs.update(_GOAL_TO_SPEC.get(goal.type, set()))
+        return goal_specs
+
+    @staticmethod
+    def find_best_coach(member: Member, coaches: list[Coach]) -> Coach | None:
+        member_tier = member.membership.tier
+        goal_specs = CoachMatchingService.goal_specializations(member)
 
         candidates = [
             c for c in coaches
@@ -1,8 +1,19 @@
 
 import re
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import ClassVar
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, ValidationInfo, field_validator
+
+# Validation context for data read back from our own storage: every field is
+# still built and coerced, but format checks the data passed when it was
+# written are skipped. API input is validated without it.
+TRUSTED: Mapping[str, bool] = MappingProxyType({"trusted": True})
+
+
+def is_trusted(info: ValidationInfo) -> bool:
+    return info.context is TRUSTED
 
 
 class FullName(BaseModel):
@@ -33,8 +44,8 @@ class Email(BaseModel):
 
     @field_validator("value")
     @classmethod
-    def valid_email(cls, v: str) -> str:
-        if not cls._PATTERN.match(v):
+    def valid_email(cls, v: str, info: ValidationInfo) -> str:
+        if not is_trusted(info) and not cls._PATTERN.match(v):
             raise ValueError(f"Invalid email: {v!r}")
         return v
 
@@ -48,7 +59,7 @@ class PhoneNumber(BaseModel):
 
     @field_validator("value")
     @classmethod
-    def valid_phone(cls, v: str) -> str:
-        if not cls._PATTERN.match(v):
+    def valid_phone(cls, v: str, info: ValidationInfo) -> str:
+        if not is_trusted(info) and not cls._PATTERN.match(v):
             raise ValueError(f"Invalid phone number: {v!r}")
         return v
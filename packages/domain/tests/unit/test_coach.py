@@ -3,7 +3,7 @@
 import pytest
 
 from domain.coaches.coach import Coach
-from domain.coaches.events import CoachRegistered
+from domain.coaches.events import CoachClientAccepted, CoachClientReleased, CoachRegistered
 from domain.coaches.value_objects import CoachTier, Specialization
 from domain.members.value_objects import MembershipTier
 
@@ -61,6 +61,18 @@ class TestCapacity:
         coach.release_client()
         assert coach.current_client_count == 0
 
+    def test_persisted_coach_emits_capacity_events(self):
+        coach = _coach(max_clients=5)
+        coach.id = 7
+        coach.pull_events()
+        coach.accept_client()
+        coach.release_client()
+        coach.release_client()
+        assert coach.pull_events() == [
+            CoachClientAccepted(coach_id=7, current_client_count=1),
+            CoachClientReleased(coach_id=7, current_client_count=0),
+        ]
+
 
 class TestVIPTierRestriction:
     def test_vip_coach_rejects_non_vip_member(self):
@@ -1,14 +1,65 @@
-
+import asyncio
+import contextvars
 from typing import override
 
+from application.core.logger import ILogger
 from application.core.ports import IMessageBroker
 from infrastructure.redis.redis_client import RedisClient
 
 
 class RedisBrokerAdapter(IMessageBroker):
-    def __init__(self, client: RedisClient) -> None:
+    """Publishes to Redis pub/sub, optionally in micro-batches.
+
+    With ``max_batch`` > 1 messages are buffered and sent in one pipeline once
+    ``max_batch`` are waiting or ``max_delay_seconds`` after the first one,
+    whichever comes first. ``publish`` then returns as soon as the message is
+    buffered, or after the flush it triggered. A failed flush is logged and its
+    messages are lost, as pub/sub gives no delivery guarantee anyway. ``close``
+    flushes whatever is left and must run on shutdown.
+    """
+
+    def __init__(
+        self,
+        client: RedisClient,
+        app_logger: ILogger,
+        max_batch: int = 1,
+        max_delay_seconds: float = 0.005,
+    ) -> None:
         self._client = client
+        self._log = app_logger.get_logger(__name__)
+        self._max_batch = max_batch
+        self._max_delay = max_delay_seconds
+        self._pending: list[tuple[str, str]] = []
+        self._timer: asyncio.Task[None] | None = None
 
     @override
     async def publish(self, channel: str, message: str) -> None:
-        await self._client.publish(channel, message)
+        if self._max_batch <= 1:
+            await self._client.publish(channel, message)
+            return
+        self._pending.append((channel, message))
+        if len(self._pending) >= self._max_batch:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later(), context=contextvars.Context())
+
+    async def flush(self) -> None:
+        """Send all buffered messages now."""
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        try:
+            await self._client.publish_many(batch)
+        except Exception as exc:
+            self._log.error("Dropped %d broker message(s), publish failed: %s", len(batch), exc, exc_info=exc)
+
+    async def close(self) -> None:
+        await self.flush()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._max_delay)
+        self._timer = None
+        await self.flush()
@@ -1,9 +1,45 @@
+import asyncio
+import json
+import uuid
+from collections.abc import Mapping, Sequence
+from typing import Any, cast, override
 
-from typing import override
+from pydantic import BaseModel, TypeAdapter
 
+from application.core.logger import ILogger
 from application.core.ports import ICache
+from infrastructure.cache.local_cache import CacheStats, LocalCache
 from infrastructure.redis.redis_client import RedisClient
 
+_RECONNECT_DELAY_SECONDS = 1.0
+
+
+def _unshared[T](value: T) -> T:
+    """Copy of ``value`` that shares only frozen models and other immutable leaves.
+
+    Lists and mutable models, including their private attributes, are copied
+    without re-running validation, so the copy is as valid as the original.
+    """
+    return cast(T, _copy_mutable(value))
+
+
+def _copy_mutable(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_copy_mutable(item) for item in cast(list[Any], value)]
+    if isinstance(value, dict):
+        return {key: _copy_mutable(item) for key, item in cast(dict[Any, Any], value).items()}
+    if isinstance(value, BaseModel) and not value.model_config.get("frozen"):
+        copy = object.__new__(type(value))
+        private = value.__pydantic_private__
+        object.__setattr__(copy, "__dict__", {name: _copy_mutable(item) for name, item in value.__dict__.items()})
+        object.__setattr__(copy, "__pydantic_fields_set__", set(value.__pydantic_fields_set__))
+        object.__setattr__(copy, "__pydantic_extra__", _copy_mutable(value.__pydantic_extra__))
+        object.__setattr__(
+            copy, "__pydantic_private__", None if private is None else {k: _copy_mutable(v) for k, v in private.items()}
+        )
+        return copy
+    return value
+
 
 class RedisCacheAdapter(ICache):
     def __init__(self, client: RedisClient) -> None:
@@ -20,3 +56,174 @@ class RedisCacheAdapter(ICache):
     @override
     async def delete(self, key: str) -> None:
         await self._client.delete(key)
+
+    @override
+    async def incr(self, key: str) -> int:
+        return await self._client.incr(key)
+
+    @override
+    async def get_many(self, keys: Sequence[str]) -> list[str | None]:
+        return await self._client.mget(keys) if keys else []
+
+    @override
+    async def set_many(self, items: Mapping[str, str], ttl_seconds: int) -> None:
+        if items:
+            await self._client.set_many(items, ttl_seconds)
+
+    @override
+    async def get_model[T](self, key: str, adapter: TypeAdapter[T]) -> T | None:
+        raw = await self._client.get(key)
+        return None if raw is None else adapter.validate_json(raw)
+
+    @override
+    async def set_model[T](self, key: str, value: T, adapter: TypeAdapter[T], ttl_seconds: int) -> None:
+        await self._client.set(key, adapter.dump_json(value).decode(), ttl_seconds)
+
+
+class TwoTierCacheAdapter(ICache):
+    """Read-through ``LocalCache`` in front of Redis.
+
+    Writes and deletes are broadcast on ``channel`` so every other process evicts
+    its local copy; ``listen_for_invalidations`` must run in each process for that
+    to happen. The local TTL bounds staleness if an invalidation message is missed.
+
+    With ``keep_decoded`` the local tier also holds the objects decoded by
+    ``get_model``/``set_model``, so a local hit skips re-validation. Every caller
+    gets its own copy of them, so mutating a result never reaches the cache.
+    """
+
+    def __init__(
+        self,
+        remote: ICache,
+        local: LocalCache,
+        client: RedisClient,
+        channel: str,
+        app_logger: ILogger,
+        keep_decoded: bool = False,
+    ) -> None:
+        self._remote = remote
+        self._local = local
+        self._client = client
+        self._channel = channel
+        self._keep_decoded = keep_decoded
+        self._origin = uuid.uuid4().hex
+        self._log = app_logger.get_logger(__name__)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._local.stats
+
+    @override
+    async def get(self, key: str) -> str | None:
+        value = self._local.get(key)
+        if value is not None:
+            return value
+        value = await self._remote.get(key)
+        if value is not None:
+            self._local.set(key, value)
+        return value
+
+    @override
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        await self._remote.set(key, value, ttl_seconds)
+        self._local.set(key, value, ttl_seconds)
+        await self._broadcast_invalidation(key)
+
+    @override
+    async def get_many(self, keys: Sequence[str]) -> list[str | None]:
+        values = [self._local.get(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            fetched = await self._remote.get_many([keys[i] for i in missing])
+            for i, value in zip(missing, fetched, strict=True):
+                if value is not None:
+                    self._local.set(keys[i], value)
+                values[i] = value
+        return values
+
+    @override
+    async def set_many(self, items: Mapping[str, str], ttl_seconds: int) -> None:
+        await self._remote.set_many(items, ttl_seconds)
+        for key, value in items.items():
+            self._local.set(key, value, ttl_seconds)
+        await self._broadcast_invalidation(*items)
+
+    @override
+    async def get_model[T](self, key: str, adapter: TypeAdapter[T]) -> T | None:
+        entry = self._local.get_entry(key)
+        if entry is not None:
+            if entry.decoded_with is adapter:
+                return _unshared(cast(T, entry.decoded))
+            value = adapter.validate_json(entry.value)
+            if not self._keep_decoded:
+                return value
+            entry.decoded, entry.decoded_with = value, adapter
+            return _unshared(value)
+        raw = await self._remote.get(key)
+        if raw is None:
+            return None
+        value = adapter.validate_json(raw)
+        self._store_local(key, raw, value, adapter)
+        return _unshared(value) if self._keep_decoded else value
+
+    @override
+    async def set_model[T](self, key: str, value: T, adapter: TypeAdapter[T], ttl_seconds: int) -> None:
+        raw = adapter.dump_json(value).decode()
+        await self._remote.set(key, raw, ttl_seconds)
+        self._store_local(key, raw, _unshared(value) if self._keep_decoded else value, adapter, ttl_seconds)
+        await self._broadcast_invalidation(key)
+
+    @override
+    async def delete(self, key: str) -> None:
+        self._local.invalidate(key)
+        await self._remote.delete(key)
+        await self._broadcast_invalidation(key)
+
+    @override
+    async def incr(self, key: str) -> int:
+        self._local.invalidate(key)
+        value = await self._remote.incr(key)
+        await self._broadcast_invalidation(key)
+        return value
+
+    async def listen_for_invalidations(self) -> None:
+        """Evict local entries written or deleted by other processes until cancelled."""
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)  # pyright: ignore[reportUnknownMemberType]
+                # Anything cached before the subscription is unconfirmed.
+                self._local.clear()
+                async for message in pubsub.listen():  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+                    if message.get("type") == "message":  # pyright: ignore[reportUnknownMemberType]
+                        self._handle_invalidation(message["data"])  # pyright: ignore[reportUnknownArgumentType]
+            except asyncio.CancelledError:
+                await pubsub.aclose()
+                raise
+            except Exception as exc:
+                self._log.warning("Cache invalidation listener failed, reconnecting: %s", exc)
+                await pubsub.aclose()
+                await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+    def _store_local[T](
+        self,
+        key: str,
+        raw: str,
+        value: T,
+        adapter: TypeAdapter[T],
+        ttl_seconds: float | None = None,
+    ) -> None:
+        if self._keep_decoded:
+            self._local.set(key, raw, ttl_seconds, decoded=value, decoded_with=adapter)
+        else:
+            self._local.set(key, raw, ttl_seconds)
+
+    async def _broadcast_invalidation(self, *keys: str) -> None:
+        await self._client.publish_many(
+            [(self._channel, json.dumps({"origin": self._origin, "key": key})) for key in keys]
+        )
+
+    def _handle_invalidation(self, data: str) -> None:
+        payload = json.loads(data)
+        if payload["origin"] != self._origin:
+            self._local.invalidate(payload["key"])
@@ -1,10 +1,15 @@
-
+from collections.abc import AsyncIterator
 from typing import override
 
+import httpx
+
 from application.core.logger import ILogger
-from application.core.ports import IExerciseClient
+from application.core.ports import ExerciseApiUnavailableError, IExerciseClient
+from infrastructure.clients.circuit_breaker import CircuitOpenError
 from infrastructure.clients.exercise_client import WgerClient
 
+_ENGLISH = 2  # wger language id
+
 
 class WgerAdapter(IExerciseClient):
     def __init__(self, client: WgerClient, app_logger: ILogger) -> None:
@@ -14,34 +19,47 @@ class WgerAdapter(IExerciseClient):
     @override
     async def get_exercise(self, exercise_id: str) -> dict[str, object] | None:
         try:
-            response = await self._client.client.get(f"/exercise/{exercise_id}/")
+            response = await self._client.get(f"/exercise/{exercise_id}/")
             if response.status_code == 404:
                 return None
             response.raise_for_status()
             return response.json()  # type: ignore[no-any-return]
-        except Exception as exc:
+        except (httpx.HTTPError, CircuitOpenError, ValueError) as exc:
             self._log.warning("wger get_exercise(%s) failed: %s", exercise_id, exc)
-            return None
+            raise ExerciseApiUnavailableError(str(exc)) from exc
 
     @override
     async def search_exercises(self, name: str) -> list[dict[str, object]]:
         try:
-            response = await self._client.client.get(
+            response = await self._client.get(
                 "/exercise/search/",
                 params={"term": name, "language": "english", "format": "json"},
             )
             response.raise_for_status()
             data = response.json()
-            suggestions = data.get("suggestions", [])
-            results: list[dict[str, object]] = []
-            for s in suggestions:
-                results.append(
-                    {
-                        "exercise_id": str(s.get("data", {}).get("id", "")),
-                        "name": s.get("value", name),
-                    }
-                )
-            return results
-        except Exception as exc:
+        except (httpx.HTTPError, CircuitOpenError, ValueError) as exc:
             self._log.warning("wger search_exercises(%r) failed: %s", name, exc)
-            return []
+            raise ExerciseApiUnavailableError(str(exc)) from exc
+        return [
+            {
+                "exercise_id": str(s.get("data", {}).get("id", "")),
+                "name": s.get("value", name),
+            }
+            for s in data.get("suggestions", [])
+        ]
+
+    async def iter_catalog(self, page_size: int = 200) -> AsyncIterator[list[dict[str, object]]]:
+        """Yield the English exercise catalog (``id``, ``name``) page by page.
+
+        Errors propagate, so a sync never mistakes a failed download for an
+        empty catalog.
+        """
+        url: str | None = "/exercise-translation/"
+        params: dict[str, str | int] | None = {"language": _ENGLISH, "limit": page_size, "format": "json"}
+        while url:
+            response = await self._client.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
+            yield [{"id": r["id"], "name": r.get("name", "")} for r in data.get("results", [])]
+            # ``next`` is an absolute URL that already carries the query string.
+            url, params = data.get("next"), None
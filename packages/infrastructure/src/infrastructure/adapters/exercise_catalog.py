@@ -0,0 +1,77 @@
+from datetime import UTC, datetime
+from typing import override
+
+from application.core.logger import ILogger
+from application.core.ports import IExerciseCatalog, IExerciseClient
+from infrastructure.adapters.exercise_adapter import WgerAdapter
+from infrastructure.database.models.exercise_models import ExerciseCatalogORM
+from infrastructure.repositories.exercise_catalog_repository import PostgresExerciseCatalogRepository
+
+DEFAULT_SEARCH_LIMIT = 10
+
+
+def _as_search_result(orm: ExerciseCatalogORM) -> dict[str, object]:
+    return {"exercise_id": str(orm.id), "name": orm.name}
+
+
+class LocalExerciseClient(IExerciseClient):
+    """Searches the local catalog mirror and asks ``fallback`` only for names it does not know."""
+
+    def __init__(
+        self,
+        catalog: PostgresExerciseCatalogRepository,
+        fallback: IExerciseClient,
+        app_logger: ILogger,
+        search_limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> None:
+        self._catalog = catalog
+        self._fallback = fallback
+        self._search_limit = search_limit
+        self._log = app_logger.get_logger(__name__)
+
+    @override
+    async def get_exercise(self, exercise_id: str) -> dict[str, object] | None:
+        if exercise_id.isdigit() and (orm := await self._catalog.find_by_id(int(exercise_id))) is not None:
+            return {"id": orm.id, "name": orm.name}
+        return await self._fallback.get_exercise(exercise_id)
+
+    @override
+    async def search_exercises(self, name: str) -> list[dict[str, object]]:
+        matches = await self._catalog.search(name, self._search_limit)
+        if matches:
+            return [_as_search_result(m) for m in matches]
+        self._log.debug("Exercise %r not in the local catalog, searching wger", name)
+        return await self._fallback.search_exercises(name)
+
+
+class ExerciseCatalogSync(IExerciseCatalog):
+    """Mirrors the wger exercise catalog into ``exercise_catalog``."""
+
+    def __init__(
+        self,
+        catalog: PostgresExerciseCatalogRepository,
+        source: WgerAdapter,
+        app_logger: ILogger,
+        page_size: int = 200,
+    ) -> None:
+        self._catalog = catalog
+        self._source = source
+        self._page_size = page_size
+        self._log = app_logger.get_logger(__name__)
+
+    @override
+    async def sync(self) -> int:
+        """Upsert every catalog page, then drop entries wger no longer lists.
+
+        A failed page aborts the sync before anything is deleted, so the mirror
+        never shrinks because of a partial download.
+        """
+        started = datetime.now(UTC)
+        synced = 0
+        async for page in self._source.iter_catalog(self._page_size):
+            rows = [{"id": int(str(e["id"])), "name": str(e["name"])} for e in page if e.get("name")]
+            await self._catalog.upsert_many(rows, started)
+            synced += len(rows)
+        removed = await self._catalog.delete_synced_before(started) if synced else 0
+        self._log.info("Exercise catalog synced: %d exercises, %d removed", synced, removed)
+        return synced
@@ -0,0 +1,25 @@
+import uuid
+from typing import override
+
+from application.core.ports import ILockManager
+from infrastructure.redis.redis_client import RedisClient
+
+
+class RedisLockManager(ILockManager):
+    """Best-effort mutual exclusion across processes via ``SET NX PX``.
+
+    The lock expires after ``ttl_seconds`` even if its holder dies; release only
+    deletes it while it still carries the holder's token.
+    """
+
+    def __init__(self, client: RedisClient) -> None:
+        self._client = client
+
+    @override
+    async def try_acquire(self, name: str, ttl_seconds: float) -> str | None:
+        token = uuid.uuid4().hex
+        return token if await self._client.set_if_absent(name, token, ttl_seconds) else None
+
+    @override
+    async def release(self, name: str, token: str) -> None:
+        await self._client.delete_if_equals(name, token)
@@ -0,0 +1,26 @@
+from typing import override
+
+from application.core.ports import IMessageBroker
+from infrastructure.redis.redis_client import RedisClient
+
+DATA_FIELD = "data"
+
+
+class RedisStreamBroker(IMessageBroker):
+    """Appends each message to the Redis stream named after its channel.
+
+    Unlike pub/sub, entries stay in the stream (trimmed to about ``maxlen``) until
+    every consumer group has read them, so nothing is lost while consumers restart;
+    see ``StreamConsumer``.
+    """
+
+    def __init__(self, client: RedisClient, maxlen: int | None = 100_000) -> None:
+        self._client = client
+        self._maxlen = maxlen
+
+    @override
+    async def publish(self, channel: str, message: str) -> None:
+        await self._client.xadd(channel, {DATA_FIELD: message}, maxlen=self._maxlen)
+
+    async def close(self) -> None:
+        """Nothing is buffered; present so either broker can be closed on shutdown."""
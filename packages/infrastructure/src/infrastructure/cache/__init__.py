@@ -0,0 +1,3 @@
+from infrastructure.cache.local_cache import CacheEntry, CacheStats, LocalCache
+
+__all__ = ["CacheEntry", "CacheStats", "LocalCache"]
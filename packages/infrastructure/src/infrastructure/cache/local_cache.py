@@ -0,0 +1,110 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    value: str
+    size: int
+    expires_at: float
+    decoded: object | None = None
+    decoded_with: object | None = None
+
+
+class LocalCache:
+    """Per-process LRU cache with a TTL per entry and a total size budget in bytes.
+
+    An entry may also carry the object decoded from ``value`` together with the decoder
+    that produced it, so repeated reads skip decoding. Decoded objects are shared
+    between readers and must be treated as read-only.
+
+    Not thread-safe; meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self.stats = CacheStats()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        entry = self.get_entry(key)
+        return None if entry is None else entry.value
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry
+
+    def set(
+        self,
+        key: str,
+        value: str,
+        ttl_seconds: float | None = None,
+        decoded: object | None = None,
+        decoded_with: object | None = None,
+    ) -> None:
+        size = len(value.encode())
+        if key in self._entries:
+            self._remove(key)
+        if size > self._max_bytes:
+            return
+        ttl = self._ttl_seconds if ttl_seconds is None else min(ttl_seconds, self._ttl_seconds)
+        self._entries[key] = CacheEntry(
+            value=value,
+            size=size,
+            expires_at=self._clock() + ttl,
+            decoded=decoded,
+            decoded_with=decoded_with,
+        )
+        self._size += size
+        while self._size > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        if key in self._entries:
+            self._remove(key)
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: str) -> None:
+        self._size -= self._entries.pop(key).size
@@ -0,0 +1,67 @@
+import time
+from collections.abc import Callable
+from enum import StrEnum
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fails calls fast after ``failure_threshold`` consecutive failures.
+
+    Once ``reset_timeout`` has passed, the circuit is half-open and lets one
+    trial call through. Success closes it again; failure re-opens it for
+    another ``reset_timeout``. A trial that never reports back is replaced
+    after the same timeout, so a cancelled call cannot wedge the circuit.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_started_at: float | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at < self._reset_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def before_call(self) -> None:
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        now = self._clock()
+        if state is CircuitState.HALF_OPEN and (
+            self._trial_started_at is None or now - self._trial_started_at >= self._reset_timeout
+        ):
+            self._trial_started_at = now
+            return
+        raise CircuitOpenError(f"circuit open after {self._failures} consecutive failures")
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial_started_at = None
+        if self._opened_at is not None or self._failures >= self._failure_threshold:
+            self._opened_at = self._clock()
@@ -1,16 +1,106 @@
+import asyncio
+import random
+from collections.abc import Awaitable, Callable, Mapping
 
 import httpx
 
+from infrastructure.clients.circuit_breaker import CircuitBreaker
+
+type QueryParams = Mapping[str, str | int | float | bool] | None
+
+_RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+
 
 class WgerClient:
-    """HTTP client for the wger.de exercise API."""
+    """HTTP client for the wger.de exercise API.
+
+    Connections are pooled (HTTP/2 when ``http2`` is set). ``get`` goes through
+    a circuit breaker, retries transport errors and retryable statuses with
+    full-jitter exponential backoff, and hedges an attempt that is still
+    running after ``hedge_after_seconds`` with a second request, taking
+    whichever answers first.
+    """
 
-    def __init__(self, base_url: str = "https://wger.de/api/v2", timeout: float = 10.0) -> None:
+    def __init__(
+        self,
+        base_url: str = "https://wger.de/api/v2",
+        timeout: float = 3.0,
+        *,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        retry_attempts: int = 2,
+        retry_backoff_seconds: float = 0.2,
+        retry_backoff_max_seconds: float = 2.0,
+        hedge_after_seconds: float | None = 1.0,
+        breaker: CircuitBreaker | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
         self.client = httpx.AsyncClient(
             base_url=base_url,
             timeout=timeout,
             headers={"Accept": "application/json"},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            transport=transport,
         )
+        self.breaker = breaker or CircuitBreaker()
+        self._retry_attempts = retry_attempts
+        self._backoff = retry_backoff_seconds
+        self._backoff_max = retry_backoff_max_seconds
+        self._hedge_after = hedge_after_seconds or None
+        self._sleep = sleep
+
+    async def get(self, url: str, params: QueryParams = None) -> httpx.Response:
+        """GET ``url``; raises ``CircuitOpenError`` without calling wger while the circuit is open.
+
+        A retryable status that survives every retry is returned as is, so the
+        caller's ``raise_for_status`` reports it.
+        """
+        self.breaker.before_call()
+        attempt = 0
+        while True:
+            try:
+                response = await self._hedged_get(url, params)
+            except httpx.TransportError:
+                if attempt >= self._retry_attempts:
+                    self.breaker.record_failure()
+                    raise
+            else:
+                if response.status_code not in _RETRYABLE_STATUS and response.status_code < 500:
+                    self.breaker.record_success()
+                    return response
+                if attempt >= self._retry_attempts:
+                    self.breaker.record_failure()
+                    return response
+            await self._sleep(random.uniform(0, min(self._backoff_max, self._backoff * 2**attempt)))
+            attempt += 1
+
+    async def _hedged_get(self, url: str, params: QueryParams) -> httpx.Response:
+        if self._hedge_after is None:
+            return await self.client.get(url, params=params)
+        attempts = [asyncio.create_task(self.client.get(url, params=params))]
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=self._hedge_after)
+            if not done:
+                attempts.append(asyncio.create_task(self.client.get(url, params=params)))
+            pending = set(attempts)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                if not pending:
+                    return next(iter(done)).result()
+        finally:
+            for task in attempts:
+                task.cancel()
 
     async def close(self) -> None:
         await self.client.aclose()
@@ -1,36 +1,98 @@
-from collections.abc import Callable
+import typing
+from collections.abc import AsyncIterator, Callable, Collection, Sequence
 from contextlib import AbstractAsyncContextManager
+from itertools import batched
+from typing import Literal
 
-from sqlalchemy import func
+from sqlalchemy import ColumnElement, Table, cast, column, func, insert, inspect, literal, update, values
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
 
 from infrastructure.database.base import Base
 from infrastructure.database.exceptions import EntityNotFoundException
 
 type SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+type LoadProfile = Literal["full", "shallow"] | Sequence[str]
+"""Relationships to load: ``"full"`` uses the model's own loaders, ``"shallow"`` loads
+none (touching one raises) and a list of relationship names loads only those."""
+
+DEFAULT_BULK_CHUNK_SIZE = 1000
+_MAX_BIND_PARAMS = 32767  # PostgreSQL limit per statement
 
 
 class BaseRepository[T: Base, ID]:
     def __init__(self, model: type[T], session_factory: SessionFactory) -> None:
         self._model = model
         self._session_factory = session_factory
+        self._pk = inspect(model).primary_key[0]
+
+    def _load_options(self, load: LoadProfile) -> list[ORMOption]:
+        if load == "full":
+            return []
+        names = [] if load == "shallow" else list(load)
+        relationships = inspect(self._model).relationships
+        if unknown := set(names) - set(relationships.keys()):
+            raise ValueError(f"{self._model.__name__} has no relationships {sorted(unknown)}")
+        return [*(selectinload(relationships[name].class_attribute) for name in names), raiseload("*")]
+
+    def _select(self, load: LoadProfile = "full") -> SelectOfScalar[T]:
+        """``SELECT`` of the model that loads the relationships of ``load``.
 
-    async def find_by_id(self, id: ID) -> T | None:
+        Rows already in the session are repopulated, so the profile applies to
+        them too and an instance left shallow by one call is reloaded by the next.
+        """
+        return select(self._model).options(*self._load_options(load)).execution_options(populate_existing=True)
+
+    async def find_by_id(self, id: ID, load: LoadProfile = "full") -> T | None:
         async with self._session_factory() as session:
-            return await session.get(self._model, id)
+            return await session.get(self._model, id, options=self._load_options(load), populate_existing=True)
 
-    async def find_all(self) -> list[T]:
+    async def find_all(self, load: LoadProfile = "full") -> list[T]:
         async with self._session_factory() as session:
-            result = await session.exec(select(self._model))
+            result = await session.exec(self._select(load))
+            return list(result.all())
+
+    async def find_by_ids(self, ids: Collection[ID], load: LoadProfile = "full") -> list[T]:
+        if not ids:
+            return []
+        async with self._session_factory() as session:
+            result = await session.exec(self._select(load).where(self._pk.in_(ids)))
+            return list(result.all())
+
+    async def find_page(self, after: ID | None, limit: int, load: LoadProfile = "full") -> list[T]:
+        """Keyset page ordered by primary key: rows with ``id > after``, at most ``limit``."""
+        stmt = self._select(load).order_by(self._pk).limit(limit)
+        if after is not None:
+            stmt = stmt.where(self._pk > after)
+        async with self._session_factory() as session:
+            result = await session.exec(stmt)
             return list(result.all())
 
-    async def get_by_id(self, id: ID) -> T:
-        r = await self.find_by_id(id)
+    async def stream_all(self, batch_size: int = 500, load: LoadProfile = "full") -> AsyncIterator[T]:
+        """Yield every row from a server-side cursor, ``batch_size`` rows at a time."""
+        stmt = self._select(load).order_by(self._pk).execution_options(yield_per=batch_size)
+        async with self._session_factory() as session:
+            result = await session.stream_scalars(stmt)
+            async for entity in result:
+                yield entity
+
+    async def get_by_id(self, id: ID, load: LoadProfile = "full") -> T:
+        r = await self.find_by_id(id, load)
         if r is None:
             raise EntityNotFoundException(self._model.__name__, id)
         return r
 
+    async def exists_where(self, *criteria: ColumnElement[bool]) -> bool:
+        """``SELECT 1 ... LIMIT 1`` for ``criteria``; no entity or relationship is loaded."""
+        async with self._session_factory() as session:
+            result = await session.exec(
+                select(literal(1)).select_from(self._model).where(*criteria).limit(1)
+            )
+            return result.first() is not None
+
     async def save(self, entity: T) -> T:
         async with self._session_factory() as session:
             if entity.is_new:
@@ -40,7 +102,15 @@ class BaseRepository[T: Base, ID]:
             await session.flush()
             return entity
 
-    async def save_all(self, entities: list[T]) -> list[T]:
+    async def save_all(
+        self,
+        entities: list[T],
+        *,
+        bulk: bool = False,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> list[T]:
+        if bulk:
+            return await self._bulk_save_all(entities, chunk_size)
         async with self._session_factory() as session:
             result: list[T] = []
             for entity in entities:
@@ -52,6 +122,46 @@ class BaseRepository[T: Base, ID]:
             await session.flush()
             return result
 
+    async def _bulk_save_all(self, entities: list[T], chunk_size: int) -> list[T]:
+        """Write ``entities`` with one multi-row statement per chunk.
+
+        New rows go through ``INSERT ... VALUES (...), (...) RETURNING id`` and get the
+        generated ids assigned back; existing rows are updated with a single
+        ``UPDATE ... FROM (VALUES ...)`` (PostgreSQL syntax; values are cast back to the
+        column types so all-NULL columns are not inferred as text). Only the model's own
+        columns are written, relationships are not cascaded.
+        """
+        mapper = inspect(self._model)
+        # Mapped models are never mapped against joins or subqueries.
+        table = typing.cast(Table, mapper.local_table)
+        pk_key = mapper.get_property_by_column(self._pk).key
+        keys = [attr.key for attr in mapper.column_attrs if attr.key != pk_key]
+        chunk_size = max(1, min(chunk_size, _MAX_BIND_PARAMS // (len(keys) + 1)))
+
+        new = [e for e in entities if e.is_new]
+        existing = [e for e in entities if not e.is_new]
+        async with self._session_factory() as session:
+            for chunk in batched(new, chunk_size):
+                result = await session.exec(
+                    insert(table)
+                    .returning(table.c[pk_key], sort_by_parameter_order=True)
+                    .execution_options(insertmanyvalues_page_size=chunk_size),
+                    params=[{k: getattr(e, k) for k in keys} for e in chunk],
+                )
+                for entity, new_id in zip(chunk, result.scalars().all(), strict=True):
+                    setattr(entity, pk_key, new_id)
+
+            for chunk in batched(existing, chunk_size):
+                rows = values(*(column(k, table.c[k].type) for k in (pk_key, *keys)), name="v").data(
+                    [tuple(getattr(e, k) for k in (pk_key, *keys)) for e in chunk]
+                )
+                await session.exec(
+                    update(table)
+                    .where(table.c[pk_key] == cast(rows.c[pk_key], table.c[pk_key].type))
+                    .values({k: cast(rows.c[k], table.c[k].type) for k in keys})
+                )
+        return entities
+
     async def delete(self, id: ID) -> None:
         async with self._session_factory() as session:
             entity = await session.get(self._model, id)
@@ -72,4 +182,4 @@ class BaseRepository[T: Base, ID]:
             return result.one()
 
     async def exists(self, id: ID) -> bool:
-        return await self.find_by_id(id) is not None
+        return await self.exists_where(self._pk == id)
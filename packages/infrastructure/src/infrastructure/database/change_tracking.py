@@ -0,0 +1,70 @@
+from collections.abc import Callable, Collection, Mapping, Sequence
+from typing import Any, Protocol
+
+from sqlalchemy import delete, insert, inspect, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from infrastructure.database.base import Base
+
+type Row = dict[str, Any]
+
+
+class Identified(Protocol):
+    id: int | None
+
+
+def changed_columns(before: Row, after: Row) -> Row:
+    """Return the columns of ``after`` whose values differ from ``before``."""
+    return {k: v for k, v in after.items() if k not in before or before[k] != v}
+
+
+async def insert_rows(session: AsyncSession, model: type[Base], rows: Sequence[Row]) -> None:
+    if rows:
+        await session.exec(insert(model), params=list(rows))
+
+
+async def insert_returning_ids(session: AsyncSession, model: type[Base], rows: Sequence[Row]) -> list[int]:
+    if not rows:
+        return []
+    pk = inspect(model).primary_key[0]
+    result = await session.exec(
+        insert(model).returning(pk, sort_by_parameter_order=True),
+        params=list(rows),
+    )
+    return list(result.scalars().all())
+
+
+async def update_by_id(session: AsyncSession, model: type[Base], id: int, values: Row) -> None:
+    if values:
+        pk = inspect(model).primary_key[0]
+        await session.exec(update(model).where(pk == id).values(**values))
+
+
+async def delete_where_in(session: AsyncSession, model: type[Base], column: str, keys: Collection[object]) -> None:
+    if keys:
+        await session.exec(delete(model).where(inspect(model).columns[column].in_(keys)))
+
+
+async def sync_children[C: Identified](
+    session: AsyncSession,
+    model: type[Base],
+    parent: Row,
+    before: Mapping[int, Row],
+    children: Sequence[C],
+    to_row: Callable[[C], Row],
+) -> None:
+    """Bring the rows of one child collection in line with ``children``.
+
+    Rows missing from ``children`` are deleted, rows whose columns differ from
+    ``before`` are updated and children without an id are inserted (receiving their
+    generated id). Unchanged rows are not touched.
+    """
+    current = {c.id for c in children if c.id is not None}
+    await delete_where_in(session, model, "id", [i for i in before if i not in current])
+    for child in children:
+        if child.id is not None:
+            await update_by_id(session, model, child.id, changed_columns(before.get(child.id, {}), to_row(child)))
+    new = [c for c in children if c.id is None]
+    ids = await insert_returning_ids(session, model, [parent | to_row(c) for c in new])
+    for child, new_id in zip(new, ids, strict=True):
+        child.id = new_id
@@ -0,0 +1,88 @@
+from collections.abc import Iterable
+from typing import Protocol, cast
+
+from infrastructure.database.session import current_session
+
+_INFO_KEY = "identity_map"
+
+
+class Identified(Protocol):
+    @property
+    def id(self) -> int | None: ...
+
+
+class IdentityMap:
+    """Aggregates already loaded in one unit of work, keyed by type and id.
+
+    Lives in the ``info`` dict of the transaction session, so it is created,
+    shared and discarded together with the unit of work.
+    """
+
+    def __init__(self) -> None:
+        self._items: dict[tuple[type, int], object] = {}
+
+    def get[A](self, kind: type[A], id: int) -> A | None:
+        return cast("A | None", self._items.get((kind, id)))
+
+    def add[A: Identified](self, aggregate: A) -> A:
+        """Register ``aggregate`` and return the instance that represents it from now on.
+
+        An aggregate loaded earlier in the unit of work wins over a fresh copy,
+        so callers keep seeing their own in-memory changes.
+        """
+        if aggregate.id is None:
+            return aggregate
+        return cast("A", self._items.setdefault((type(aggregate), aggregate.id), aggregate))
+
+    def replace(self, aggregate: Identified) -> None:
+        if aggregate.id is not None:
+            self._items[(type(aggregate), aggregate.id)] = aggregate
+
+    def remove(self, kind: type, id: int) -> None:
+        self._items.pop((kind, id), None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def current_identity_map() -> IdentityMap | None:
+    """Identity map of the active unit of work; ``None`` outside of one."""
+    session = current_session()
+    if session is None:
+        return None
+    identity = session.info.get(_INFO_KEY)
+    if identity is None:
+        identity = session.info[_INFO_KEY] = IdentityMap()
+    return cast(IdentityMap, identity)
+
+
+def cached[A](kind: type[A], id: int) -> A | None:
+    identity = current_identity_map()
+    return identity.get(kind, id) if identity is not None else None
+
+
+def track[A: Identified](aggregate: A) -> A:
+    identity = current_identity_map()
+    return identity.add(aggregate) if identity is not None else aggregate
+
+
+def track_all[A: Identified](aggregates: Iterable[A]) -> list[A]:
+    identity = current_identity_map()
+    if identity is None:
+        return list(aggregates)
+    return [identity.add(a) for a in aggregates]
+
+
+def track_saved(aggregate: Identified) -> None:
+    identity = current_identity_map()
+    if identity is not None:
+        identity.replace(aggregate)
+
+
+def forget(kind: type, id: int) -> None:
+    identity = current_identity_map()
+    if identity is not None:
+        identity.remove(kind, id)
@@ -1,93 +1,118 @@
 
+from dataclasses import dataclass
+
 from domain.coaches.coach import Coach
 from domain.coaches.entities import AvailabilitySlot, Certification
-from domain.coaches.value_objects import CoachTier, Specialization, Weekday
-from domain.shared.value_objects import Email, FullName
+from domain.shared.value_objects import TRUSTED
+from infrastructure.database.change_tracking import Row
 from infrastructure.database.models.coach_models import (
     AvailabilitySlotORM,
     CertificationORM,
     CoachORM,
-    CoachSpecializationORM,
 )
 
 
+@dataclass(frozen=True, slots=True)
+class CoachSnapshot:
+    coach: Row
+    certifications: dict[int, Row]
+    available_slots: dict[int, Row]
+    shallow: bool = False
+
+
 class CoachMapper:
     @staticmethod
-    def to_domain(orm: CoachORM) -> Coach:
-        certs = [
-            Certification(
-                id=c.id,
-                name=c.name,
-                issuing_body=c.issuing_body,
-                issued_at=c.issued_at,
-                expires_at=c.expires_at,
-            )
-            for c in (orm.certifications or [])
-        ]
-        slots = [
-            AvailabilitySlot(
-                id=s.id,
-                day=Weekday(s.day),
-                start_hour=s.start_hour,
-                end_hour=s.end_hour,
-            )
-            for s in (orm.available_slots or [])
-        ]
-        specs = frozenset(
-            Specialization(row.specialization)
-            for row in (orm.specializations or [])
-        )
-        return Coach(
-            id=orm.id,
-            name=FullName(first_name=orm.first_name, last_name=orm.last_name),
-            email=Email(value=orm.email),
-            bio=orm.bio,
-            tier=CoachTier(orm.tier),
-            specializations=specs,
-            max_clients=orm.max_clients,
-            current_client_count=orm.current_client_count,
-            certifications=certs,
-            available_slots=slots,
+    def to_domain(orm: CoachORM, children: bool = True) -> Coach:
+        """Map ``orm``; with ``children=False`` its relationships are left unread and empty."""
+        certifications = (orm.certifications or []) if children else []
+        available_slots = (orm.available_slots or []) if children else []
+        coach = Coach.model_validate(
+            {
+                "id": orm.id,
+                "name": {"first_name": orm.first_name, "last_name": orm.last_name},
+                "email": {"value": orm.email},
+                "bio": orm.bio,
+                "tier": orm.tier,
+                "specializations": orm.specializations,
+                "max_clients": orm.max_clients,
+                "current_client_count": orm.current_client_count,
+                "certifications": [
+                    {
+                        "id": c.id,
+                        "name": c.name,
+                        "issuing_body": c.issuing_body,
+                        "issued_at": c.issued_at,
+                        "expires_at": c.expires_at,
+                    }
+                    for c in certifications
+                ],
+                "available_slots": [
+                    {"id": s.id, "day": s.day, "start_hour": s.start_hour, "end_hour": s.end_hour}
+                    for s in available_slots
+                ],
+            },
+            context=TRUSTED,
         )
+        coach.mark_persisted(CoachMapper.snapshot(coach, shallow=not children))
+        return coach
 
     @staticmethod
     def to_orm(coach: Coach) -> CoachORM:
         cid = coach.id or 0
         certs = [
-            CertificationORM(
-                id=c.id,
-                coach_id=cid,
-                name=c.name,
-                issuing_body=c.issuing_body,
-                issued_at=c.issued_at,
-                expires_at=c.expires_at,
-            )
+            CertificationORM(id=c.id, coach_id=cid, **CoachMapper.certification_row(c))
             for c in coach.certifications
         ]
         slots = [
-            AvailabilitySlotORM(
-                id=s.id,
-                coach_id=cid,
-                day=s.day.value,
-                start_hour=s.start_hour,
-                end_hour=s.end_hour,
-            )
+            AvailabilitySlotORM(id=s.id, coach_id=cid, **CoachMapper.slot_row(s))
             for s in coach.available_slots
         ]
-        spec_rows = [
-            CoachSpecializationORM(coach_id=cid, specialization=spec.value)
-            for spec in coach.specializations
-        ]
         return CoachORM(
             id=coach.id,
-            first_name=coach.name.first_name,
-            last_name=coach.name.last_name,
-            email=coach.email.value,
-            bio=coach.bio,
-            tier=coach.tier.value,
-            max_clients=coach.max_clients,
-            current_client_count=coach.current_client_count,
+            **CoachMapper.coach_row(coach),
             certifications=certs,
             available_slots=slots,
-            specializations=spec_rows,
+        )
+
+    @staticmethod
+    def coach_row(coach: Coach) -> Row:
+        return {
+            "first_name": coach.name.first_name,
+            "last_name": coach.name.last_name,
+            "email": coach.email.value,
+            "bio": coach.bio,
+            "tier": coach.tier.value,
+            "max_clients": coach.max_clients,
+            "current_client_count": coach.current_client_count,
+            "specializations": sorted(s.value for s in coach.specializations),
+        }
+
+    @staticmethod
+    def certification_row(cert: Certification) -> Row:
+        return {
+            "name": cert.name,
+            "issuing_body": cert.issuing_body,
+            "issued_at": cert.issued_at,
+            "expires_at": cert.expires_at,
+        }
+
+    @staticmethod
+    def slot_row(slot: AvailabilitySlot) -> Row:
+        return {
+            "day": slot.day.value,
+            "start_hour": slot.start_hour,
+            "end_hour": slot.end_hour,
+        }
+
+    @staticmethod
+    def snapshot(coach: Coach, shallow: bool = False) -> CoachSnapshot:
+        return CoachSnapshot(
+            coach=CoachMapper.coach_row(coach),
+            certifications={
+                c.id: CoachMapper.certification_row(c) for c in coach.certifications if c.id is not None
+            },
+            available_slots={
+                s.id: CoachMapper.slot_row(s) for s in coach.available_slots if s.id is not None
+            },
+            shallow=shallow,
         )
@@ -1,66 +1,87 @@
 
+from dataclasses import dataclass
+
 from domain.members.entities import FitnessGoal
 from domain.members.member import Member
-from domain.members.value_objects import (
-    FitnessLevel,
-    GoalType,
-    Membership,
-    MembershipTier,
-)
-from domain.shared.value_objects import Email, FullName, PhoneNumber
+from domain.shared.value_objects import TRUSTED
+from infrastructure.database.change_tracking import Row
 from infrastructure.database.models.member_models import FitnessGoalORM, MemberORM
 
 
+@dataclass(frozen=True, slots=True)
+class MemberSnapshot:
+    member: Row
+    goals: dict[int, Row]
+
+
 class MemberMapper:
     @staticmethod
     def to_domain(orm: MemberORM) -> Member:
-        goals = [
-            FitnessGoal(
-                id=g.id,
-                type=GoalType(g.type),
-                description=g.description,
-                target_date=g.target_date,
-                achieved=g.achieved,
-            )
-            for g in (orm.goals or [])
-        ]
-        member = Member(
-            id=orm.id,
-            name=FullName(first_name=orm.first_name, last_name=orm.last_name),
-            email=Email(value=orm.email),
-            phone=PhoneNumber(value=orm.phone),
-            fitness_level=FitnessLevel(orm.fitness_level),
-            membership=Membership(
-                tier=MembershipTier(orm.membership_tier),
-                valid_until=orm.membership_valid_until,
-            ),
-            goals=goals,
-            active_plan_id=orm.active_plan_id,
+        # One validation pass over the whole aggregate: building each nested
+        # model separately costs more than the checks themselves. The row passed
+        # the format checks when it was written, so they are skipped (TRUSTED).
+        member = Member.model_validate(
+            {
+                "id": orm.id,
+                "name": {"first_name": orm.first_name, "last_name": orm.last_name},
+                "email": {"value": orm.email},
+                "phone": {"value": orm.phone},
+                "fitness_level": orm.fitness_level,
+                "membership": {"tier": orm.membership_tier, "valid_until": orm.membership_valid_until},
+                "goals": [
+                    {
+                        "id": g.id,
+                        "type": g.type,
+                        "description": g.description,
+                        "target_date": g.target_date,
+                        "achieved": g.achieved,
+                    }
+                    for g in (orm.goals or [])
+                ],
+                "active_plan_id": orm.active_plan_id,
+            },
+            context=TRUSTED,
         )
+        member.mark_persisted(MemberMapper.snapshot(member))
         return member
 
     @staticmethod
     def to_orm(member: Member) -> MemberORM:
         orm = MemberORM(
             id=member.id,
-            first_name=member.name.first_name,
-            last_name=member.name.last_name,
-            email=member.email.value,
-            phone=member.phone.value,
-            fitness_level=member.fitness_level.value,
-            membership_tier=member.membership.tier.value,
-            membership_valid_until=member.membership.valid_until,
-            active_plan_id=member.active_plan_id,
+            **MemberMapper.member_row(member),
             goals=[
-                FitnessGoalORM(
-                    id=g.id,
-                    member_id=member.id or 0,
-                    type=g.type.value,
-                    description=g.description,
-                    target_date=g.target_date,
-                    achieved=g.achieved,
-                )
+                FitnessGoalORM(id=g.id, member_id=member.id or 0, **MemberMapper.goal_row(g))
                 for g in member.goals
             ],
         )
         return orm
+
+    @staticmethod
+    def member_row(member: Member) -> Row:
+        return {
+            "first_name": member.name.first_name,
+            "last_name": member.name.last_name,
+            "email": member.email.value,
+            "phone": member.phone.value,
+            "fitness_level": member.fitness_level.value,
+            "membership_tier": member.membership.tier.value,
+            "membership_valid_until": member.membership.valid_until,
+            "active_plan_id": member.active_plan_id,
+        }
+
+    @staticmethod
+    def goal_row(goal: FitnessGoal) -> Row:
+        return {
+            "type": goal.type.value,
+            "description": goal.description,
+            "target_date": goal.target_date,
+            "achieved": goal.achieved,
+        }
+
+    @staticmethod
+    def snapshot(member: Member) -> MemberSnapshot:
+        return MemberSnapshot(
+            member=MemberMapper.member_row(member),
+            goals={g.id: MemberMapper.goal_row(g) for g in member.goals if g.id is not None},
+        )
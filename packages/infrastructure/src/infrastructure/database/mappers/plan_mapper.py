@@ -1,7 +1,11 @@
 
+from dataclasses import dataclass
+
 from domain.plans.entities import WorkoutSession
 from domain.plans.training_plan import TrainingPlan
-from domain.plans.value_objects import PlannedExercise, PlanStatus, SessionStatus
+from domain.plans.value_objects import PlannedExercise
+from domain.shared.value_objects import TRUSTED
+from infrastructure.database.change_tracking import Row
 from infrastructure.database.models.plan_models import (
     PlannedExerciseORM,
     TrainingPlanORM,
@@ -9,41 +13,56 @@ from infrastructure.database.models.plan_models import (
 )
 
 
+@dataclass(frozen=True, slots=True)
+class PlanSnapshot:
+    plan: Row
+    sessions: dict[int, Row]
+    exercises: dict[int, tuple[Row, ...]]
+
+
 class PlanMapper:
     @staticmethod
     def to_domain(orm: TrainingPlanORM) -> TrainingPlan:
-        sessions = [
-            WorkoutSession(
-                id=s.id,
-                name=s.name,
-                scheduled_date=s.scheduled_date,
-                status=SessionStatus(s.status),
-                completed_at=s.completed_at,
-                notes=s.notes,
-                exercises=[
-                    PlannedExercise(
-                        exercise_id=e.exercise_id,
-                        name=e.name,
-                        sets=e.sets,
-                        reps=e.reps,
-                        rest_seconds=e.rest_seconds,
-                    )
-                    for e in (s.exercises or [])
+        return PlanMapper.from_tree(
+            {
+                "id": orm.id,
+                "member_id": orm.member_id,
+                "coach_id": orm.coach_id,
+                "name": orm.name,
+                "status": orm.status,
+                "starts_at": orm.starts_at,
+                "ends_at": orm.ends_at,
+                "sessions": [
+                    {
+                        "id": s.id,
+                        "name": s.name,
+                        "scheduled_date": s.scheduled_date,
+                        "status": s.status,
+                        "completed_at": s.completed_at,
+                        "notes": s.notes,
+                        "exercises": [
+                            {
+                                "exercise_id": e.exercise_id,
+                                "name": e.name,
+                                "sets": e.sets,
+                                "reps": e.reps,
+                                "rest_seconds": e.rest_seconds,
+                            }
+                            for e in (s.exercises or [])
+                        ],
+                    }
+                    for s in (orm.sessions or [])
                 ],
-            )
-            for s in (orm.sessions or [])
-        ]
-        return TrainingPlan(
-            id=orm.id,
-            member_id=orm.member_id,
-            coach_id=orm.coach_id,
-            name=orm.name,
-            status=PlanStatus(orm.status),
-            starts_at=orm.starts_at,
-            ends_at=orm.ends_at,
-            sessions=sessions,
+            }
         )
 
+    @staticmethod
+    def from_tree(tree: Row) -> TrainingPlan:
+        """Build a plan from its column values, with sessions and exercises nested as lists."""
+        plan = TrainingPlan.model_validate(tree, context=TRUSTED)
+        plan.mark_persisted(PlanMapper.snapshot(plan))
+        return plan
+
     @staticmethod
     def to_orm(plan: TrainingPlan) -> TrainingPlanORM:
         pid = plan.id or 0
@@ -51,32 +70,55 @@ class PlanMapper:
             WorkoutSessionORM(
                 id=s.id,
                 plan_id=pid,
-                name=s.name,
-                scheduled_date=s.scheduled_date,
-                status=s.status.value,
-                completed_at=s.completed_at,
-                notes=s.notes,
+                **PlanMapper.session_row(s),
                 exercises=[
-                    PlannedExerciseORM(
-                        session_id=s.id or 0,
-                        exercise_id=e.exercise_id,
-                        name=e.name,
-                        sets=e.sets,
-                        reps=e.reps,
-                        rest_seconds=e.rest_seconds,
-                    )
+                    PlannedExerciseORM(session_id=s.id or 0, **PlanMapper.exercise_row(e))
                     for e in s.exercises
                 ],
             )
             for s in plan.sessions
         ]
-        return TrainingPlanORM(
-            id=plan.id,
-            member_id=plan.member_id,
-            coach_id=plan.coach_id,
-            name=plan.name,
-            status=plan.status.value,
-            starts_at=plan.starts_at,
-            ends_at=plan.ends_at,
-            sessions=sessions,
+        return TrainingPlanORM(id=plan.id, **PlanMapper.plan_row(plan), sessions=sessions)
+
+    @staticmethod
+    def plan_row(plan: TrainingPlan) -> Row:
+        return {
+            "member_id": plan.member_id,
+            "coach_id": plan.coach_id,
+            "name": plan.name,
+            "status": plan.status.value,
+            "starts_at": plan.starts_at,
+            "ends_at": plan.ends_at,
+        }
+
+    @staticmethod
+    def session_row(session: WorkoutSession) -> Row:
+        return {
+            "name": session.name,
+            "scheduled_date": session.scheduled_date,
+            "status": session.status.value,
+            "completed_at": session.completed_at,
+            "notes": session.notes,
+        }
+
+    @staticmethod
+    def exercise_row(exercise: PlannedExercise) -> Row:
+        return {
+            "exercise_id": exercise.exercise_id,
+            "name": exercise.name,
+            "sets": exercise.sets,
+            "reps": exercise.reps,
+            "rest_seconds": exercise.rest_seconds,
+        }
+
+    @staticmethod
+    def snapshot(plan: TrainingPlan) -> PlanSnapshot:
+        persisted = {s.id: s for s in plan.sessions if s.id is not None}
+        return PlanSnapshot(
+            plan=PlanMapper.plan_row(plan),
+            sessions={sid: PlanMapper.session_row(s) for sid, s in persisted.items()},
+            exercises={
+                sid: tuple(PlanMapper.exercise_row(e) for e in s.exercises)
+                for sid, s in persisted.items()
+            },
         )
@@ -5,7 +5,9 @@ from alembic.config import Config
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 import infrastructure.database.models.coach_models  # noqa: F401
+import infrastructure.database.models.exercise_models  # noqa: F401
 import infrastructure.database.models.member_models  # noqa: F401
+import infrastructure.database.models.outbox_models  # noqa: F401
 import infrastructure.database.models.plan_models  # noqa: F401
 
 
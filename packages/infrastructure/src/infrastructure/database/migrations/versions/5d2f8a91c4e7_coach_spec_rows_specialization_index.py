@@ -0,0 +1,29 @@
+"""coach_spec_rows specialization index
+
+Revision ID: 5d2f8a91c4e7
+Revises: bac1d49c3480
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = '5d2f8a91c4e7'
+down_revision: str | None = 'bac1d49c3480'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_coach_spec_rows_specialization_coach_id',
+        'coach_spec_rows',
+        ['specialization', 'coach_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_coach_spec_rows_specialization_coach_id', table_name='coach_spec_rows')
@@ -0,0 +1,42 @@
+"""exercise_catalog mirror with trigram name index
+
+Revision ID: 8c3e6b1d2f90
+Revises: 5d2f8a91c4e7
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+revision: str = '8c3e6b1d2f90'
+down_revision: str | None = '5d2f8a91c4e7'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_table(
+        'exercise_catalog',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('name', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+        sa.Column('synced_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_exercise_catalog_name_trgm',
+        'exercise_catalog',
+        ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_exercise_catalog_name_trgm', table_name='exercise_catalog')
+    op.drop_table('exercise_catalog')
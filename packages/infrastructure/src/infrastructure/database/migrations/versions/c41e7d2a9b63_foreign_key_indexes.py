@@ -0,0 +1,39 @@
+"""indexes on the foreign keys aggregates are loaded by
+
+Revision ID: c41e7d2a9b63
+Revises: 3f7a2c9e5b14
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = 'c41e7d2a9b63'
+down_revision: str | None = '3f7a2c9e5b14'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Child rows are loaded by parent id (selectin, joined plan loading, change
+# tracking deletes); sessions and exercises also come back in id order.
+_INDEXES: list[tuple[str, str, list[str]]] = [
+    ('ix_training_plans_member_id', 'training_plans', ['member_id']),
+    ('ix_workout_sessions_plan_id_id', 'workout_sessions', ['plan_id', 'id']),
+    ('ix_planned_exercises_session_id_id', 'planned_exercises', ['session_id', 'id']),
+    ('ix_fitness_goals_member_id', 'fitness_goals', ['member_id']),
+    ('ix_coach_spec_rows_coach_id', 'coach_spec_rows', ['coach_id']),
+    ('ix_certifications_coach_id', 'certifications', ['coach_id']),
+    ('ix_availability_slots_coach_id', 'availability_slots', ['coach_id']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
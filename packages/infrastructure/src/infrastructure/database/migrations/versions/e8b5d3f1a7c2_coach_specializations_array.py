@@ -0,0 +1,54 @@
+"""coach specializations as a GIN-indexed array on coaches
+
+Revision ID: e8b5d3f1a7c2
+Revises: c41e7d2a9b63
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = 'e8b5d3f1a7c2'
+down_revision: str | None = 'c41e7d2a9b63'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'coaches',
+        sa.Column('specializations', postgresql.ARRAY(sa.String(length=30)), server_default='{}', nullable=False),
+    )
+    op.execute(
+        'UPDATE coaches SET specializations = s.specializations '
+        'FROM (SELECT coach_id, array_agg(DISTINCT specialization ORDER BY specialization) AS specializations '
+        'FROM coach_spec_rows GROUP BY coach_id) AS s '
+        'WHERE s.coach_id = coaches.id'
+    )
+    op.create_index('ix_coaches_specializations', 'coaches', ['specializations'], postgresql_using='gin')
+    op.drop_table('coach_spec_rows')
+
+
+def downgrade() -> None:
+    op.create_table(
+        'coach_spec_rows',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('coach_id', sa.Integer(), nullable=False),
+        sa.Column('specialization', sqlmodel.sql.sqltypes.AutoString(length=30), nullable=False),
+        sa.ForeignKeyConstraint(['coach_id'], ['coaches.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_coach_spec_rows_specialization_coach_id', 'coach_spec_rows', ['specialization', 'coach_id'])
+    op.create_index('ix_coach_spec_rows_coach_id', 'coach_spec_rows', ['coach_id'])
+    op.execute(
+        'INSERT INTO coach_spec_rows (coach_id, specialization) '
+        'SELECT id, unnest(specializations) FROM coaches ORDER BY id'
+    )
+    op.drop_index('ix_coaches_specializations', table_name='coaches')
+    op.drop_column('coaches', 'specializations')
@@ -1,6 +1,8 @@
 from datetime import date
 from typing import ClassVar, override
 
+from sqlalchemy import Column, Index, String
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlmodel import Field, Relationship
 
 from infrastructure.database.base import Base
@@ -8,6 +10,7 @@ from infrastructure.database.base import Base
 
 class CertificationORM(Base, table=True):
     __tablename__: ClassVar[str] = "certifications"  # pyright: ignore[reportIncompatibleVariableOverride]
+    __table_args__ = (Index("ix_certifications_coach_id", "coach_id"),)
     id: int | None = Field(default=None, primary_key=True)
     coach_id: int = Field(foreign_key="coaches.id")
     name: str = Field(max_length=200)
@@ -23,6 +26,7 @@ class CertificationORM(Base, table=True):
 
 class AvailabilitySlotORM(Base, table=True):
     __tablename__: ClassVar[str] = "availability_slots"  # pyright: ignore[reportIncompatibleVariableOverride]
+    __table_args__ = (Index("ix_availability_slots_coach_id", "coach_id"),)
     id: int | None = Field(default=None, primary_key=True)
     coach_id: int = Field(foreign_key="coaches.id")
     day: str = Field(max_length=3)
@@ -35,20 +39,9 @@ class AvailabilitySlotORM(Base, table=True):
         return self.id is None
 
 
-class CoachSpecializationORM(Base, table=True):
-    __tablename__: ClassVar[str] = "coach_spec_rows"  # pyright: ignore[reportIncompatibleVariableOverride]
-    id: int | None = Field(default=None, primary_key=True)
-    coach_id: int = Field(foreign_key="coaches.id")
-    specialization: str = Field(max_length=30)
-
-    @property
-    @override
-    def is_new(self) -> bool:
-        return self.id is None
-
-
 class CoachORM(Base, table=True):
     __tablename__: ClassVar[str] = "coaches"  # pyright: ignore[reportIncompatibleVariableOverride]
+    __table_args__ = (Index("ix_coaches_specializations", "specializations", postgresql_using="gin"),)
     id: int | None = Field(default=None, primary_key=True)
     first_name: str = Field(max_length=100)
     last_name: str = Field(max_length=100)
@@ -57,14 +50,16 @@ class CoachORM(Base, table=True):
     tier: str = Field(max_length=20)
     max_clients: int = Field(default=10)
     current_client_count: int = Field(default=0)
+    # Specialization values, sorted; queried with the GIN-indexed @> and && operators.
+    specializations: list[str] = Field(
+        default_factory=list,
+        sa_column=Column(ARRAY(String(30)), nullable=False, server_default="{}"),
+    )
     certifications: list[CertificationORM] = Relationship(
-        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin", "order_by": "CertificationORM.id"}
     )
     available_slots: list[AvailabilitySlotORM] = Relationship(
-        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin"}
-    )
-    specializations: list[CoachSpecializationORM] = Relationship(
-        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin", "order_by": "AvailabilitySlotORM.id"}
     )
 
     @property
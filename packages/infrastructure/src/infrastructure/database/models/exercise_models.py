@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import ClassVar, override
+
+from sqlalchemy import Column, DateTime, Index
+from sqlmodel import Field
+
+from infrastructure.database.base import Base
+
+
+class ExerciseCatalogORM(Base, table=True):
+    """Local mirror of the wger exercise catalog; ``id`` is the wger id, not generated here."""
+
+    __tablename__: ClassVar[str] = "exercise_catalog"  # pyright: ignore[reportIncompatibleVariableOverride]
+    __table_args__ = (
+        Index(
+            "ix_exercise_catalog_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+    id: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    name: str = Field(max_length=255)
+    synced_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
+
+    @property
+    @override
+    def is_new(self) -> bool:
+        return False
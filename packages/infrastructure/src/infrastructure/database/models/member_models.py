@@ -1,6 +1,7 @@
 from datetime import date
 from typing import ClassVar, override
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from infrastructure.database.base import Base
@@ -8,6 +9,7 @@ from infrastructure.database.base import Base
 
 class FitnessGoalORM(Base, table=True):
     __tablename__: ClassVar[str] = "fitness_goals"  # pyright: ignore[reportIncompatibleVariableOverride]
+    __table_args__ = (Index("ix_fitness_goals_member_id", "member_id"),)
     id: int | None = Field(default=None, primary_key=True)
     member_id: int = Field(foreign_key="members.id")
     type: str = Field(max_length=50)
@@ -33,7 +35,7 @@ class MemberORM(Base, table=True):
     membership_valid_until: date
     active_plan_id: int | None = Field(default=None)
     goals: list[FitnessGoalORM] = Relationship(
-        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin", "order_by": "FitnessGoalORM.id"}
     )
 
     @property
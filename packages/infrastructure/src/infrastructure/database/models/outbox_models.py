@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Any, ClassVar, override
+
+from sqlalchemy import JSON, Column, DateTime, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field
+
+from infrastructure.database.base import Base
+
+
+class OutboxMessageORM(Base, table=True):
+    """Domain event written in the same transaction as the change that raised it."""
+
+    __tablename__: ClassVar[str] = "outbox"  # pyright: ignore[reportIncompatibleVariableOverride]
+    id: int | None = Field(default=None, primary_key=True)
+    event_type: str = Field(max_length=100)
+    payload: dict[str, Any] = Field(sa_column=Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False))
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=func.now()),
+    )
+    attempts: int = Field(default=0)
+    last_error: str | None = Field(default=None)
+
+    @property
+    @override
+    def is_new(self) -> bool:
+        return self.id is None
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from typing import ClassVar, override
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, Index
 from sqlmodel import Field, Relationship
 
 from infrastructure.database.base import Base
@@ -9,6 +9,7 @@ from infrastructure.database.base import Base
 
 class PlannedExerciseORM(Base, table=True):
     __tablename__: ClassVar[str] = "planned_exercises"  # pyright: ignore[reportIncompatibleVariableOverride]
+    __table_args__ = (Index("ix_planned_exercises_session_id_id", "session_id", "id"),)
     id: int | None = Field(default=None, primary_key=True)
     session_id: int = Field(foreign_key="workout_sessions.id")
     exercise_id: str = Field(max_length=100)
@@ -25,6 +26,7 @@ class PlannedExerciseORM(Base, table=True):
 
 class WorkoutSessionORM(Base, table=True):
     __tablename__: ClassVar[str] = "workout_sessions"  # pyright: ignore[reportIncompatibleVariableOverride]
+    __table_args__ = (Index("ix_workout_sessions_plan_id_id", "plan_id", "id"),)
     id: int | None = Field(default=None, primary_key=True)
     plan_id: int = Field(foreign_key="training_plans.id")
     name: str = Field(max_length=200)
@@ -35,7 +37,7 @@ class WorkoutSessionORM(Base, table=True):
     )
     notes: str | None = Field(default=None)
     exercises: list[PlannedExerciseORM] = Relationship(
-        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin", "order_by": "PlannedExerciseORM.id"}
     )
 
     @property
@@ -46,6 +48,7 @@ class WorkoutSessionORM(Base, table=True):
 
 class TrainingPlanORM(Base, table=True):
     __tablename__: ClassVar[str] = "training_plans"  # pyright: ignore[reportIncompatibleVariableOverride]
+    __table_args__ = (Index("ix_training_plans_member_id", "member_id"),)
     id: int | None = Field(default=None, primary_key=True)
     member_id: int
     coach_id: int
@@ -54,7 +57,7 @@ class TrainingPlanORM(Base, table=True):
     starts_at: date
     ends_at: date
     sessions: list[WorkoutSessionORM] = Relationship(
-        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin"}
+        sa_relationship_kwargs={"cascade": "all, delete-orphan", "lazy": "selectin", "order_by": "WorkoutSessionORM.id"}
     )
 
     @property
@@ -9,6 +9,11 @@ _current_session: ContextVar[AsyncSession | None] = ContextVar("_current_session
 _logger = logging.getLogger(__name__)
 
 
+def current_session() -> AsyncSession | None:
+    """The session of the enclosing ``Database.transaction()``, if any."""
+    return _current_session.get()
+
+
 class Database:
     def __init__(
         self,
@@ -69,6 +74,12 @@ class Database:
                 _current_session.reset(token)
                 _logger.debug("Transaction session closed %s", id(session))
 
+    @asynccontextmanager
+    async def savepoint(self):
+        """Nested transaction in the current session; a raise undoes only its writes."""
+        async with self.transaction() as session, session.begin_nested():
+            yield session
+
     @property
     def engine(self) -> AsyncEngine:
         return self._engine
@@ -1,15 +1,49 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import override
 
-from application.core.ports import ITransactionManager
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from application.core.ports import ITransactionManager, IUnitOfWork
+from infrastructure.database.identity_map import current_identity_map
 from infrastructure.database.session import Database
 
 
+class SessionUnitOfWork(IUnitOfWork):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    @override
+    async def commit(self) -> None:
+        await self._session.commit()
+
+    @override
+    async def rollback(self) -> None:
+        await self._session.rollback()
+        if (identity := current_identity_map()) is not None:
+            identity.clear()
+
+
 class TransactionManager(ITransactionManager):
     def __init__(self, database: Database):
         self._database = database
 
     @asynccontextmanager
-    async def transaction(self, new: bool = False) -> AsyncIterator[None]:
+    async def transaction(self, new: bool = False) -> AsyncGenerator[None, None]:
         async with self._database.transaction(new=new):
             yield
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncGenerator[IUnitOfWork, None]:
+        """One session, identity map and commit shared by everything inside the block.
+
+        Commits on a clean exit and rolls back when the block raises; ``commit``
+        lets the caller make the writes durable before the block ends.
+        """
+        async with self._database.transaction() as session:
+            yield SessionUnitOfWork(session)
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncGenerator[None, None]:
+        async with self._database.savepoint():
+            yield
@@ -0,0 +1,84 @@
+import asyncio
+import random
+from collections import defaultdict
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from application.core.logger import ILogger
+from application.core.ports import IChannelHandler
+from infrastructure.redis.redis_client import RedisClient
+
+
+class PubSubListener:
+    """Feeds Redis pub/sub messages to one ``IChannelHandler`` per channel.
+
+    The listener blocks on the connection until a message arrives, so an idle
+    process does no work. Messages that are already buffered when it wakes up,
+    up to ``max_batch``, are grouped by channel and handed over together. A failing
+    handler is logged and skipped; a failing connection is re-established after
+    an exponential, jittered backoff that resets once messages flow again.
+    """
+
+    def __init__(
+        self,
+        client: RedisClient,
+        handlers: Mapping[str, IChannelHandler],
+        app_logger: ILogger,
+        max_batch: int = 100,
+        reconnect_delay_seconds: float = 0.5,
+        reconnect_delay_max_seconds: float = 30.0,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        self._client = client
+        self._handlers = dict(handlers)
+        self._log = app_logger.get_logger(__name__)
+        self._max_batch = max_batch
+        self._reconnect_delay = reconnect_delay_seconds
+        self._reconnect_delay_max = reconnect_delay_max_seconds
+        self._rand = rand
+
+    async def run(self) -> None:
+        """Listen until cancelled."""
+        if not self._handlers:
+            return
+        failures = 0
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.subscribe(*self._handlers)  # pyright: ignore[reportUnknownMemberType]
+                self._log.info("Pub/Sub listener subscribed to %s", ", ".join(self._handlers))
+                while True:
+                    first = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+                    if first is None:
+                        continue
+                    batch: list[dict[str, Any]] = [first]
+                    while len(batch) < self._max_batch:
+                        more = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.0)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+                        if more is None:
+                            break
+                        batch.append(more)  # pyright: ignore[reportUnknownArgumentType]
+                    failures = 0
+                    await self._dispatch(batch)
+            except asyncio.CancelledError:
+                await pubsub.aclose()
+                raise
+            except Exception as exc:
+                await pubsub.aclose()
+                delay = min(self._reconnect_delay_max, self._reconnect_delay * 2**failures) * (0.5 + self._rand() / 2)
+                failures += 1
+                self._log.warning("Pub/Sub listener failed, reconnecting in %.1fs: %s", delay, exc)
+                await asyncio.sleep(delay)
+
+    async def _dispatch(self, batch: list[dict[str, Any]]) -> None:
+        by_channel: dict[str, list[str]] = defaultdict(list)
+        for message in batch:
+            if message.get("type") == "message":
+                by_channel[message["channel"]].append(message["data"])
+        for channel, messages in by_channel.items():
+            handler = self._handlers.get(channel)
+            if handler is None:
+                continue
+            try:
+                await handler.handle(channel, messages)
+            except Exception as exc:
+                self._log.error("Pub/Sub handler for %s failed on %d message(s): %s", channel, len(messages), exc, exc_info=exc)
@@ -1,14 +1,40 @@
+from collections.abc import Mapping, Sequence
+from typing import TypedDict, cast
+
 import redis.asyncio as redis
 from redis.asyncio.client import PubSub
+from redis.exceptions import ResponseError
+
+_DELETE_IF_EQUALS = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+type StreamEntry = tuple[str, dict[str, str]]
+
+
+class _PendingEntry(TypedDict):
+    message_id: str
+    times_delivered: int
 
 
 class RedisClient:
     def __init__(self, url: str):
         self._redis = redis.from_url(url, decode_responses=True)
+        self._delete_if_equals = self._redis.register_script(_DELETE_IF_EQUALS)  # pyright: ignore[reportUnknownMemberType]
 
     async def publish(self, channel: str, message: str) -> None:
         await self._redis.publish(channel, message)  # pyright: ignore[reportUnknownMemberType]
 
+    async def publish_many(self, messages: Sequence[tuple[str, str]]) -> None:
+        """``PUBLISH`` each ``(channel, message)`` in order, as a single pipelined round trip."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for channel, message in messages:
+                pipe.publish(channel, message)  # pyright: ignore[reportUnknownMemberType]
+            await pipe.execute()  # pyright: ignore[reportUnknownMemberType]
+
     def pubsub(self) -> PubSub:
         return self._redis.pubsub()  # pyright: ignore[reportUnknownMemberType]
 
@@ -23,6 +49,73 @@ class RedisClient:
     async def set(self, key: str, value: str, ttl_seconds: int) -> None:
         await self._redis.set(key, value, ex=ttl_seconds)
 
+    async def mget(self, keys: Sequence[str]) -> list[str | None]:
+        # redis-py types replies as bytes | str; with decode_responses=True they are always str.
+        return cast(list[str | None], await self._redis.mget(keys))
+
+    async def set_many(self, items: Mapping[str, str], ttl_seconds: int) -> None:
+        """``MSET`` plus one ``EXPIRE`` per key, sent as a single pipelined round trip."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.mset(dict(items))  # pyright: ignore[reportUnknownMemberType]
+            for key in items:
+                pipe.expire(key, ttl_seconds)  # pyright: ignore[reportUnknownMemberType]
+            await pipe.execute()  # pyright: ignore[reportUnknownMemberType]
+
+    async def set_if_absent(self, key: str, value: str, ttl_seconds: float) -> bool:
+        return bool(await self._redis.set(key, value, px=int(ttl_seconds * 1000), nx=True))
+
+    async def delete_if_equals(self, key: str, value: str) -> bool:
+        """Atomically delete ``key`` only while it still holds ``value``."""
+        return bool(await self._delete_if_equals(keys=[key], args=[value]))  # pyright: ignore[reportUnknownArgumentType]
+
+    async def xadd(self, stream: str, fields: Mapping[str, str], maxlen: int | None = None) -> str:
+        """Append an entry; with ``maxlen`` the stream is trimmed approximately (``MAXLEN ~``)."""
+        entry_id = await self._redis.xadd(stream, dict(fields), maxlen=maxlen, approximate=True)  # pyright: ignore[reportUnknownMemberType, reportArgumentType]
+        # redis-py types replies as bytes | str; with decode_responses=True they are always str.
+        return cast(str, entry_id)
+
+    async def ensure_group(self, stream: str, group: str) -> None:
+        """Create consumer ``group`` on ``stream`` (and the stream) unless it exists; it starts at new entries."""
+        try:
+            await self._redis.xgroup_create(stream, group, id="$", mkstream=True)  # pyright: ignore[reportUnknownMemberType]
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    async def xreadgroup(
+        self, group: str, consumer: str, streams: Sequence[str], count: int, block_ms: int
+    ) -> list[tuple[str, list[StreamEntry]]]:
+        """New entries for ``consumer``, blocking up to ``block_ms``; ``[(stream, [(id, fields)])]``."""
+        response = await self._redis.xreadgroup(  # pyright: ignore[reportUnknownMemberType]
+            group, consumer, {s: ">" for s in streams}, count=count, block=block_ms
+        )
+        # Untyped in redis-py: a RESP2 list of [stream, [(id, fields)]], None when the block times out.
+        batches = cast(list[tuple[str, list[StreamEntry]]] | None, response)
+        return [(stream, list(entries)) for stream, entries in batches or []]
+
+    async def xack(self, stream: str, group: str, ids: Sequence[str]) -> None:
+        if ids:
+            await self._redis.xack(stream, group, *ids)  # pyright: ignore[reportUnknownMemberType]
+
+    async def xpending_idle(self, stream: str, group: str, idle_ms: int, count: int) -> list[tuple[str, int]]:
+        """Pending entries idle for at least ``idle_ms`` as ``(id, times_delivered)``, oldest first."""
+        response = await self._redis.xpending_range(stream, group, min="-", max="+", count=count, idle=idle_ms)  # pyright: ignore[reportUnknownMemberType]
+        # redis-py parses each reply row into a dict it types only loosely.
+        pending = cast(list[_PendingEntry], response)
+        return [(p["message_id"], p["times_delivered"]) for p in pending]
+
+    async def xclaim(self, stream: str, group: str, consumer: str, idle_ms: int, ids: Sequence[str]) -> list[StreamEntry]:
+        """Take over ``ids`` still idle for ``idle_ms``; entries deleted meanwhile are skipped."""
+        if not ids:
+            return []
+        response = await self._redis.xclaim(stream, group, consumer, idle_ms, list(ids))  # pyright: ignore[reportUnknownMemberType]
+        # Decoded (id, fields) pairs; fields is None for an entry deleted from the stream.
+        claimed = cast(list[tuple[str, dict[str, str] | None]], response)
+        return [(id, fields) for id, fields in claimed if fields is not None]
+
+    async def incr(self, key: str) -> int:
+        return await self._redis.incr(key)
+
     async def delete(self, key: str) -> None:
         await self._redis.delete(key)
 
@@ -0,0 +1,111 @@
+import asyncio
+import os
+import random
+import socket
+import time
+from collections.abc import Callable, Mapping
+
+from application.core.logger import ILogger
+from application.core.ports import IChannelHandler
+from infrastructure.adapters.stream_broker import DATA_FIELD
+from infrastructure.redis.redis_client import RedisClient, StreamEntry
+
+
+class StreamConsumer:
+    """Feeds Redis stream entries to one ``IChannelHandler`` per stream, as a member of ``group``.
+
+    Every process that joins the same group shares the work: each entry is handed
+    to one consumer of the group, read in batches of up to ``batch_size`` with a
+    blocking ``XREADGROUP``. A batch is acknowledged once its handler returns; if
+    the handler fails, or the process dies first, the entries stay pending. Pending
+    entries idle for ``reclaim_idle_seconds`` are claimed by whichever consumer
+    checks next and handled again, so handlers must tolerate repeats. An entry
+    delivered ``max_deliveries`` times is acknowledged unhandled and logged.
+    """
+
+    def __init__(
+        self,
+        client: RedisClient,
+        handlers: Mapping[str, IChannelHandler],
+        app_logger: ILogger,
+        group: str,
+        consumer: str | None = None,
+        batch_size: int = 100,
+        block_ms: int = 5000,
+        reclaim_idle_seconds: float = 60.0,
+        max_deliveries: int = 5,
+        reconnect_delay_seconds: float = 0.5,
+        reconnect_delay_max_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        self._client = client
+        self._handlers = dict(handlers)
+        self._log = app_logger.get_logger(__name__)
+        self._group = group
+        self._consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+        self._batch_size = batch_size
+        self._block_ms = block_ms
+        self._reclaim_idle_ms = int(reclaim_idle_seconds * 1000)
+        self._reclaim_interval = reclaim_idle_seconds
+        self._max_deliveries = max_deliveries
+        self._reconnect_delay = reconnect_delay_seconds
+        self._reconnect_delay_max = reconnect_delay_max_seconds
+        self._clock = clock
+        self._rand = rand
+
+    async def run(self) -> None:
+        """Consume until cancelled."""
+        if not self._handlers:
+            return
+        streams = list(self._handlers)
+        failures = 0
+        while True:
+            try:
+                for stream in streams:
+                    await self._client.ensure_group(stream, self._group)
+                self._log.info("Stream consumer %s joined group %s on %s", self._consumer, self._group, ", ".join(streams))
+                next_reclaim = self._clock()
+                while True:
+                    if self._clock() >= next_reclaim:
+                        await self.reclaim()
+                        next_reclaim = self._clock() + self._reclaim_interval
+                    batches = await self._client.xreadgroup(
+                        self._group, self._consumer, streams, self._batch_size, self._block_ms
+                    )
+                    failures = 0
+                    for stream, entries in batches:
+                        await self._handle(stream, entries)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                delay = min(self._reconnect_delay_max, self._reconnect_delay * 2**failures) * (0.5 + self._rand() / 2)
+                failures += 1
+                self._log.warning("Stream consumer failed, retrying in %.1fs: %s", delay, exc)
+                await asyncio.sleep(delay)
+
+    async def reclaim(self) -> int:
+        """Take over entries other consumers left pending too long; returns how many were handled."""
+        handled = 0
+        for stream in self._handlers:
+            pending = await self._client.xpending_idle(stream, self._group, self._reclaim_idle_ms, self._batch_size)
+            if dead := [id for id, deliveries in pending if deliveries >= self._max_deliveries]:
+                self._log.error("Dropping %d entr(ies) of %s after %d deliveries: %s", len(dead), stream, self._max_deliveries, dead)
+                await self._client.xack(stream, self._group, dead)
+            retry = [id for id, deliveries in pending if deliveries < self._max_deliveries]
+            claimed = await self._client.xclaim(stream, self._group, self._consumer, self._reclaim_idle_ms, retry)
+            if claimed:
+                await self._handle(stream, claimed)
+                handled += len(claimed)
+        return handled
+
+    async def _handle(self, stream: str, entries: list[StreamEntry]) -> None:
+        handler = self._handlers[stream]
+        try:
+            await handler.handle(stream, [fields.get(DATA_FIELD, "") for _, fields in entries])
+        except Exception as exc:
+            self._log.error(
+                "Stream handler for %s failed on %d entr(ies), left pending: %s", stream, len(entries), exc, exc_info=exc
+            )
+            return
+        await self._client.xack(stream, self._group, [id for id, _ in entries])
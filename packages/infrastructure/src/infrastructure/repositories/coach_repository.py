@@ -1,64 +1,174 @@
+from collections.abc import AsyncIterator, Collection, Iterable
 from typing import override
 
-from sqlmodel import select
+from sqlalchemy import ColumnElement, String, case, type_coerce
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel import col
 
 from domain.coaches.coach import Coach
 from domain.coaches.repositories import ICoachRepository
-from domain.coaches.value_objects import Specialization
-from infrastructure.database.base_repository import BaseRepository, SessionFactory
-from infrastructure.database.mappers.coach_mapper import CoachMapper
-from infrastructure.database.models.coach_models import CoachORM, CoachSpecializationORM
+from domain.coaches.value_objects import CoachTier, Specialization
+from domain.members.value_objects import MembershipTier
+from infrastructure.database.base_repository import BaseRepository, LoadProfile, SessionFactory
+from infrastructure.database.change_tracking import changed_columns, sync_children, update_by_id
+from infrastructure.database.identity_map import cached, forget, track, track_all, track_saved
+from infrastructure.database.mappers.coach_mapper import CoachMapper, CoachSnapshot
+from infrastructure.database.models.coach_models import AvailabilitySlotORM, CertificationORM, CoachORM
 
 
 class PostgresCoachRepository(BaseRepository[CoachORM, int]):
     def __init__(self, session_factory: SessionFactory) -> None:
         super().__init__(CoachORM, session_factory)
 
-    async def find_by_email(self, email: str) -> CoachORM | None:
+    async def find_by_email(self, email: str, load: LoadProfile = "full") -> CoachORM | None:
         async with self._session_factory() as session:
-            result = await session.exec(select(CoachORM).where(CoachORM.email == email))
+            result = await session.exec(self._select(load).where(CoachORM.email == email))
             return result.one_or_none()
 
-    async def find_by_specialization(self, spec: Specialization) -> list[CoachORM]:
+    async def exists_by_email(self, email: str) -> bool:
+        return await self.exists_where(col(CoachORM.email) == email)
+
+    async def find_by_specialization(self, spec: Specialization, load: LoadProfile = "full") -> list[CoachORM]:
+        async with self._session_factory() as session:
+            result = await session.exec(self._select(load).where(col(CoachORM.specializations).contains([spec.value])))
+            return list(result.all())
+
+    async def find_match_candidates(
+        self,
+        goal_specs: Collection[Specialization],
+        member_tier: MembershipTier | None,
+        limit: int,
+        load: LoadProfile = "full",
+    ) -> list[CoachORM]:
+        """Coaches with room that serve ``member_tier``, best overlap with ``goal_specs`` first.
+
+        Filtering, overlap counting and ordering all run in the database, so only
+        ``limit`` coaches are loaded. The overlap is scored on each coach's own
+        ``specializations`` array, one containment test per goal specialization.
+        """
+        if not goal_specs:
+            return []
+        tiers = [t.value for t in CoachTier if Coach.tier_serves(t, member_tier)]
+        specs = sorted(s.value for s in goal_specs)
+        column = type_coerce(CoachORM.specializations, ARRAY(String))
+        hits = [case((column.contains([spec]), 1), else_=0) for spec in specs]
+        overlap: ColumnElement[int] = sum(hits[1:], start=hits[0])
         async with self._session_factory() as session:
             result = await session.exec(
-                select(CoachORM)
-                .join(CoachSpecializationORM, CoachORM.id == CoachSpecializationORM.coach_id)  # type: ignore[arg-type]
-                .where(CoachSpecializationORM.specialization == spec.value)
-                .distinct()
+                self._select(load)
+                .where(
+                    column.overlap(specs),
+                    col(CoachORM.current_client_count) < col(CoachORM.max_clients),
+                    col(CoachORM.tier).in_(tiers),
+                )
+                .order_by(overlap.desc(), col(CoachORM.current_client_count), col(CoachORM.id))
+                .limit(limit)
             )
             return list(result.all())
 
+    async def save_changes(self, coach: Coach, before: CoachSnapshot) -> None:
+        """Write only the coach and child rows that differ from ``before``."""
+        assert coach.id is not None
+        parent = {"coach_id": coach.id}
+        async with self._session_factory() as session:
+            await update_by_id(session, CoachORM, coach.id, changed_columns(before.coach, CoachMapper.coach_row(coach)))
+            await sync_children(
+                session, CertificationORM, parent, before.certifications, coach.certifications, CoachMapper.certification_row
+            )
+            await sync_children(
+                session, AvailabilitySlotORM, parent, before.available_slots, coach.available_slots, CoachMapper.slot_row
+            )
+
 
 class CoachRepository(ICoachRepository):
+    """Listings with ``with_children=False`` load coach rows only.
+
+    Their certifications and slots come back empty, so those coaches are kept out
+    of the identity map where a later ``get_by_id`` could pick them up; saving one
+    drops the coach from the map instead of registering the partial copy.
+    """
+
     def __init__(self, repo: PostgresCoachRepository) -> None:
         self._repo = repo
 
     @override
     async def get_by_id(self, id: int) -> Coach:
+        if (coach := cached(Coach, id)) is not None:
+            return coach
         orm = await self._repo.get_by_id(id)
-        return CoachMapper.to_domain(orm)
+        return track(CoachMapper.to_domain(orm))
+
+    @override
+    async def get_by_ids(self, ids: Collection[int]) -> list[Coach]:
+        orms = await self._repo.find_by_ids(ids)
+        return track_all(CoachMapper.to_domain(o) for o in orms)
 
     @override
     async def get_by_email(self, email: str) -> Coach | None:
         orm = await self._repo.find_by_email(email)
-        return CoachMapper.to_domain(orm) if orm else None
+        return track(CoachMapper.to_domain(orm)) if orm else None
 
     @override
-    async def find_by_specialization(self, spec: Specialization) -> list[Coach]:
-        orms = await self._repo.find_by_specialization(spec)
-        return [CoachMapper.to_domain(o) for o in orms]
+    async def exists_by_email(self, email: str) -> bool:
+        return await self._repo.exists_by_email(email)
 
     @override
-    async def get_all(self) -> list[Coach]:
-        orms = await self._repo.find_all()
-        return [CoachMapper.to_domain(o) for o in orms]
+    async def find_by_specialization(self, spec: Specialization, with_children: bool = True) -> list[Coach]:
+        orms = await self._repo.find_by_specialization(spec, _load(with_children))
+        return _listed(orms, with_children)
+
+    @override
+    async def find_match_candidates(
+        self,
+        goal_specs: Collection[Specialization],
+        member_tier: MembershipTier | None,
+        limit: int,
+    ) -> list[Coach]:
+        orms = await self._repo.find_match_candidates(goal_specs, member_tier, limit)
+        return track_all(CoachMapper.to_domain(o) for o in orms)
+
+    @override
+    async def get_all(self, with_children: bool = True) -> list[Coach]:
+        orms = await self._repo.find_all(_load(with_children))
+        return _listed(orms, with_children)
+
+    @override
+    async def get_page(self, after: int | None, limit: int, with_children: bool = True) -> list[Coach]:
+        orms = await self._repo.find_page(after, limit, _load(with_children))
+        return _listed(orms, with_children)
+
+    @override
+    async def stream_all(self, with_children: bool = True) -> AsyncIterator[Coach]:
+        async for orm in self._repo.stream_all(load=_load(with_children)):
+            yield CoachMapper.to_domain(orm, with_children)
 
     @override
     async def save(self, coach: Coach) -> Coach:
-        orm = await self._repo.save(CoachMapper.to_orm(coach))
-        return CoachMapper.to_domain(orm)
+        before = coach.persisted_state
+        if coach.id is None or not isinstance(before, CoachSnapshot):
+            orm = await self._repo.save(CoachMapper.to_orm(coach))
+            saved = CoachMapper.to_domain(orm)
+            track_saved(saved)
+            return saved
+        await self._repo.save_changes(coach, before)
+        coach.mark_persisted(CoachMapper.snapshot(coach, shallow=before.shallow))
+        if before.shallow:
+            forget(Coach, coach.id)
+        else:
+            track_saved(coach)
+        return coach
 
     @override
     async def delete(self, id: int) -> None:
         await self._repo.delete(id)
+        forget(Coach, id)
+
+
+def _load(with_children: bool) -> LoadProfile:
+    return "full" if with_children else "shallow"
+
+
+def _listed(orms: Iterable[CoachORM], with_children: bool) -> list[Coach]:
+    if with_children:
+        return track_all(CoachMapper.to_domain(o) for o in orms)
+    return [CoachMapper.to_domain(o, children=False) for o in orms]
@@ -0,0 +1,58 @@
+import itertools
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import col, delete, func, or_, select
+
+from infrastructure.database.base_repository import BaseRepository, SessionFactory
+from infrastructure.database.change_tracking import Row
+from infrastructure.database.models.exercise_models import ExerciseCatalogORM
+
+_UPSERT_CHUNK_SIZE = 1000
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class PostgresExerciseCatalogRepository(BaseRepository[ExerciseCatalogORM, int]):
+    def __init__(self, session_factory: SessionFactory) -> None:
+        super().__init__(ExerciseCatalogORM, session_factory)
+
+    async def search(self, term: str, limit: int) -> list[ExerciseCatalogORM]:
+        """Exact name first, then prefix matches, then trigram-similar names.
+
+        Prefix (``ILIKE``) and similarity (``%``) lookups are both served by the
+        ``gin_trgm_ops`` index on ``name``.
+        """
+        name = col(ExerciseCatalogORM.name)
+        exact = func.lower(name) == term.lower()
+        prefix = name.ilike(f"{_escape_like(term)}%", escape="\\")
+        similar = name.op("%")(term)
+        async with self._session_factory() as session:
+            result = await session.exec(
+                select(ExerciseCatalogORM)
+                .where(or_(prefix, similar))
+                .order_by(exact.desc(), prefix.desc(), func.similarity(name, term).desc(), name)
+                .limit(limit)
+            )
+            return list(result.all())
+
+    async def upsert_many(self, rows: Sequence[Row], synced_at: datetime) -> None:
+        """Insert or rename catalog entries (``id``, ``name``) and stamp them with ``synced_at``."""
+        async with self._session_factory() as session:
+            for chunk in itertools.batched(rows, _UPSERT_CHUNK_SIZE):
+                stmt = insert(ExerciseCatalogORM).values([{**row, "synced_at": synced_at} for row in chunk])
+                await session.exec(
+                    stmt.on_conflict_do_update(
+                        index_elements=[col(ExerciseCatalogORM.id)],
+                        set_={"name": stmt.excluded.name, "synced_at": stmt.excluded.synced_at},
+                    )
+                )
+
+    async def delete_synced_before(self, cutoff: datetime) -> int:
+        """Drop entries a full sync started at ``cutoff`` did not see again."""
+        async with self._session_factory() as session:
+            result = await session.exec(delete(ExerciseCatalogORM).where(col(ExerciseCatalogORM.synced_at) < cutoff))
+            return result.rowcount
@@ -1,23 +1,38 @@
+from collections.abc import AsyncIterator, Collection
 from typing import override
 
-from sqlmodel import select
+from sqlmodel import col
 
 from domain.members.member import Member
 from domain.members.repositories import IMemberRepository
-from infrastructure.database.base_repository import BaseRepository, SessionFactory
-from infrastructure.database.mappers.member_mapper import MemberMapper
-from infrastructure.database.models.member_models import MemberORM
+from infrastructure.database.base_repository import BaseRepository, LoadProfile, SessionFactory
+from infrastructure.database.change_tracking import changed_columns, sync_children, update_by_id
+from infrastructure.database.identity_map import cached, forget, track, track_all, track_saved
+from infrastructure.database.mappers.member_mapper import MemberMapper, MemberSnapshot
+from infrastructure.database.models.member_models import FitnessGoalORM, MemberORM
 
 
 class PostgresMemberRepository(BaseRepository[MemberORM, int]):
     def __init__(self, session_factory: SessionFactory) -> None:
         super().__init__(MemberORM, session_factory)
 
-    async def find_by_email(self, email: str) -> MemberORM | None:
+    async def find_by_email(self, email: str, load: LoadProfile = "full") -> MemberORM | None:
         async with self._session_factory() as session:
-            result = await session.exec(select(MemberORM).where(MemberORM.email == email))
+            result = await session.exec(self._select(load).where(MemberORM.email == email))
             return result.one_or_none()
 
+    async def exists_by_email(self, email: str) -> bool:
+        return await self.exists_where(col(MemberORM.email) == email)
+
+    async def save_changes(self, member: Member, before: MemberSnapshot) -> None:
+        """Write only the member and goal rows that differ from ``before``."""
+        assert member.id is not None
+        async with self._session_factory() as session:
+            await update_by_id(session, MemberORM, member.id, changed_columns(before.member, MemberMapper.member_row(member)))
+            await sync_children(
+                session, FitnessGoalORM, {"member_id": member.id}, before.goals, member.goals, MemberMapper.goal_row
+            )
+
 
 class MemberRepository(IMemberRepository):
     def __init__(self, repo: PostgresMemberRepository) -> None:
@@ -25,24 +40,54 @@ class MemberRepository(IMemberRepository):
 
     @override
     async def get_by_id(self, id: int) -> Member:
+        if (member := cached(Member, id)) is not None:
+            return member
         orm = await self._repo.get_by_id(id)
-        return MemberMapper.to_domain(orm)
+        return track(MemberMapper.to_domain(orm))
+
+    @override
+    async def get_by_ids(self, ids: Collection[int]) -> list[Member]:
+        orms = await self._repo.find_by_ids(ids)
+        return track_all(MemberMapper.to_domain(o) for o in orms)
 
     @override
     async def get_by_email(self, email: str) -> Member | None:
         orm = await self._repo.find_by_email(email)
-        return MemberMapper.to_domain(orm) if orm else None
+        return track(MemberMapper.to_domain(orm)) if orm else None
+
+    @override
+    async def exists_by_email(self, email: str) -> bool:
+        return await self._repo.exists_by_email(email)
 
     @override
     async def get_all(self) -> list[Member]:
         orms = await self._repo.find_all()
-        return [MemberMapper.to_domain(o) for o in orms]
+        return track_all(MemberMapper.to_domain(o) for o in orms)
+
+    @override
+    async def get_page(self, after: int | None, limit: int) -> list[Member]:
+        orms = await self._repo.find_page(after, limit)
+        return track_all(MemberMapper.to_domain(o) for o in orms)
+
+    @override
+    async def stream_all(self) -> AsyncIterator[Member]:
+        async for orm in self._repo.stream_all():
+            yield MemberMapper.to_domain(orm)
 
     @override
     async def save(self, member: Member) -> Member:
-        orm = await self._repo.save(MemberMapper.to_orm(member))
-        return MemberMapper.to_domain(orm)
+        before = member.persisted_state
+        if member.id is None or not isinstance(before, MemberSnapshot):
+            orm = await self._repo.save(MemberMapper.to_orm(member))
+            saved = MemberMapper.to_domain(orm)
+            track_saved(saved)
+            return saved
+        await self._repo.save_changes(member, before)
+        member.mark_persisted(MemberMapper.snapshot(member))
+        track_saved(member)
+        return member
 
     @override
     async def delete(self, id: int) -> None:
         await self._repo.delete(id)
+        forget(Member, id)
@@ -0,0 +1,66 @@
+from collections.abc import Sequence
+from typing import override
+
+from sqlmodel import col, delete, select, update
+
+from application.core.ports import IOutbox, OutboxMessage
+from domain.shared.events import ApplicationEvent
+from infrastructure.database.base_repository import SessionFactory
+from infrastructure.database.change_tracking import insert_rows
+from infrastructure.database.models.outbox_models import OutboxMessageORM
+
+_MAX_ERROR_LENGTH = 2000
+
+
+class PostgresOutbox(IOutbox):
+    """The ``outbox`` table; every method joins the caller's transaction."""
+
+    def __init__(self, session_factory: SessionFactory) -> None:
+        self._session_factory = session_factory
+
+    @override
+    async def add(self, events: Sequence[ApplicationEvent]) -> None:
+        """Append ``events`` with one multi-row ``INSERT``."""
+        async with self._session_factory() as session:
+            await insert_rows(
+                session,
+                OutboxMessageORM,
+                [{"event_type": type(e).__name__, "payload": e.model_dump(mode="json")} for e in events],
+            )
+
+    @override
+    async def claim(self, limit: int, max_attempts: int) -> list[OutboxMessage]:
+        """Lock up to ``limit`` of the oldest deliverable messages until the transaction ends.
+
+        ``SKIP LOCKED`` lets several relays drain the table side by side without
+        waiting on, or handing out, each other's rows.
+        """
+        async with self._session_factory() as session:
+            result = await session.exec(
+                select(OutboxMessageORM)
+                .where(col(OutboxMessageORM.attempts) < max_attempts)
+                .order_by(col(OutboxMessageORM.id))
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            return [
+                OutboxMessage(id=m.id, event_type=m.event_type, payload=m.payload, attempts=m.attempts)
+                for m in result.all()
+                if m.id is not None
+            ]
+
+    @override
+    async def delete(self, ids: Sequence[int]) -> None:
+        if not ids:
+            return
+        async with self._session_factory() as session:
+            await session.exec(delete(OutboxMessageORM).where(col(OutboxMessageORM.id).in_(ids)))
+
+    @override
+    async def record_failure(self, id: int, error: str) -> None:
+        async with self._session_factory() as session:
+            await session.exec(
+                update(OutboxMessageORM)
+                .where(col(OutboxMessageORM.id) == id)
+                .values(attempts=OutboxMessageORM.attempts + 1, last_error=error[:_MAX_ERROR_LENGTH])
+            )
@@ -1,25 +1,116 @@
-from typing import override
+from collections.abc import Sequence
+from typing import Any, override
 
-from sqlmodel import select
+import sqlalchemy
+from sqlalchemy import ColumnElement, inspect
 
 from domain.plans.repositories import ITrainingPlanRepository
 from domain.plans.training_plan import TrainingPlan
-from infrastructure.database.base_repository import BaseRepository, SessionFactory
-from infrastructure.database.mappers.plan_mapper import PlanMapper
-from infrastructure.database.models.plan_models import TrainingPlanORM
+from infrastructure.database.base_repository import BaseRepository, LoadProfile, SessionFactory
+from infrastructure.database.change_tracking import (
+    Row,
+    changed_columns,
+    delete_where_in,
+    insert_rows,
+    sync_children,
+    update_by_id,
+)
+from infrastructure.database.exceptions import EntityNotFoundException
+from infrastructure.database.identity_map import cached, forget, track, track_all, track_saved
+from infrastructure.database.mappers.plan_mapper import PlanMapper, PlanSnapshot
+from infrastructure.database.models.plan_models import PlannedExerciseORM, TrainingPlanORM, WorkoutSessionORM
+
+_PLANS = inspect(TrainingPlanORM).local_table
+_SESSIONS = inspect(WorkoutSessionORM).local_table
+_EXERCISES = inspect(PlannedExerciseORM).local_table
+_PLAN_COLUMNS = ("id", "member_id", "coach_id", "name", "status", "starts_at", "ends_at")
+_SESSION_COLUMNS = ("id", "name", "scheduled_date", "status", "completed_at", "notes")
+_EXERCISE_COLUMNS = ("exercise_id", "name", "sets", "reps", "rest_seconds")
 
 
 class PostgresTrainingPlanRepository(BaseRepository[TrainingPlanORM, int]):
     def __init__(self, session_factory: SessionFactory) -> None:
         super().__init__(TrainingPlanORM, session_factory)
 
-    async def find_by_member(self, member_id: int) -> list[TrainingPlanORM]:
+    async def find_by_member(self, member_id: int, load: LoadProfile = "full") -> list[TrainingPlanORM]:
         async with self._session_factory() as session:
             result = await session.exec(
-                select(TrainingPlanORM).where(TrainingPlanORM.member_id == member_id)
+                self._select(load)
+                .where(TrainingPlanORM.member_id == member_id)
             )
             return list(result.all())
 
+    async def find_trees(self, *criteria: ColumnElement[bool]) -> list[Row]:
+        """Plans matching ``criteria`` with their sessions and exercises, in one round-trip.
+
+        The three tables are outer-joined and the flat rows folded back into the
+        nested dicts ``PlanMapper.from_tree`` takes, without building ORM objects.
+        Plans, sessions and exercises come back in id order.
+        """
+        plan_cols = [_PLANS.c[c] for c in _PLAN_COLUMNS]
+        session_cols = [_SESSIONS.c[c] for c in _SESSION_COLUMNS]
+        exercise_cols = [_EXERCISES.c.id, *(_EXERCISES.c[c] for c in _EXERCISE_COLUMNS)]
+        stmt = (
+            sqlalchemy.select(*plan_cols, *session_cols, *exercise_cols)
+            .select_from(
+                _PLANS.outerjoin(_SESSIONS, _SESSIONS.c.plan_id == _PLANS.c.id).outerjoin(
+                    _EXERCISES, _EXERCISES.c.session_id == _SESSIONS.c.id
+                )
+            )
+            .where(*criteria)
+            .order_by(_PLANS.c.id, _SESSIONS.c.id, _EXERCISES.c.id)
+        )
+        async with self._session_factory() as session:
+            connection = await session.connection()
+            result = await connection.execute(stmt)
+            rows: Sequence[sqlalchemy.Row[*tuple[Any, ...]]] = result.all()
+
+        split_s, split_e = len(plan_cols), len(plan_cols) + len(session_cols)
+        plans: dict[int, Row] = {}
+        sessions: dict[int, Row] = {}
+        for row in rows:
+            plan = plans.get(row[0])
+            if plan is None:
+                plan = plans[row[0]] = dict(zip(_PLAN_COLUMNS, row[:split_s], strict=True), sessions=[])
+            session_id = row[split_s]
+            if session_id is None:
+                continue
+            workout = sessions.get(session_id)
+            if workout is None:
+                workout = sessions[session_id] = dict(zip(_SESSION_COLUMNS, row[split_s:split_e], strict=True), exercises=[])
+                plan["sessions"].append(workout)
+            if row[split_e] is not None:
+                workout["exercises"].append(dict(zip(_EXERCISE_COLUMNS, row[split_e + 1 :], strict=True)))
+        return list(plans.values())
+
+    async def save_changes(self, plan: TrainingPlan, before: PlanSnapshot) -> None:
+        """Write only the plan, session and exercise rows that differ from ``before``."""
+        assert plan.id is not None
+        async with self._session_factory() as session:
+            await update_by_id(session, TrainingPlanORM, plan.id, changed_columns(before.plan, PlanMapper.plan_row(plan)))
+
+            kept = {s.id for s in plan.sessions if s.id is not None}
+            removed = [sid for sid in before.sessions if sid not in kept]
+            await delete_where_in(session, PlannedExerciseORM, "session_id", removed)
+            await sync_children(
+                session, WorkoutSessionORM, {"plan_id": plan.id}, before.sessions, plan.sessions, PlanMapper.session_row
+            )
+
+            # Planned exercises have no identity in the domain, so a session whose
+            # exercise list changed gets its exercise rows replaced as a whole.
+            stale: list[int] = []
+            exercise_rows: list[Row] = []
+            for s in plan.sessions:
+                assert s.id is not None
+                rows = tuple(PlanMapper.exercise_row(e) for e in s.exercises)
+                if rows == before.exercises.get(s.id, ()):
+                    continue
+                if s.id in before.exercises:
+                    stale.append(s.id)
+                exercise_rows.extend({"session_id": s.id} | r for r in rows)
+            await delete_where_in(session, PlannedExerciseORM, "session_id", stale)
+            await insert_rows(session, PlannedExerciseORM, exercise_rows)
+
 
 class TrainingPlanRepository(ITrainingPlanRepository):
     def __init__(self, repo: PostgresTrainingPlanRepository) -> None:
@@ -27,19 +118,32 @@ class TrainingPlanRepository(ITrainingPlanRepository):
 
     @override
     async def get_by_id(self, id: int) -> TrainingPlan:
-        orm = await self._repo.get_by_id(id)
-        return PlanMapper.to_domain(orm)
+        if (plan := cached(TrainingPlan, id)) is not None:
+            return plan
+        trees = await self._repo.find_trees(_PLANS.c.id == id)
+        if not trees:
+            raise EntityNotFoundException(TrainingPlanORM.__name__, id)
+        return track(PlanMapper.from_tree(trees[0]))
 
     @override
     async def get_by_member(self, member_id: int) -> list[TrainingPlan]:
-        orms = await self._repo.find_by_member(member_id)
-        return [PlanMapper.to_domain(o) for o in orms]
+        trees = await self._repo.find_trees(_PLANS.c.member_id == member_id)
+        return track_all(PlanMapper.from_tree(t) for t in trees)
 
     @override
     async def save(self, plan: TrainingPlan) -> TrainingPlan:
-        orm = await self._repo.save(PlanMapper.to_orm(plan))
-        return PlanMapper.to_domain(orm)
+        before = plan.persisted_state
+        if plan.id is None or not isinstance(before, PlanSnapshot):
+            orm = await self._repo.save(PlanMapper.to_orm(plan))
+            saved = PlanMapper.to_domain(orm)
+            track_saved(saved)
+            return saved
+        await self._repo.save_changes(plan, before)
+        plan.mark_persisted(PlanMapper.snapshot(plan))
+        track_saved(plan)
+        return plan
 
     @override
     async def delete(self, id: int) -> None:
         await self._repo.delete(id)
+        forget(TrainingPlan, id)
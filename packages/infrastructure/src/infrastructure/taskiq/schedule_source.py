@@ -0,0 +1,27 @@
+from collections.abc import Callable, Mapping
+from typing import override
+
+from taskiq import ScheduledTask, ScheduleSource
+
+
+class ConfiguredCronSource(ScheduleSource):
+    """Cron schedules by task name, read from configuration when the scheduler starts.
+
+    Unlike ``LabelScheduleSource`` the cron is not fixed when the task module is
+    imported, so importing tasks never reads settings.
+    """
+
+    def __init__(self, load_crons: Callable[[], Mapping[str, str]]) -> None:
+        self._load_crons = load_crons
+        self._schedules: list[ScheduledTask] = []
+
+    @override
+    async def startup(self) -> None:
+        self._schedules = [
+            ScheduledTask(task_name=name, labels={}, args=[], kwargs={}, schedule_id=name, cron=cron)
+            for name, cron in self._load_crons().items()
+        ]
+
+    @override
+    async def get_schedules(self) -> list[ScheduledTask]:
+        return self._schedules
@@ -1,7 +1,11 @@
+import logging
+from unittest.mock import MagicMock
+
 import pytest
 import pytest_asyncio
-from sqlalchemy import text
+from sqlalchemy import event, text
 
+from application.core.logger import ILogger
 from infrastructure.database.base_repository import BaseRepository
 from infrastructure.database.migrations import run_migrations
 from infrastructure.database.models.member_models import MemberORM
@@ -16,6 +20,27 @@ async def infra_database(postgres_url):
     await db.engine.dispose()
 
 
+@pytest.fixture()
+def statement_log(infra_database):
+    """Collect ``(statement, parameter_sets)`` for every statement sent to the database."""
+    log: list[tuple[str, int]] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        log.append((statement, len(parameters) if executemany else 1))
+
+    engine = infra_database.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    yield log
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture()
+def fake_logger():
+    mock = MagicMock(spec=ILogger)
+    mock.get_logger.return_value = logging.getLogger("test")
+    return mock
+
+
 @pytest.fixture()
 def base_repo(infra_database):
     return BaseRepository(MemberORM, infra_database.session)
@@ -27,6 +52,6 @@ async def _clean_db(infra_database):
     async with infra_database.engine.begin() as conn:
         await conn.execute(text(
             "TRUNCATE planned_exercises, workout_sessions, training_plans, "
-            "coach_spec_rows, availability_slots, certifications, coaches, "
-            "fitness_goals, members RESTART IDENTITY CASCADE"
+            "availability_slots, certifications, coaches, "
+            "fitness_goals, members, exercise_catalog, outbox RESTART IDENTITY CASCADE"
         ))
@@ -2,6 +2,9 @@
 
 from datetime import date, timedelta
 
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
 from infrastructure.database.models.member_models import MemberORM
 
 
@@ -81,3 +84,84 @@ async def test_exists_true(base_repo):
 
 async def test_exists_false(base_repo):
     assert await base_repo.exists(999999) is False
+
+
+async def test_find_by_ids_returns_existing_rows(base_repo):
+    a = await base_repo.save(_make_member("ids-a@test.com"))
+    b = await base_repo.save(_make_member("ids-b@test.com"))
+    found = await base_repo.find_by_ids([a.id, b.id, 999999])
+    assert sorted(m.id for m in found) == sorted([a.id, b.id])
+    assert await base_repo.find_by_ids([]) == []
+
+
+async def test_find_page_orders_by_id_after_cursor(base_repo):
+    saved = [await base_repo.save(_make_member(f"p{i}@test.com")) for i in range(5)]
+    first = await base_repo.find_page(None, 2)
+    assert [m.id for m in first] == [saved[0].id, saved[1].id]
+    rest = await base_repo.find_page(first[-1].id, 10)
+    assert [m.id for m in rest] == [m.id for m in saved[2:]]
+
+
+async def test_stream_all_yields_every_row(base_repo):
+    await base_repo.save(_make_member("s1@test.com"))
+    await base_repo.save(_make_member("s2@test.com"))
+    emails = [m.email async for m in base_repo.stream_all(batch_size=1)]
+    assert emails == ["s1@test.com", "s2@test.com"]
+
+
+async def test_save_all_bulk_inserts_one_statement_per_chunk(base_repo, statement_log):
+    members = [_make_member(f"bulk{i}@test.com") for i in range(5)]
+    saved = await base_repo.save_all(members, bulk=True, chunk_size=2)
+
+    inserts = [stmt for stmt, _ in statement_log if stmt.startswith("INSERT INTO members")]
+    assert len(inserts) == 3
+    assert [m.id for m in saved] == sorted(m.id for m in saved)
+    assert {m.email for m in await base_repo.find_all()} == {m.email for m in members}
+
+
+async def test_save_all_bulk_updates_existing_rows_in_one_statement(base_repo, statement_log):
+    saved = await base_repo.save_all([_make_member(f"upd{i}@test.com") for i in range(3)], bulk=True)
+    for m in saved:
+        m.first_name = f"Renamed-{m.email}"
+    saved[0].active_plan_id = None
+    statement_log.clear()
+
+    await base_repo.save_all(saved, bulk=True)
+
+    assert len(statement_log) == 1
+    assert statement_log[0][0].startswith("UPDATE members")
+    for m in saved:
+        found = await base_repo.find_by_id(m.id)
+        assert found is not None
+        assert found.first_name == f"Renamed-{m.email}"
+
+
+async def test_exists_is_a_single_select(base_repo, statement_log):
+    member = await base_repo.save(_make_member("one@test.com"))
+    statement_log.clear()
+    assert await base_repo.exists(member.id)
+    assert len(statement_log) == 1
+
+
+async def test_shallow_load_skips_relationships(base_repo, statement_log):
+    member = await base_repo.save(_make_member("shallow@test.com"))
+    statement_log.clear()
+
+    found = await base_repo.find_by_id(member.id, load="shallow")
+
+    assert found is not None
+    assert len(statement_log) == 1
+    with pytest.raises(InvalidRequestError):
+        _ = found.goals
+
+
+async def test_explicit_load_profile(base_repo, statement_log):
+    await base_repo.save(_make_member("explicit@test.com"))
+    statement_log.clear()
+
+    [found] = await base_repo.find_all(load=["goals"])
+
+    assert found.goals == []
+    assert len(statement_log) == 2
+    with pytest.raises(ValueError, match="no relationships"):
+        await base_repo.find_all(load=["coach"])
@@ -0,0 +1,106 @@
+"""Tests for micro-batched publishing in RedisBrokerAdapter."""
+
+import asyncio
+
+import pytest
+
+from application.core.logger import ILogger
+from infrastructure.adapters.broker_adapter import RedisBrokerAdapter
+from infrastructure.redis.redis_client import RedisClient
+
+
+class _RecordingClient:
+    def __init__(self) -> None:
+        self.single: list[tuple[str, str]] = []
+        self.batches: list[list[tuple[str, str]]] = []
+        self.fail = False
+
+    async def publish(self, channel: str, message: str) -> None:
+        self.single.append((channel, message))
+
+    async def publish_many(self, messages) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.batches.append(list(messages))
+
+
+def _adapter(client, app_logger: ILogger, max_batch: int = 3, max_delay_seconds: float = 60.0) -> RedisBrokerAdapter:
+    return RedisBrokerAdapter(client, app_logger, max_batch=max_batch, max_delay_seconds=max_delay_seconds)  # pyright: ignore[reportArgumentType]
+
+
+class TestMicroBatching:
+    async def test_unbatched_publishes_each_message(self, fake_logger):
+        client = _RecordingClient()
+        broker = _adapter(client, fake_logger, max_batch=1)
+        await broker.publish("a", "1")
+        assert client.single == [("a", "1")]
+
+    async def test_full_batch_is_flushed_in_one_pipeline(self, fake_logger):
+        client = _RecordingClient()
+        broker = _adapter(client, fake_logger)
+        for i in range(7):
+            await broker.publish("plan.completed", str(i))
+
+        assert client.batches == [
+            [("plan.completed", "0"), ("plan.completed", "1"), ("plan.completed", "2")],
+            [("plan.completed", "3"), ("plan.completed", "4"), ("plan.completed", "5")],
+        ]
+        await broker.close()
+        assert client.batches[-1] == [("plan.completed", "6")]
+
+    async def test_partial_batch_is_flushed_after_delay(self, fake_logger):
+        client = _RecordingClient()
+        broker = _adapter(client, fake_logger, max_batch=100, max_delay_seconds=0.01)
+        await broker.publish("member.registered", "1")
+        await broker.publish("plan.completed", "2")
+        assert client.batches == []
+
+        await asyncio.sleep(0.05)
+        assert client.batches == [[("member.registered", "1"), ("plan.completed", "2")]]
+
+    async def test_close_flushes_pending_messages_and_cancels_timer(self, fake_logger):
+        client = _RecordingClient()
+        broker = _adapter(client, fake_logger, max_batch=100)
+        await broker.publish("a", "1")
+
+        await broker.close()
+        await asyncio.sleep(0)
+
+        assert client.batches == [[("a", "1")]]
+        assert broker._timer is None
+
+    async def test_failed_flush_is_logged_not_raised(self, caplog, fake_logger):
+        client = _RecordingClient()
+        client.fail = True
+        broker = _adapter(client, fake_logger, max_batch=2)
+        await broker.publish("a", "1")
+        await broker.publish("a", "2")
+
+        assert "Dropped 2 broker message(s)" in caplog.text
+
+
+@pytest.fixture()
+async def redis_client(redis_url):
+    client = RedisClient(redis_url)
+    yield client
+    await client.close()
+
+
+async def test_pipelined_messages_reach_subscribers_in_order(redis_client, fake_logger):
+    pubsub = await redis_client.subscribe("test.broker")
+    broker = RedisBrokerAdapter(redis_client, fake_logger, max_batch=10)  # pyright: ignore[reportArgumentType]
+    try:
+        for i in range(3):
+            await broker.publish("test.broker", str(i))
+        await broker.close()
+
+        received: list[str] = []
+        for _ in range(50):
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.1)  # pyright: ignore[reportUnknownMemberType]
+            if message is not None:
+                received.append(message["data"])  # pyright: ignore[reportUnknownArgumentType]
+            if len(received) == 3:
+                break
+        assert received == ["0", "1", "2"]
+    finally:
+        await pubsub.aclose()
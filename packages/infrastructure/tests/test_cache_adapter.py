@@ -0,0 +1,209 @@
+"""Tests for LocalCache, the two-tier Redis cache adapter and the Redis lock manager."""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel, TypeAdapter
+
+from application.core.logger import ILogger
+from infrastructure.adapters.cache_adapter import RedisCacheAdapter, TwoTierCacheAdapter
+from infrastructure.adapters.lock_adapter import RedisLockManager
+from infrastructure.cache.local_cache import LocalCache
+from infrastructure.redis.redis_client import RedisClient
+
+
+class _Tally(BaseModel):
+    counts: list[int]
+
+
+_TALLIES = TypeAdapter(list[_Tally])
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLocalCache:
+    def test_hit_and_miss_are_counted(self):
+        cache = LocalCache(max_bytes=1024, ttl_seconds=10)
+        cache.set("a", "1")
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_entry_expires_after_ttl(self):
+        clock = _Clock()
+        cache = LocalCache(max_bytes=1024, ttl_seconds=10, clock=clock)
+        cache.set("a", "1")
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.stats.expirations == 1
+        assert cache.size_bytes == 0
+
+    def test_shorter_ttl_wins(self):
+        clock = _Clock()
+        cache = LocalCache(max_bytes=1024, ttl_seconds=10, clock=clock)
+        cache.set("a", "1", ttl_seconds=2)
+        clock.now = 2
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used_by_size(self):
+        cache = LocalCache(max_bytes=10, ttl_seconds=10)
+        cache.set("a", "xxxx")
+        cache.set("b", "xxxx")
+        cache.get("a")
+        cache.set("c", "xxxx")
+        assert cache.get("b") is None
+        assert cache.get("a") == "xxxx"
+        assert cache.size_bytes == 8
+        assert cache.stats.evictions == 1
+
+    def test_value_larger_than_budget_is_not_stored(self):
+        cache = LocalCache(max_bytes=4, ttl_seconds=10)
+        cache.set("a", "xxxxx")
+        assert len(cache) == 0
+
+    def test_size_counts_encoded_bytes(self):
+        cache = LocalCache(max_bytes=1024, ttl_seconds=10)
+        cache.set("a", "ż")
+        assert cache.size_bytes == 2
+
+
+@pytest.fixture()
+async def redis_client(redis_url):
+    client = RedisClient(redis_url)
+    yield client
+    await client._redis.flushdb()
+    await client.close()
+
+
+def _two_tier(client: RedisClient, app_logger: ILogger, keep_decoded: bool = False) -> TwoTierCacheAdapter:
+    return TwoTierCacheAdapter(
+        remote=RedisCacheAdapter(client),
+        local=LocalCache(max_bytes=1024, ttl_seconds=30),
+        client=client,
+        channel="test.cache.invalidate",
+        app_logger=app_logger,
+        keep_decoded=keep_decoded,
+    )
+
+
+async def _wait_for_invalidation(cache: TwoTierCacheAdapter) -> None:
+    for _ in range(50):
+        if cache.stats.invalidations:
+            return
+        await asyncio.sleep(0.02)
+
+
+class TestTwoTierCacheAdapter:
+    async def test_get_populates_local_tier(self, redis_client, fake_logger):
+        cache = _two_tier(redis_client, fake_logger)
+        await redis_client.set("k", "v", 60)
+
+        assert await cache.get("k") == "v"
+        await redis_client.delete("k")
+        assert await cache.get("k") == "v"
+        assert cache.stats.hits == 1
+
+    async def test_get_many_reads_local_hits_and_fetches_only_misses(self, redis_client, fake_logger):
+        cache = _two_tier(redis_client, fake_logger)
+        await cache.set("a", "1", 60)
+        await redis_client.set("b", "2", 60)
+        await redis_client.delete("a")
+
+        assert await cache.get_many(["a", "b", "c"]) == ["1", "2", None]
+        assert await cache.get("b") == "2"
+        assert cache.stats.hits == 2
+
+    async def test_set_many_writes_both_tiers_with_ttl(self, redis_client, fake_logger):
+        cache = _two_tier(redis_client, fake_logger)
+        await cache.set_many({"a": "1", "b": "2"}, 60)
+
+        assert await redis_client.mget(["a", "b"]) == ["1", "2"]
+        assert 0 < await redis_client._redis.ttl("b") <= 60
+        assert await cache.get_many(["a", "b"]) == ["1", "2"]
+        assert cache.stats.hits == 2
+
+    async def test_incr_bumps_remote_counter_and_drops_local_copy(self, redis_client, fake_logger):
+        cache = _two_tier(redis_client, fake_logger)
+        await cache.set("gen", "4", 60)
+
+        assert await cache.incr("gen") == 5
+        assert await cache.get("gen") == "5"
+
+    async def test_decoded_hits_are_copies(self, redis_client, fake_logger):
+        cache = _two_tier(redis_client, fake_logger, keep_decoded=True)
+        tallies = [_Tally(counts=[1])]
+        await cache.set_model("t", tallies, _TALLIES, 60)
+        tallies[0].counts.append(2)
+
+        first = await cache.get_model("t", _TALLIES)
+        assert first is not None
+        first[0].counts.append(3)
+
+        assert await cache.get_model("t", _TALLIES) == [_Tally(counts=[1])]
+        assert cache.stats.hits == 2
+
+    async def test_delete_evicts_other_processes(self, redis_client, fake_logger):
+        writer, reader = _two_tier(redis_client, fake_logger), _two_tier(redis_client, fake_logger)
+        listener = asyncio.create_task(reader.listen_for_invalidations())
+        try:
+            await asyncio.sleep(0.1)
+            await redis_client.set("k", "v", 60)
+            assert await reader.get("k") == "v"
+
+            await writer.delete("k")
+            await _wait_for_invalidation(reader)
+
+            assert reader.stats.invalidations == 1
+            assert await reader.get("k") is None
+        finally:
+            listener.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await listener
+
+    async def test_set_evicts_other_processes(self, redis_client, fake_logger):
+        writer, reader = _two_tier(redis_client, fake_logger), _two_tier(redis_client, fake_logger)
+        listener = asyncio.create_task(reader.listen_for_invalidations())
+        try:
+            await asyncio.sleep(0.1)
+            await redis_client.set("k", "old", 60)
+            assert await reader.get("k") == "old"
+
+            await writer.set("k", "new", 60)
+            await _wait_for_invalidation(reader)
+
+            assert reader.stats.invalidations == 1
+            assert await reader.get("k") == "new"
+        finally:
+            listener.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await listener
+
+
+class TestRedisLockManager:
+    async def test_lock_is_exclusive_until_released(self, redis_client):
+        locks = RedisLockManager(redis_client)
+
+        token = await locks.try_acquire("lock:k", 5)
+        assert token is not None
+        assert await locks.try_acquire("lock:k", 5) is None
+
+        await locks.release("lock:k", token)
+        assert await locks.try_acquire("lock:k", 5) is not None
+
+    async def test_release_with_stale_token_keeps_new_holders_lock(self, redis_client):
+        locks = RedisLockManager(redis_client)
+        stale = await locks.try_acquire("lock:k", 0.05)
+        assert stale is not None
+        await asyncio.sleep(0.1)
+        fresh = await locks.try_acquire("lock:k", 5)
+        assert fresh is not None
+
+        await locks.release("lock:k", stale)
+
+        assert await locks.try_acquire("lock:k", 5) is None
@@ -0,0 +1,98 @@
+"""Benchmark: cached coach listings, JSON + ``model_validate`` vs typed cache API.
+
+Compares, for 10/1k/10k coaches, reading a listing back through
+- the previous path: ``json.loads`` + ``Coach.model_validate`` per item,
+- ``get_model`` on Redis: one ``TypeAdapter.validate_json`` call,
+- ``get_model`` on the two-tier cache with decoded objects kept in process;
+  every hit returns its own copy, so this costs about as much as validating.
+Timings are only reported; run with ``-s`` to see them.
+"""
+
+import json
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date
+
+import pytest
+from pydantic import TypeAdapter
+
+from domain.coaches.coach import Coach
+from domain.coaches.entities import AvailabilitySlot, Certification
+from domain.coaches.value_objects import CoachTier, Specialization, Weekday
+from domain.shared.value_objects import Email, FullName
+from infrastructure.adapters.cache_adapter import RedisCacheAdapter, TwoTierCacheAdapter
+from infrastructure.cache.local_cache import LocalCache
+from infrastructure.redis.redis_client import RedisClient
+
+_COACH_LIST = TypeAdapter(list[Coach])
+_ROUNDS = 5
+
+
+def _coaches(n: int) -> list[Coach]:
+    return [
+        Coach(
+            id=i,
+            name=FullName(first_name="Coach", last_name=f"No{i}"),
+            email=Email(value=f"coach{i}@gym.com"),
+            bio="Strength and conditioning",
+            tier=CoachTier.STANDARD,
+            specializations=frozenset({Specialization.STRENGTH, Specialization.CARDIO}),
+            max_clients=10,
+            certifications=[Certification(id=i, name="CPT", issuing_body="NASM", issued_at=date(2020, 1, 1))],
+            available_slots=[AvailabilitySlot(id=i, day=Weekday.MON, start_hour=8, end_hour=12)],
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+async def _best_of[T](read: Callable[[], Awaitable[T]]) -> tuple[float, T]:
+    timings: list[float] = []
+    result = await read()
+    for _ in range(_ROUNDS):
+        start = time.perf_counter()
+        result = await read()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+@pytest.fixture()
+async def redis_client(redis_url):
+    client = RedisClient(redis_url)
+    yield client
+    await client._redis.flushdb()
+    await client.close()
+
+
+@pytest.mark.parametrize("n", [10, 1_000, 10_000])
+async def test_cache_hit_cost(redis_client, n, fake_logger):
+    coaches = _coaches(n)
+    legacy_key, typed_key = f"bench:legacy:{n}", f"bench:typed:{n}"
+    await redis_client.set(legacy_key, json.dumps([c.model_dump(mode="json") for c in coaches]), 60)
+
+    remote = RedisCacheAdapter(redis_client)
+    await remote.set_model(typed_key, coaches, _COACH_LIST, 60)
+    two_tier = TwoTierCacheAdapter(
+        remote=remote,
+        local=LocalCache(max_bytes=64 * 1024 * 1024, ttl_seconds=60),
+        client=redis_client,
+        channel="bench.cache.invalidate",
+        app_logger=fake_logger,
+        keep_decoded=True,
+    )
+    await two_tier.get_model(typed_key, _COACH_LIST)
+
+    async def legacy() -> list[Coach]:
+        raw = await redis_client.get(legacy_key)
+        return [Coach.model_validate(item) for item in json.loads(raw or "[]")]
+
+    legacy_s, legacy_result = await _best_of(legacy)
+    typed_s, typed_result = await _best_of(lambda: remote.get_model(typed_key, _COACH_LIST))
+    local_s, local_result = await _best_of(lambda: two_tier.get_model(typed_key, _COACH_LIST))
+
+    print(
+        f"\n{n:>6} coaches: json+model_validate={legacy_s * 1e3:.2f}ms "
+        f"typed redis={typed_s * 1e3:.2f}ms "
+        f"decoded L1={local_s * 1e3:.3f}ms "
+        f"payload {len(await redis_client.get(legacy_key) or '')}B -> {len(await redis_client.get(typed_key) or '')}B"
+    )
+    assert legacy_result == typed_result == local_result == coaches
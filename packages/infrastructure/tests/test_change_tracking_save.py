@@ -0,0 +1,195 @@
+"""Change-tracking saves: only rows that differ from the loaded snapshot are written.
+
+The plan tests double as a statement-count benchmark: completing one session of a
+200-session plan is measured on the diffing path and on the full merge path
+(aggregate without a snapshot). Run with ``-s`` to see the numbers.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from domain.coaches.coach import Coach
+from domain.coaches.entities import AvailabilitySlot
+from domain.coaches.value_objects import CoachTier, Specialization, Weekday
+from domain.members.entities import FitnessGoal
+from domain.members.member import Member
+from domain.members.value_objects import FitnessLevel, GoalType, Membership, MembershipTier
+from domain.plans.entities import WorkoutSession
+from domain.plans.training_plan import TrainingPlan
+from domain.plans.value_objects import PlannedExercise
+from infrastructure.repositories.coach_repository import CoachRepository, PostgresCoachRepository
+from infrastructure.repositories.member_repository import MemberRepository, PostgresMemberRepository
+from infrastructure.repositories.plan_repository import PostgresTrainingPlanRepository, TrainingPlanRepository
+
+_SESSIONS = 200
+_EXERCISES_PER_SESSION = 5
+
+
+@pytest.fixture()
+def plan_repo(infra_database):
+    return TrainingPlanRepository(PostgresTrainingPlanRepository(infra_database.session))
+
+
+@pytest.fixture()
+def member_repo(infra_database):
+    return MemberRepository(PostgresMemberRepository(infra_database.session))
+
+
+@pytest.fixture()
+def coach_repo(infra_database):
+    return CoachRepository(PostgresCoachRepository(infra_database.session))
+
+
+def _writes(log: list[tuple[str, int]]) -> list[tuple[str, int]]:
+    return [(s, n) for s, n in log if s.lstrip().split()[0].upper() in ("INSERT", "UPDATE", "DELETE")]
+
+
+async def _active_plan(plan_repo, sessions: int = _SESSIONS) -> TrainingPlan:
+    plan = TrainingPlan.create(
+        member_id=1,
+        coach_id=1,
+        name="Big Plan",
+        starts_at=date.today(),
+        ends_at=date.today() + timedelta(weeks=52),
+    )
+    for i in range(sessions):
+        plan.add_session(
+            WorkoutSession(
+                name=f"Day {i}",
+                scheduled_date=date.today() + timedelta(days=i),
+                exercises=[
+                    PlannedExercise(exercise_id=str(j), name=f"Ex {j}", sets=3, reps=10, rest_seconds=60)
+                    for j in range(_EXERCISES_PER_SESSION)
+                ],
+            )
+        )
+    plan = await plan_repo.save(plan)
+    plan.activate()
+    plan = await plan_repo.save(plan)
+    return await plan_repo.get_by_id(plan.id)
+
+
+class TestPlanSave:
+    async def test_complete_session_updates_one_session_row(self, plan_repo, statement_log):
+        plan = await _active_plan(plan_repo)
+        statement_log.clear()
+
+        plan.complete_session(plan.sessions[0].id)
+        await plan_repo.save(plan)
+
+        writes = _writes(statement_log)
+        assert len(writes) == 1
+        assert writes[0][0].startswith("UPDATE workout_sessions")
+        reloaded = await plan_repo.get_by_id(plan.id)
+        assert reloaded.sessions[0].status.value == "COMPLETED"
+        assert sum(len(s.exercises) for s in reloaded.sessions) == _SESSIONS * _EXERCISES_PER_SESSION
+
+    async def test_statement_counts_against_merge_path(self, plan_repo, statement_log):
+        plan = await _active_plan(plan_repo)
+
+        plan.complete_session(plan.sessions[0].id)
+        statement_log.clear()
+        await plan_repo.save(plan)
+        diff_statements, diff_rows = len(statement_log), sum(n for _, n in statement_log)
+
+        plan = await plan_repo.get_by_id(plan.id)
+        plan.complete_session(plan.sessions[1].id)
+        plan.mark_persisted(None)
+        statement_log.clear()
+        await plan_repo.save(plan)
+        merge_statements, merge_rows = len(statement_log), sum(n for _, n in statement_log)
+
+        print(
+            f"\ncomplete 1 of {_SESSIONS} sessions: "
+            f"diff={diff_statements} statements/{diff_rows} rows, "
+            f"merge={merge_statements} statements/{merge_rows} rows"
+        )
+        assert diff_rows < merge_rows
+        assert diff_rows <= 2
+
+    async def test_unchanged_plan_writes_nothing(self, plan_repo, statement_log):
+        plan = await _active_plan(plan_repo, sessions=3)
+        statement_log.clear()
+        await plan_repo.save(plan)
+        assert _writes(statement_log) == []
+
+    async def test_new_sessions_are_inserted_with_ids(self, plan_repo, statement_log):
+        plan = await plan_repo.save(
+            TrainingPlan.create(
+                member_id=1, coach_id=1, name="Draft", starts_at=date.today(), ends_at=date.today()
+            )
+        )
+        plan = await plan_repo.get_by_id(plan.id)
+        plan.add_session(
+            WorkoutSession(
+                name="Day 1",
+                scheduled_date=date.today(),
+                exercises=[PlannedExercise(exercise_id="1", name="Squat", sets=3, reps=10, rest_seconds=60)],
+            )
+        )
+        saved = await plan_repo.save(plan)
+        assert saved.sessions[0].id is not None
+
+        reloaded = await plan_repo.get_by_id(plan.id)
+        assert [e.name for e in reloaded.sessions[0].exercises] == ["Squat"]
+
+
+class TestMemberSave:
+    async def test_goal_changes_touch_only_changed_rows(self, member_repo, statement_log):
+        member = await member_repo.save(
+            Member.create(
+                first_name="Jan",
+                last_name="Kowalski",
+                email="jan@test.com",
+                phone="+48123456789",
+                fitness_level=FitnessLevel.BEGINNER,
+                membership=Membership(tier=MembershipTier.PREMIUM, valid_until=date.today() + timedelta(days=30)),
+            )
+        )
+        member = await member_repo.get_by_id(member.id)
+        for days in (30, 60):
+            member.add_goal(
+                FitnessGoal(type=GoalType.ENDURANCE, description="Run", target_date=date.today() + timedelta(days=days))
+            )
+        member = await member_repo.save(member)
+        assert all(g.id is not None for g in member.goals)
+
+        member.achieve_goal(member.goals[0].id)
+        statement_log.clear()
+        await member_repo.save(member)
+
+        writes = _writes(statement_log)
+        assert len(writes) == 1
+        assert writes[0][0].startswith("UPDATE fitness_goals")
+        reloaded = await member_repo.get_by_id(member.id)
+        assert [g.achieved for g in reloaded.goals] == [True, False]
+
+
+class TestCoachSave:
+    async def test_capacity_and_specializations(self, coach_repo, statement_log):
+        coach = await coach_repo.save(
+            Coach.create(
+                first_name="Anna",
+                last_name="Trainer",
+                email="anna@gym.com",
+                bio="",
+                tier=CoachTier.STANDARD,
+                specializations=frozenset({Specialization.STRENGTH, Specialization.YOGA}),
+                max_clients=5,
+            )
+        )
+        coach = await coach_repo.get_by_id(coach.id)
+        coach.accept_client()
+        coach.specializations = frozenset({Specialization.STRENGTH, Specialization.CARDIO})
+        coach.add_availability_slot(AvailabilitySlot(day=Weekday.MON, start_hour=8, end_hour=12))
+        statement_log.clear()
+        saved = await coach_repo.save(coach)
+
+        writes = _writes(statement_log)
+        assert len(writes) == 2
+        assert writes[0][0].startswith("UPDATE coaches")
+        assert saved.available_slots[0].id is not None
+        reloaded = await coach_repo.get_by_id(coach.id)
+        assert reloaded.current_client_count == 1
+        assert reloaded.specializations == {Specialization.STRENGTH, Specialization.CARDIO}
@@ -0,0 +1,135 @@
+"""Tests for PostgresCoachRepository queries beyond the BaseRepository basics."""
+
+from datetime import date
+
+import pytest
+
+from domain.coaches.coach import Coach
+from domain.coaches.entities import Certification
+from domain.coaches.value_objects import CoachTier, Specialization
+from domain.members.value_objects import MembershipTier
+from infrastructure.repositories.coach_repository import CoachRepository, PostgresCoachRepository
+
+
+@pytest.fixture()
+def coach_repo(infra_database):
+    return CoachRepository(PostgresCoachRepository(infra_database.session))
+
+
+async def _coach(
+    repo: CoachRepository,
+    name: str,
+    specs: set[Specialization],
+    tier: CoachTier = CoachTier.STANDARD,
+    clients: int = 0,
+    max_clients: int = 5,
+) -> Coach:
+    coach = Coach.create(
+        first_name=name,
+        last_name="Coach",
+        email=f"{name.lower()}@gym.com",
+        bio="",
+        tier=tier,
+        specializations=frozenset(specs),
+        max_clients=max_clients,
+    )
+    coach.current_client_count = clients
+    return await repo.save(coach)
+
+
+class TestFindMatchCandidates:
+    async def test_orders_by_overlap_then_load_then_id(self, coach_repo):
+        one_spec = await _coach(coach_repo, "One", {Specialization.CARDIO})
+        busy = await _coach(coach_repo, "Busy", {Specialization.CARDIO, Specialization.NUTRITION}, clients=3)
+        free = await _coach(coach_repo, "Free", {Specialization.CARDIO, Specialization.NUTRITION}, clients=1)
+        await _coach(coach_repo, "Yoga", {Specialization.YOGA})
+
+        found = await coach_repo.find_match_candidates(
+            {Specialization.CARDIO, Specialization.NUTRITION}, MembershipTier.FREE, limit=10
+        )
+
+        assert [c.id for c in found] == [free.id, busy.id, one_spec.id]
+        assert {s.value for s in found[0].specializations} == {"CARDIO", "NUTRITION"}
+
+    async def test_excludes_full_and_gated_coaches(self, coach_repo):
+        await _coach(coach_repo, "Full", {Specialization.YOGA}, clients=2, max_clients=2)
+        vip = await _coach(coach_repo, "Vip", {Specialization.YOGA}, tier=CoachTier.VIP)
+
+        assert await coach_repo.find_match_candidates({Specialization.YOGA}, MembershipTier.PREMIUM, 5) == []
+        found = await coach_repo.find_match_candidates({Specialization.YOGA}, MembershipTier.VIP, 5)
+        assert [c.id for c in found] == [vip.id]
+
+    async def test_respects_limit(self, coach_repo):
+        for i in range(4):
+            await _coach(coach_repo, f"C{i}", {Specialization.STRENGTH})
+        found = await coach_repo.find_match_candidates({Specialization.STRENGTH}, MembershipTier.FREE, 2)
+        assert len(found) == 2
+
+
+class TestFindBySpecialization:
+    async def test_one_query_without_duplicates(self, coach_repo, statement_log):
+        both = await _coach(coach_repo, "Both", {Specialization.YOGA, Specialization.CARDIO})
+        yoga = await _coach(coach_repo, "Yoga", {Specialization.YOGA})
+        await _coach(coach_repo, "Lift", {Specialization.STRENGTH})
+        statement_log.clear()
+
+        found = await coach_repo.find_by_specialization(Specialization.YOGA)
+
+        assert sorted(c.id for c in found) == [both.id, yoga.id]
+        # The coaches, then one selectin load each for certifications and slots.
+        assert len([s for s, _ in statement_log if s.lstrip().upper().startswith("SELECT")]) == 3
+
+    async def test_without_children_loads_coach_rows_only(self, coach_repo, statement_log):
+        coach = await _coach(coach_repo, "Yoga", {Specialization.YOGA})
+        coach.add_certification(Certification(name="RYT", issuing_body="Yoga Alliance", issued_at=date(2020, 1, 1)))
+        await coach_repo.save(coach)
+        statement_log.clear()
+
+        found = await coach_repo.find_by_specialization(Specialization.YOGA, with_children=False)
+
+        assert [c.id for c in found] == [coach.id]
+        assert found[0].certifications == []
+        assert len(statement_log) == 1
+
+
+class TestShallowListings:
+    async def test_page_and_stream_skip_children(self, coach_repo, statement_log):
+        for i in range(3):
+            await _coach(coach_repo, f"C{i}", {Specialization.CARDIO})
+        statement_log.clear()
+
+        page = await coach_repo.get_page(None, 2, with_children=False)
+        streamed = [c async for c in coach_repo.stream_all(with_children=False)]
+
+        assert len(page) == 2
+        assert len(streamed) == 3
+        assert len(statement_log) == 2
+
+    async def test_saving_a_listed_coach_keeps_its_children(self, coach_repo, infra_database):
+        coach = await _coach(coach_repo, "Anna", {Specialization.YOGA})
+        coach.add_certification(Certification(name="RYT", issuing_body="Yoga Alliance", issued_at=date(2020, 1, 1)))
+        await coach_repo.save(coach)
+        assert coach.id is not None
+
+        async with infra_database.transaction():
+            [listed] = await coach_repo.get_all(with_children=False)
+            listed.accept_client()
+            await coach_repo.save(listed)
+            # The shallow copy is not what the unit of work hands out by id.
+            full = await coach_repo.get_by_id(coach.id)
+            assert full is not listed
+            assert [c.name for c in full.certifications] == ["RYT"]
+
+        reloaded = await coach_repo.get_by_id(coach.id)
+        assert reloaded.current_client_count == 1
+        assert [c.name for c in reloaded.certifications] == ["RYT"]
+
+
+class TestExistsByEmail:
+    async def test_single_select_without_loading_children(self, coach_repo, statement_log):
+        await _coach(coach_repo, "Anna", {Specialization.YOGA})
+        statement_log.clear()
+
+        assert await coach_repo.exists_by_email("anna@gym.com")
+        assert not await coach_repo.exists_by_email("nobody@gym.com")
+        assert len(statement_log) == 2
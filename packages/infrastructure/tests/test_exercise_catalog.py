@@ -0,0 +1,125 @@
+"""Tests for the local exercise catalog mirror.
+
+Scenarios:
+- search ranks the exact name first, then prefix matches, then trigram-similar names
+- search escapes LIKE wildcards in the term
+- upsert renames existing entries instead of duplicating them
+- LocalExerciseClient answers from the mirror and falls back to wger for unknown names
+- a sync drops entries wger stopped listing, but a failed sync deletes nothing
+"""
+
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from infrastructure.adapters.exercise_catalog import ExerciseCatalogSync, LocalExerciseClient
+from infrastructure.repositories.exercise_catalog_repository import PostgresExerciseCatalogRepository
+
+
+class _FakeSource:
+    def __init__(self, pages: list[list[dict[str, object]]], fail_after: int | None = None) -> None:
+        self._pages = pages
+        self._fail_after = fail_after
+
+    async def iter_catalog(self, page_size: int = 200) -> AsyncIterator[list[dict[str, object]]]:
+        for i, page in enumerate(self._pages):
+            if i == self._fail_after:
+                raise RuntimeError("wger unavailable")
+            yield page
+
+
+@pytest.fixture()
+def catalog(infra_database):
+    return PostgresExerciseCatalogRepository(infra_database.session)
+
+
+@pytest.fixture()
+async def seeded(catalog):
+    await catalog.upsert_many(
+        [
+            {"id": 1, "name": "Squat"},
+            {"id": 2, "name": "Squat Jump"},
+            {"id": 3, "name": "Front Squat"},
+            {"id": 4, "name": "Bench Press"},
+            {"id": 5, "name": "100% Effort Sprint"},
+        ],
+        datetime.now(UTC),
+    )
+    return catalog
+
+
+class TestSearch:
+    async def test_exact_then_prefix_then_similar(self, seeded):
+        names = [e.name for e in await seeded.search("squat", 10)]
+        assert names == ["Squat", "Squat Jump", "Front Squat"]
+
+    async def test_typo_still_matches_by_similarity(self, seeded):
+        names = [e.name for e in await seeded.search("Bench Pres", 10)]
+        assert names[0] == "Bench Press"
+
+    async def test_unknown_name_returns_nothing(self, seeded):
+        assert await seeded.search("Zercher Carry", 10) == []
+
+    async def test_like_wildcards_are_literal(self, seeded):
+        names = [e.name for e in await seeded.search("100%", 10)]
+        assert names == ["100% Effort Sprint"]
+
+    async def test_limit(self, seeded):
+        assert len(await seeded.search("squat", 2)) == 2
+
+
+class TestUpsert:
+    async def test_renames_existing_entry(self, seeded):
+        await seeded.upsert_many([{"id": 4, "name": "Barbell Bench Press"}], datetime.now(UTC))
+
+        assert (await seeded.get_by_id(4)).name == "Barbell Bench Press"
+        assert await seeded.count() == 5
+
+
+class TestLocalExerciseClient:
+    async def test_known_name_is_served_locally(self, seeded, fake_logger):
+        fallback = AsyncMock()
+        client = LocalExerciseClient(seeded, fallback, fake_logger)
+
+        results = await client.search_exercises("Squat")
+
+        assert results[0] == {"exercise_id": "1", "name": "Squat"}
+        fallback.search_exercises.assert_not_awaited()
+
+    async def test_unknown_name_falls_back_to_wger(self, seeded, fake_logger):
+        fallback = AsyncMock()
+        fallback.search_exercises.return_value = [{"exercise_id": "99", "name": "Zercher Carry"}]
+        client = LocalExerciseClient(seeded, fallback, fake_logger)
+
+        assert await client.search_exercises("Zercher Carry") == [{"exercise_id": "99", "name": "Zercher Carry"}]
+
+    async def test_get_exercise_prefers_the_mirror(self, seeded, fake_logger):
+        fallback = AsyncMock()
+        fallback.get_exercise.return_value = None
+        client = LocalExerciseClient(seeded, fallback, fake_logger)
+
+        assert await client.get_exercise("4") == {"id": 4, "name": "Bench Press"}
+        assert await client.get_exercise("404") is None
+        fallback.get_exercise.assert_awaited_once_with("404")
+
+
+class TestSync:
+    async def test_sync_upserts_pages_and_drops_unlisted(self, catalog, fake_logger):
+        await catalog.upsert_many([{"id": 7, "name": "Retired Move"}], datetime.now(UTC) - timedelta(days=1))
+        source = _FakeSource([[{"id": 1, "name": "Squat"}], [{"id": 2, "name": "Lunge"}, {"id": 3, "name": ""}]])
+
+        synced = await ExerciseCatalogSync(catalog, source, fake_logger).sync()
+
+        assert synced == 2
+        assert sorted(e.name for e in await catalog.find_all()) == ["Lunge", "Squat"]
+
+    async def test_failed_sync_deletes_nothing(self, catalog, fake_logger):
+        await catalog.upsert_many([{"id": 7, "name": "Retired Move"}], datetime.now(UTC) - timedelta(days=1))
+        source = _FakeSource([[{"id": 1, "name": "Squat"}], [{"id": 2, "name": "Lunge"}]], fail_after=1)
+
+        with pytest.raises(RuntimeError):
+            await ExerciseCatalogSync(catalog, source, fake_logger).sync()
+
+        assert sorted(e.name for e in await catalog.find_all()) == ["Retired Move", "Squat"]
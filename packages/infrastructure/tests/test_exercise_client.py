@@ -0,0 +1,214 @@
+"""Tests for the resilient wger HTTP client.
+
+Scenarios:
+- the circuit breaker opens after consecutive failures, half-opens after the timeout and closes on success
+- retryable statuses and transport errors are retried with bounded, jittered backoff
+- client errors are returned without retrying
+- an open circuit fails fast without sending a request
+- a slow attempt is hedged and the faster answer wins
+- WgerAdapter reports upstream failures as ExerciseApiUnavailableError
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from application.core.ports import ExerciseApiUnavailableError
+from infrastructure.adapters.exercise_adapter import WgerAdapter
+from infrastructure.clients.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from infrastructure.clients.exercise_client import WgerClient
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Sleeps:
+    def __init__(self) -> None:
+        self.delays: list[float] = []
+
+    async def __call__(self, delay: float) -> None:
+        self.delays.append(delay)
+
+
+def _client(handler, *, breaker: CircuitBreaker | None = None, sleeps: _Sleeps | None = None, **kwargs) -> WgerClient:
+    return WgerClient(
+        base_url="https://wger.test/api/v2",
+        transport=httpx.MockTransport(handler),
+        http2=False,
+        breaker=breaker,
+        sleep=sleeps or _Sleeps(),
+        hedge_after_seconds=kwargs.pop("hedge_after_seconds", None),
+        **kwargs,
+    )
+
+
+def _responses(*statuses: int):
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        return httpx.Response(status, json={"suggestions": []})
+
+    return handler, calls
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_half_opens_after_timeout(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        clock.now = 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failed_trial_reopens(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        breaker.before_call()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_abandoned_trial_is_replaced_after_timeout(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        breaker.before_call()
+
+        clock.now = 20
+        breaker.before_call()
+
+
+class TestRetries:
+    async def test_retryable_status_is_retried_with_bounded_jitter(self):
+        handler, calls = _responses(503, 503, 200)
+        sleeps = _Sleeps()
+        client = _client(handler, sleeps=sleeps, retry_attempts=2, retry_backoff_seconds=0.5, retry_backoff_max_seconds=0.6)
+
+        response = await client.get("/exercise/search/")
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+        assert len(sleeps.delays) == 2
+        assert 0 <= sleeps.delays[0] <= 0.5
+        assert 0 <= sleeps.delays[1] <= 0.6
+        assert client.breaker.state is CircuitState.CLOSED
+
+    async def test_exhausted_retries_return_last_response_and_count_one_failure(self):
+        handler, calls = _responses(503)
+        breaker = CircuitBreaker(failure_threshold=2)
+        client = _client(handler, breaker=breaker, retry_attempts=1)
+
+        response = await client.get("/exercise/search/")
+
+        assert response.status_code == 503
+        assert len(calls) == 2
+        assert breaker.state is CircuitState.CLOSED
+
+    async def test_client_error_is_not_retried(self):
+        handler, calls = _responses(404)
+        client = _client(handler, retry_attempts=3)
+
+        assert (await client.get("/exercise/1/")).status_code == 404
+        assert len(calls) == 1
+
+    async def test_transport_error_is_raised_after_retries(self):
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            raise httpx.ConnectError("refused", request=request)
+
+        client = _client(handler, retry_attempts=2)
+
+        with pytest.raises(httpx.ConnectError):
+            await client.get("/exercise/search/")
+        assert calls == 3
+
+
+class TestCircuit:
+    async def test_open_circuit_fails_fast_without_a_request(self):
+        handler, calls = _responses(503)
+        client = _client(handler, breaker=CircuitBreaker(failure_threshold=1), retry_attempts=0)
+
+        await client.get("/exercise/search/")
+        with pytest.raises(CircuitOpenError):
+            await client.get("/exercise/search/")
+
+        assert len(calls) == 1
+
+
+class TestHedging:
+    async def test_slow_attempt_is_hedged_and_fastest_answer_wins(self):
+        calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(5)
+                return httpx.Response(200, json={"attempt": 1})
+            return httpx.Response(200, json={"attempt": 2})
+
+        client = _client(handler, hedge_after_seconds=0.01)
+
+        response = await asyncio.wait_for(client.get("/exercise/search/"), timeout=1)
+
+        assert response.json() == {"attempt": 2}
+        assert calls == 2
+
+    async def test_fast_attempt_is_not_hedged(self):
+        handler, calls = _responses(200)
+        client = _client(handler, hedge_after_seconds=1)
+
+        await client.get("/exercise/search/")
+
+        assert len(calls) == 1
+
+
+class TestWgerAdapter:
+    async def test_upstream_failure_raises_unavailable(self, fake_logger):
+        handler, _ = _responses(503)
+        adapter = WgerAdapter(_client(handler, retry_attempts=0), fake_logger)
+
+        with pytest.raises(ExerciseApiUnavailableError):
+            await adapter.search_exercises("Squat")
+
+    async def test_open_circuit_raises_unavailable(self, fake_logger):
+        handler, _ = _responses(200)
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure()
+        adapter = WgerAdapter(_client(handler, breaker=breaker), fake_logger)
+
+        with pytest.raises(ExerciseApiUnavailableError):
+            await adapter.search_exercises("Squat")
+
+    async def test_no_suggestions_is_an_empty_result(self, fake_logger):
+        handler, _ = _responses(200)
+        adapter = WgerAdapter(_client(handler), fake_logger)
+
+        assert await adapter.search_exercises("Zercher Carry") == []
@@ -0,0 +1,173 @@
+"""Mapper hydration: each aggregate is built from its rows in one trusted validation pass.
+
+Scenarios:
+- members, coaches and plans loaded from rows equal the same objects built model by model
+  with full validation
+- loaded aggregates carry their snapshot and an empty event list
+- format checks (email, phone, slot hours) are skipped on load but still reject API input
+- blank names are still rejected on load
+"""
+
+from collections.abc import Callable
+from datetime import UTC, date, datetime
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from domain.coaches.coach import Coach
+from domain.coaches.entities import AvailabilitySlot, Certification
+from domain.coaches.value_objects import CoachTier, Specialization, Weekday
+from domain.members.entities import FitnessGoal
+from domain.members.member import Member
+from domain.members.value_objects import FitnessLevel, GoalType, Membership, MembershipTier
+from domain.plans.entities import WorkoutSession
+from domain.plans.training_plan import TrainingPlan
+from domain.plans.value_objects import PlannedExercise, PlanStatus, SessionStatus
+from domain.shared.value_objects import Email, FullName, PhoneNumber
+from infrastructure.database.mappers.coach_mapper import CoachMapper
+from infrastructure.database.mappers.member_mapper import MemberMapper
+from infrastructure.database.mappers.plan_mapper import PlanMapper
+from infrastructure.database.models.member_models import MemberORM
+
+
+def _member(i: int = 1) -> Member:
+    return Member(
+        id=i,
+        name=FullName(first_name="Jan", last_name=f"Kowalski{i}"),
+        email=Email(value=f"jan{i}@example.com"),
+        phone=PhoneNumber(value="+48123456789"),
+        fitness_level=FitnessLevel.INTERMEDIATE,
+        membership=Membership(tier=MembershipTier.PREMIUM, valid_until=date(2027, 1, 1)),
+        goals=[
+            FitnessGoal(id=i, type=GoalType.BUILD_MUSCLE, description="Bench 100kg", target_date=date(2026, 6, 1)),
+            FitnessGoal(id=i + 100_000, type=GoalType.ENDURANCE, description="10k", target_date=date(2026, 9, 1), achieved=True),
+        ],
+        active_plan_id=7,
+    )
+
+
+def _coach() -> Coach:
+    return Coach(
+        id=1,
+        name=FullName(first_name="Anna", last_name="Nowak"),
+        email=Email(value="anna@gym.com"),
+        bio="Strength and conditioning",
+        tier=CoachTier.STANDARD,
+        specializations=frozenset({Specialization.STRENGTH, Specialization.CARDIO}),
+        max_clients=12,
+        current_client_count=3,
+        certifications=[
+            Certification(id=1, name="CPT", issuing_body="NASM", issued_at=date(2020, 1, 1), expires_at=date(2030, 1, 1))
+        ],
+        available_slots=[AvailabilitySlot(id=1, day=Weekday.MON, start_hour=8, end_hour=12)],
+    )
+
+
+def _plan(sessions: int = 1) -> TrainingPlan:
+    return TrainingPlan(
+        id=1,
+        member_id=1,
+        coach_id=1,
+        name="Strength block",
+        status=PlanStatus.ACTIVE,
+        starts_at=date(2026, 1, 1),
+        ends_at=date(2026, 3, 1),
+        sessions=[
+            WorkoutSession(
+                id=1,
+                name="Day 1",
+                scheduled_date=date(2026, 1, 2),
+                status=SessionStatus.COMPLETED,
+                completed_at=datetime(2026, 1, 2, 18, 30, tzinfo=UTC),
+                notes="felt strong",
+                exercises=[PlannedExercise(exercise_id="42", name="Squat", sets=5, reps=5, rest_seconds=180)],
+            ),
+            *(
+                WorkoutSession(
+                    id=i,
+                    name=f"Day {i}",
+                    scheduled_date=date(2026, 1, 4),
+                    exercises=[
+                        PlannedExercise(exercise_id=str(j), name=f"Exercise {j}", sets=3, reps=10, rest_seconds=60)
+                        for j in range(5)
+                    ],
+                )
+                for i in range(2, sessions + 2)
+            ),
+        ],
+    )
+
+
+_CASES: list[tuple[Callable[[], BaseModel], Callable[[BaseModel], object], Callable[[object], BaseModel]]] = [
+    (_member, MemberMapper.to_orm, MemberMapper.to_domain),
+    (_coach, CoachMapper.to_orm, CoachMapper.to_domain),
+    (_plan, PlanMapper.to_orm, PlanMapper.to_domain),
+]
+
+
+@pytest.mark.parametrize(
+    ("build", "to_orm", "to_domain"),
+    [
+        (_member, MemberMapper.to_orm, MemberMapper.to_domain),
+        (_coach, CoachMapper.to_orm, CoachMapper.to_domain),
+        (_plan, PlanMapper.to_orm, PlanMapper.to_domain),
+    ],
+    ids=["member", "coach", "plan"],
+)
+def test_loaded_aggregate_equals_one_built_model_by_model(build, to_orm, to_domain):
+    expected: BaseModel = build()
+
+    loaded = to_domain(to_orm(expected))
+
+    # Nested models compare by type and value; the aggregates differ only in their private snapshot.
+    assert loaded.__dict__ == expected.__dict__
+    assert loaded.model_fields_set == expected.model_fields_set
+
+
+def test_loaded_aggregate_is_tracked_and_raises_events():
+    member = MemberMapper.to_domain(MemberMapper.to_orm(_member()))
+
+    assert member.persisted_state == MemberMapper.snapshot(_member())
+    assert member.pull_events() == []
+    member.achieve_goal(1)
+    assert [type(e).__name__ for e in member.pull_events()] == ["GoalAchieved"]
+
+
+@pytest.mark.parametrize(("column", "value"), [("email", "not-an-email"), ("phone", "call me")])
+def test_loading_skips_format_checks(column, value):
+    orm: MemberORM = MemberMapper.to_orm(_member())
+    setattr(orm, column, value)
+
+    member = MemberMapper.to_domain(orm)
+
+    assert getattr(member, column).value == value
+
+
+def test_loading_skips_slot_hour_check():
+    orm = CoachMapper.to_orm(_coach())
+    orm.available_slots[0].end_hour = 6
+
+    assert CoachMapper.to_domain(orm).available_slots[0].end_hour == 6
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda: Email(value="not-an-email"),
+        lambda: PhoneNumber(value="call me"),
+        lambda: AvailabilitySlot(day=Weekday.MON, start_hour=8, end_hour=6),
+        lambda: Member.model_validate(_member().model_dump() | {"email": {"value": "not-an-email"}}),
+    ],
+    ids=["email", "phone", "slot", "member"],
+)
+def test_untrusted_input_is_still_validated(build):
+    with pytest.raises(ValidationError):
+        build()
+
+
+def test_blank_name_is_rejected_on_load():
+    orm: MemberORM = MemberMapper.to_orm(_member())
+    orm.first_name = "  "
+
+    with pytest.raises(ValidationError):
+        MemberMapper.to_domain(orm)
@@ -0,0 +1,140 @@
+"""Integration tests for the Postgres outbox.
+
+Scenarios:
+- events are written in the caller's transaction and vanish with its rollback
+- concurrent claims skip each other's locked rows
+- failures are recorded and exhausted messages are no longer claimed
+- the relay delivers a committed unit of work's events and empties the outbox
+- a handler's database error is rolled back alone and counted as an attempt
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from application.event_dispatcher import EventDispatcher
+from application.outbox_relay import OutboxRelay
+from domain.members.events import MembershipUpgraded
+from domain.shared.events import ApplicationEvent
+from infrastructure.database.transaction_manager import TransactionManager
+from infrastructure.repositories.outbox_repository import PostgresOutbox
+
+
+def _event(member_id: int) -> MembershipUpgraded:
+    return MembershipUpgraded(member_id=member_id, old_tier="FREE", new_tier="PREMIUM")
+
+
+@pytest.fixture()
+def outbox(infra_database):
+    return PostgresOutbox(infra_database.session)
+
+
+@pytest.fixture()
+def tm(infra_database):
+    return TransactionManager(infra_database)
+
+
+async def _claim_all(tm, outbox) -> list[int]:
+    async with tm.transaction():
+        return [m.id for m in await outbox.claim(100, 5)]
+
+
+async def test_events_are_written_in_the_callers_transaction(tm, outbox):
+    async with tm.transaction():
+        await outbox.add([_event(1), _event(2)])
+
+    with pytest.raises(RuntimeError):
+        async with tm.transaction():
+            await outbox.add([_event(3)])
+            raise RuntimeError("rolled back")
+
+    async with tm.transaction():
+        claimed = await outbox.claim(10, 5)
+    assert [(m.event_type, m.payload["member_id"]) for m in claimed] == [
+        ("MembershipUpgraded", 1),
+        ("MembershipUpgraded", 2),
+    ]
+
+
+async def test_concurrent_claims_skip_locked_rows(tm, outbox):
+    async with tm.transaction():
+        await outbox.add([_event(i) for i in range(4)])
+
+    first_claimed = asyncio.Event()
+    release = asyncio.Event()
+
+    async def first() -> list[int]:
+        async with tm.transaction(new=True):
+            ids = [m.id for m in await outbox.claim(2, 5)]
+            first_claimed.set()
+            await release.wait()
+            return ids
+
+    async def second() -> list[int]:
+        await first_claimed.wait()
+        async with tm.transaction(new=True):
+            ids = [m.id for m in await outbox.claim(10, 5)]
+        release.set()
+        return ids
+
+    a, b = await asyncio.gather(asyncio.create_task(first()), asyncio.create_task(second()))
+    assert len(a) == 2 and len(b) == 2
+    assert set(a).isdisjoint(b)
+
+
+async def test_exhausted_messages_are_not_claimed(tm, outbox):
+    async with tm.transaction():
+        await outbox.add([_event(1)])
+    [id] = await _claim_all(tm, outbox)
+
+    async with tm.transaction():
+        await outbox.record_failure(id, "boom")
+        [message] = await outbox.claim(10, 5)
+        assert message.attempts == 1
+        assert await outbox.claim(10, 1) == []
+
+
+async def test_relay_delivers_and_deletes(tm, outbox, fake_logger):
+    handled: list[int] = []
+
+    async def handler(event: ApplicationEvent) -> None:
+        assert isinstance(event, MembershipUpgraded)
+        handled.append(event.member_id)
+
+    dispatcher = EventDispatcher(fake_logger)
+    dispatcher.register(MembershipUpgraded, handler)
+    async with tm.transaction():
+        await outbox.add([_event(1), _event(2), _event(3)])
+
+    relay = OutboxRelay(outbox, tm, dispatcher, fake_logger, batch_size=2)
+    assert await relay.relay_once() == 2
+    assert await relay.relay_once() == 1
+
+    assert handled == [1, 2, 3]
+    assert await _claim_all(tm, outbox) == []
+
+
+async def test_relay_records_a_handler_database_error(tm, outbox, infra_database, fake_logger):
+    handled: list[int] = []
+
+    async def handler(event: ApplicationEvent) -> None:
+        assert isinstance(event, MembershipUpgraded)
+        if event.member_id == 1:
+            async with infra_database.session() as session:
+                connection = await session.connection()
+                await connection.execute(text("SELECT 1 / 0"))
+        handled.append(event.member_id)
+
+    dispatcher = EventDispatcher(fake_logger)
+    dispatcher.register(MembershipUpgraded, handler)
+    async with tm.transaction():
+        await outbox.add([_event(1), _event(2)])
+
+    assert await OutboxRelay(outbox, tm, dispatcher, fake_logger).relay_once() == 2
+
+    assert handled == [2]
+    async with tm.transaction():
+        [message] = await outbox.claim(10, 5)
+    assert message.payload["member_id"] == 1
+    assert message.attempts == 1
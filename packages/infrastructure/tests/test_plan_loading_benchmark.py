@@ -0,0 +1,115 @@
+"""Benchmark: loading a plan aggregate with one joined query vs ``selectin`` loading.
+
+For plans of 10/100/1000 sessions (5 exercises each) compares
+- the ORM path: ``training_plans``, then ``selectin`` batches for sessions and exercises,
+- ``find_trees``: one outer join folded back into the aggregate.
+Both must yield the same plan. Run with ``-s`` to see round-trips and wall time.
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+
+import pytest
+
+from domain.plans.entities import WorkoutSession
+from domain.plans.training_plan import TrainingPlan
+from domain.plans.value_objects import PlannedExercise
+from infrastructure.database.exceptions import EntityNotFoundException
+from infrastructure.database.mappers.plan_mapper import PlanMapper
+from infrastructure.repositories.plan_repository import PostgresTrainingPlanRepository, TrainingPlanRepository
+
+_ROUNDS = 5
+
+
+@pytest.fixture()
+def orm_repo(infra_database):
+    return PostgresTrainingPlanRepository(infra_database.session)
+
+
+@pytest.fixture()
+def plan_repo(orm_repo):
+    return TrainingPlanRepository(orm_repo)
+
+
+async def _plan(plan_repo, sessions: int, member_id: int = 1) -> TrainingPlan:
+    plan = TrainingPlan.create(
+        member_id=member_id,
+        coach_id=1,
+        name="Plan",
+        starts_at=date(2026, 1, 1),
+        ends_at=date(2026, 12, 31),
+    )
+    for i in range(sessions):
+        plan.add_session(
+            WorkoutSession(
+                name=f"Day {i}",
+                scheduled_date=date(2026, 1, 1) + timedelta(days=i),
+                exercises=[
+                    PlannedExercise(exercise_id=str(j), name=f"Ex {j}", sets=3, reps=10, rest_seconds=60)
+                    for j in range(5)
+                ],
+            )
+        )
+    return await plan_repo.save(plan)
+
+
+async def _best_of[T](load: Callable[[], Awaitable[T]]) -> tuple[float, T]:
+    timings: list[float] = []
+    result = await load()
+    for _ in range(_ROUNDS):
+        start = time.perf_counter()
+        result = await load()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+async def _round_trips(statement_log, load: Callable[[], Awaitable[object]]) -> int:
+    statement_log.clear()
+    await load()
+    return len(statement_log)
+
+
+@pytest.mark.parametrize("n", [10, 100, 1_000])
+async def test_plan_load_cost(orm_repo, plan_repo, statement_log, n):
+    saved = await _plan(plan_repo, n)
+    assert saved.id is not None
+
+    async def selectin() -> TrainingPlan:
+        return PlanMapper.to_domain(await orm_repo.get_by_id(saved.id))
+
+    async def joined() -> TrainingPlan:
+        return await plan_repo.get_by_id(saved.id)
+
+    selectin_trips = await _round_trips(statement_log, selectin)
+    joined_trips = await _round_trips(statement_log, joined)
+    selectin_s, selectin_plan = await _best_of(selectin)
+    joined_s, joined_plan = await _best_of(joined)
+
+    print(
+        f"\n{n:>5} sessions: selectin={selectin_trips} queries/{selectin_s * 1e3:.1f}ms "
+        f"joined={joined_trips} query/{joined_s * 1e3:.1f}ms"
+    )
+    assert joined_trips == 1
+    assert selectin_trips >= 3  # selectin loads children 500 parents per query
+    assert joined_plan == selectin_plan
+    assert joined_plan.persisted_state == selectin_plan.persisted_state
+
+
+async def test_plans_by_member_load_in_one_query(plan_repo, statement_log):
+    first = await _plan(plan_repo, 3)
+    empty = await _plan(plan_repo, 0)
+    await _plan(plan_repo, 2, member_id=2)
+
+    statement_log.clear()
+    plans = await plan_repo.get_by_member(1)
+
+    assert len(statement_log) == 1
+    assert [p.id for p in plans] == [first.id, empty.id]
+    assert [len(p.sessions) for p in plans] == [3, 0]
+    assert plans[0] == first
+
+
+async def test_missing_plan_raises(plan_repo):
+    with pytest.raises(EntityNotFoundException):
+        await plan_repo.get_by_id(999)
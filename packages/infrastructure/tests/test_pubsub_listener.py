@@ -0,0 +1,124 @@
+"""Tests for the blocking Redis pub/sub listener.
+
+Scenarios:
+- messages are delivered to the handler of their channel, batched and in order
+- a failing handler does not stop the listener
+- a failed connection is retried with growing backoff
+"""
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from infrastructure.redis.pubsub_listener import PubSubListener
+from infrastructure.redis.redis_client import RedisClient
+
+
+class _Recorder:
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.batches: list[tuple[str, list[str]]] = []
+        self.fail_on = fail_on
+
+    async def handle(self, channel: str, messages: Sequence[str]) -> None:
+        if self.fail_on in messages:
+            raise RuntimeError("handler failed")
+        self.batches.append((channel, list(messages)))
+
+
+@pytest.fixture()
+async def redis_client(redis_url):
+    client = RedisClient(redis_url)
+    yield client
+    await client.close()
+
+
+async def _wait_for(predicate, attempts: int = 100) -> None:
+    for _ in range(attempts):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+async def _run(listener: PubSubListener):
+    task = asyncio.create_task(listener.run())
+    await asyncio.sleep(0.05)
+    return task
+
+
+async def _stop(task: asyncio.Task[None]) -> None:
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+async def test_buffered_messages_are_batched_per_channel(redis_client, fake_logger):
+    members, plans = _Recorder(), _Recorder()
+    listener = PubSubListener(redis_client, {"t.members": members, "t.plans": plans}, fake_logger)
+    task = await _run(listener)
+    try:
+        await redis_client.publish_many([("t.members", "1"), ("t.plans", "a"), ("t.members", "2")])
+        await _wait_for(lambda: members.batches and plans.batches)
+
+        assert [m for _, batch in members.batches for m in batch] == ["1", "2"]
+        assert plans.batches == [("t.plans", ["a"])]
+    finally:
+        await _stop(task)
+
+
+async def test_failing_handler_does_not_stop_listening(redis_client, fake_logger):
+    recorder = _Recorder(fail_on="bad")
+    task = await _run(PubSubListener(redis_client, {"t.members": recorder}, fake_logger))
+    try:
+        await redis_client.publish("t.members", "bad")
+        await asyncio.sleep(0.05)
+        await redis_client.publish("t.members", "good")
+        await _wait_for(lambda: recorder.batches)
+
+        assert recorder.batches == [("t.members", ["good"])]
+    finally:
+        await _stop(task)
+
+
+class _BrokenClient:
+    def __init__(self) -> None:
+        self.attempts = 0
+
+    def pubsub(self):
+        self.attempts += 1
+        client = self
+
+        class _PubSub:
+            async def subscribe(self, *channels: str) -> None:
+                raise ConnectionError(f"attempt {client.attempts}")
+
+            async def aclose(self) -> None: ...
+
+        return _PubSub()
+
+
+async def test_reconnects_with_growing_backoff(monkeypatch, fake_logger):
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+        if len(delays) == 4:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr("infrastructure.redis.pubsub_listener.asyncio.sleep", fake_sleep)
+    client = _BrokenClient()
+    listener = PubSubListener(
+        client,  # pyright: ignore[reportArgumentType]
+        {"t.members": _Recorder()},
+        fake_logger,
+        reconnect_delay_seconds=1.0,
+        reconnect_delay_max_seconds=3.0,
+        rand=lambda: 1.0,
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        await listener.run()
+
+    assert client.attempts == 4
+    assert delays == [1.0, 2.0, 3.0, 3.0]
@@ -0,0 +1,155 @@
+"""Index advisor: the repositories' hot queries must not fall back to sequential scans.
+
+Seeds a few thousand rows, records every SELECT the repositories send while
+loading aggregates, then runs each one again under ``EXPLAIN (ANALYZE, FORMAT JSON)``
+with ``enable_seqscan`` off. The planner then only picks a ``Seq Scan`` for a table
+no index can serve, so any left in a plan points at a missing index.
+"""
+
+import json
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import event, text
+
+from domain.coaches.coach import Coach
+from domain.coaches.entities import AvailabilitySlot, Certification
+from domain.coaches.value_objects import CoachTier, Specialization, Weekday
+from domain.members.entities import FitnessGoal
+from domain.members.member import Member
+from domain.members.value_objects import FitnessLevel, GoalType, Membership, MembershipTier
+from domain.plans.entities import WorkoutSession
+from domain.plans.training_plan import TrainingPlan
+from domain.plans.value_objects import PlannedExercise
+from infrastructure.repositories.coach_repository import CoachRepository, PostgresCoachRepository
+from infrastructure.repositories.member_repository import MemberRepository, PostgresMemberRepository
+from infrastructure.repositories.plan_repository import PostgresTrainingPlanRepository, TrainingPlanRepository
+
+_MEMBERS = 300
+_COACHES = 100
+_PLANS = 150
+_SESSIONS_PER_PLAN = 12
+_SPECS = list(Specialization)
+
+type _Repos = tuple[MemberRepository, CoachRepository, TrainingPlanRepository]
+
+
+@pytest.fixture()
+def repos(infra_database) -> _Repos:
+    return (
+        MemberRepository(PostgresMemberRepository(infra_database.session)),
+        CoachRepository(PostgresCoachRepository(infra_database.session)),
+        TrainingPlanRepository(PostgresTrainingPlanRepository(infra_database.session)),
+    )
+
+
+@pytest.fixture()
+def selects(infra_database) -> Iterator[list[tuple[str, Any]]]:
+    """Collect ``(statement, parameters)`` for every SELECT sent to the database."""
+    log: list[tuple[str, Any]] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            log.append((statement, parameters))
+
+    engine = infra_database.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    yield log
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+async def _seed(repos: _Repos) -> None:
+    members, coaches, plans = repos
+    for i in range(_MEMBERS):
+        member = Member.create(
+            first_name="Member",
+            last_name=f"No{i}",
+            email=f"member{i}@test.com",
+            phone="+48123456789",
+            fitness_level=FitnessLevel.BEGINNER,
+            membership=Membership(tier=MembershipTier.PREMIUM, valid_until=date.today() + timedelta(days=365)),
+        )
+        for days in (30, 60):
+            member.add_goal(FitnessGoal(type=GoalType.ENDURANCE, description="Run", target_date=date.today() + timedelta(days=days)))
+        await members.save(member)
+    for i in range(_COACHES):
+        coach = Coach.create(
+            first_name="Coach",
+            last_name=f"No{i}",
+            email=f"coach{i}@test.com",
+            bio="",
+            tier=CoachTier.STANDARD,
+            specializations=frozenset({_SPECS[i % len(_SPECS)], _SPECS[(i + 1) % len(_SPECS)]}),
+            max_clients=10,
+        )
+        coach.add_certification(Certification(name="CPT", issuing_body="NASM", issued_at=date(2020, 1, 1)))
+        coach.add_availability_slot(AvailabilitySlot(day=Weekday.MON, start_hour=8, end_hour=12))
+        await coaches.save(coach)
+    for i in range(_PLANS):
+        plan = TrainingPlan.create(
+            member_id=i % _MEMBERS + 1,
+            coach_id=i % _COACHES + 1,
+            name=f"Plan {i}",
+            starts_at=date.today(),
+            ends_at=date.today() + timedelta(weeks=12),
+        )
+        for d in range(_SESSIONS_PER_PLAN):
+            plan.add_session(
+                WorkoutSession(
+                    name=f"Day {d}",
+                    scheduled_date=date.today() + timedelta(days=d),
+                    exercises=[
+                        PlannedExercise(exercise_id=str(j), name=f"Ex {j}", sets=3, reps=10, rest_seconds=60) for j in range(5)
+                    ],
+                )
+            )
+        await plans.save(plan)
+
+
+_HOT_QUERIES: dict[str, Callable[[_Repos], Awaitable[object]]] = {
+    "member by id": lambda r: r[0].get_by_id(42),
+    "member by email": lambda r: r[0].get_by_email("member42@test.com"),
+    "members page": lambda r: r[0].get_page(100, 20),
+    "coach by id": lambda r: r[1].get_by_id(42),
+    "coaches by ids": lambda r: r[1].get_by_ids([3, 42, 77]),
+    "coaches by specialization": lambda r: r[1].find_by_specialization(Specialization.YOGA),
+    "coach match candidates": lambda r: r[1].find_match_candidates({Specialization.CARDIO}, MembershipTier.PREMIUM, 5),
+    "plan by id": lambda r: r[2].get_by_id(42),
+    "plans by member": lambda r: r[2].get_by_member(42),
+}
+
+
+async def _seq_scans(infra_database, statement: str, parameters: Any) -> list[str]:
+    async with infra_database.engine.begin() as conn:
+        await conn.execute(text("SET LOCAL enable_seqscan = off"))
+        result = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", parameters)
+        explained = result.scalar_one()
+    plans = json.loads(explained) if isinstance(explained, str) else explained
+    found: list[str] = []
+    stack: list[dict[str, Any]] = [p["Plan"] for p in plans]
+    while stack:
+        node = stack.pop()
+        if node["Node Type"] == "Seq Scan":
+            found.append(node["Relation Name"])
+        stack.extend(node.get("Plans", []))
+    return found
+
+
+async def test_hot_queries_use_indexes(infra_database, repos, selects):
+    await _seed(repos)
+    async with infra_database.engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+
+    offenders: dict[str, list[str]] = {}
+    for name, run in _HOT_QUERIES.items():
+        selects.clear()
+        await run(repos)
+        recorded = list(selects)
+        assert recorded, f"{name} sent no query"
+        for statement, parameters in recorded:
+            if scans := await _seq_scans(infra_database, statement, parameters):
+                offenders[f"{name}: {' '.join(statement.split())[:120]}"] = scans
+
+    assert not offenders, "sequential scans (missing index?):\n" + "\n".join(f"  {q} -> {t}" for q, t in offenders.items())
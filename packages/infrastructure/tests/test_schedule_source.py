@@ -0,0 +1,15 @@
+"""Tests for ConfiguredCronSource."""
+
+from infrastructure.taskiq.schedule_source import ConfiguredCronSource
+
+
+async def test_reads_crons_at_startup_not_at_construction():
+    crons = {"sync_exercise_catalog": "0 3 * * *"}
+    source = ConfiguredCronSource(lambda: crons)
+    crons["sync_exercise_catalog"] = "*/5 * * * *"
+
+    await source.startup()
+
+    [schedule] = await source.get_schedules()
+    assert schedule.task_name == schedule.schedule_id == "sync_exercise_catalog"
+    assert schedule.cron == "*/5 * * * *"
@@ -0,0 +1,126 @@
+"""Tests for the Redis Streams broker and its consumer-group consumer.
+
+Scenarios:
+- published entries are handled and acknowledged
+- consumers in one group split the entries between them
+- a failing handler leaves entries pending for another consumer to reclaim
+- entries delivered too often are acknowledged unhandled
+"""
+
+import asyncio
+import uuid
+from collections.abc import Sequence
+
+import pytest
+
+from application.core.logger import ILogger
+from infrastructure.adapters.stream_broker import RedisStreamBroker
+from infrastructure.redis.redis_client import RedisClient
+from infrastructure.redis.stream_consumer import StreamConsumer
+
+
+class _Recorder:
+    def __init__(self, fail: bool = False) -> None:
+        self.messages: list[str] = []
+        self.fail = fail
+
+    async def handle(self, channel: str, messages: Sequence[str]) -> None:
+        if self.fail:
+            raise RuntimeError("handler failed")
+        self.messages.extend(messages)
+
+
+@pytest.fixture()
+async def redis_client(redis_url):
+    client = RedisClient(redis_url)
+    yield client
+    await client.close()
+
+
+@pytest.fixture()
+def stream() -> str:
+    return f"t.stream.{uuid.uuid4().hex}"
+
+
+def _consumer(client: RedisClient, app_logger: ILogger, stream: str, handler: _Recorder, name: str, **kwargs) -> StreamConsumer:
+    return StreamConsumer(client, {stream: handler}, app_logger, group="g", consumer=name, block_ms=10, **kwargs)
+
+
+async def _wait_for(predicate, attempts: int = 100) -> None:
+    for _ in range(attempts):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+async def _stop(task: asyncio.Task[None]) -> None:
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+async def test_published_entries_are_handled_and_acknowledged(redis_client, stream, fake_logger):
+    handler = _Recorder()
+    await redis_client.ensure_group(stream, "g")
+    broker = RedisStreamBroker(redis_client)
+    task = asyncio.create_task(_consumer(redis_client, fake_logger, stream, handler, "c1").run())
+    try:
+        for i in range(3):
+            await broker.publish(stream, str(i))
+        await _wait_for(lambda: len(handler.messages) == 3)
+
+        assert handler.messages == ["0", "1", "2"]
+        assert await redis_client.xpending_idle(stream, "g", 0, 10) == []
+    finally:
+        await _stop(task)
+
+
+async def test_consumers_in_one_group_split_the_entries(redis_client, stream, fake_logger):
+    first, second = _Recorder(), _Recorder()
+    await redis_client.ensure_group(stream, "g")
+    broker = RedisStreamBroker(redis_client)
+    for i in range(4):
+        await broker.publish(stream, str(i))
+
+    await _consumer(redis_client, fake_logger, stream, first, "c1", batch_size=2)._handle(
+        stream, (await redis_client.xreadgroup("g", "c1", [stream], 2, 10))[0][1]
+    )
+    await _consumer(redis_client, fake_logger, stream, second, "c2", batch_size=2)._handle(
+        stream, (await redis_client.xreadgroup("g", "c2", [stream], 2, 10))[0][1]
+    )
+
+    assert first.messages == ["0", "1"]
+    assert second.messages == ["2", "3"]
+
+
+async def test_failed_entries_stay_pending_and_are_reclaimed(redis_client, stream, fake_logger):
+    failing, healthy = _Recorder(fail=True), _Recorder()
+    await redis_client.ensure_group(stream, "g")
+    await RedisStreamBroker(redis_client).publish(stream, "x")
+    task = asyncio.create_task(_consumer(redis_client, fake_logger, stream, failing, "c1", reclaim_idle_seconds=3600).run())
+    try:
+        await asyncio.sleep(0.05)
+    finally:
+        await _stop(task)
+    assert [deliveries for _, deliveries in await redis_client.xpending_idle(stream, "g", 0, 10)] == [1]
+
+    handled = await _consumer(redis_client, fake_logger, stream, healthy, "c2", reclaim_idle_seconds=0).reclaim()
+
+    assert handled == 1
+    assert healthy.messages == ["x"]
+    assert await redis_client.xpending_idle(stream, "g", 0, 10) == []
+
+
+async def test_entries_delivered_too_often_are_dropped(redis_client, stream, fake_logger):
+    failing = _Recorder(fail=True)
+    await redis_client.ensure_group(stream, "g")
+    await RedisStreamBroker(redis_client).publish(stream, "poison")
+    consumer = _consumer(redis_client, fake_logger, stream, failing, "c1", reclaim_idle_seconds=0, max_deliveries=2)
+
+    assert await consumer.reclaim() == 0  # nothing pending yet
+    await consumer._handle(stream, (await redis_client.xreadgroup("g", "c1", [stream], 10, 10))[0][1])
+    assert await consumer.reclaim() == 1  # second delivery, fails again
+    assert await consumer.reclaim() == 0  # delivered twice: acknowledged unhandled
+
+    assert await redis_client.xpending_idle(stream, "g", 0, 10) == []
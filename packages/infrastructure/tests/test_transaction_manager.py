@@ -5,15 +5,18 @@ Scenarios:
 - transaction() wraps multiple saves in one atomic unit
 - transaction() nested without new=True joins the outer transaction
 - transaction(new=True) creates an independent inner transaction
+- unit_of_work() shares one identity map, so repeat get_by_id returns the same aggregate
 """
 
 from datetime import date, timedelta
 
 import pytest
 
+from domain.members.value_objects import Membership, MembershipTier
 from infrastructure.database.base_repository import BaseRepository
 from infrastructure.database.models.member_models import MemberORM
 from infrastructure.database.transaction_manager import TransactionManager
+from infrastructure.repositories.member_repository import MemberRepository, PostgresMemberRepository
 
 
 def _member(email: str) -> MemberORM:
@@ -28,6 +31,10 @@ def _member(email: str) -> MemberORM:
     )
 
 
+def _premium() -> Membership:
+    return Membership(tier=MembershipTier.PREMIUM, valid_until=date.today() + timedelta(days=30))
+
+
 @pytest.fixture()
 def repo(infra_database):
     return BaseRepository(MemberORM, infra_database.session)
@@ -38,6 +45,11 @@ def tm(infra_database):
     return TransactionManager(infra_database)
 
 
+@pytest.fixture()
+def members(infra_database):
+    return MemberRepository(PostgresMemberRepository(infra_database.session))
+
+
 async def test_without_transaction_each_save_is_independent(repo):
     """First save must persist even when an exception is raised afterwards."""
     await repo.save(_member("first@test.com"))
@@ -127,3 +139,51 @@ async def test_new_transaction_rolls_back_independently_when_inner_fails(repo, t
     assert await repo.count() == 1
     members = await repo.find_all()
     assert members[0].email == "outer-c@test.com"
+
+
+async def test_unit_of_work_returns_same_aggregate_for_repeat_get_by_id(repo, tm, members, statement_log):
+    saved = await repo.save(_member("uow-a@test.com"))
+
+    async with tm.unit_of_work():
+        first = await members.get_by_id(saved.id)
+        statement_log.clear()
+        second = await members.get_by_id(saved.id)
+        listed = await members.get_all()
+
+    assert second is first
+    assert listed[0] is first
+    assert not [s for s, _ in statement_log if "WHERE members.id = " in s]
+
+
+async def test_get_by_id_outside_unit_of_work_loads_fresh_aggregate(repo, members):
+    saved = await repo.save(_member("uow-b@test.com"))
+
+    assert await members.get_by_id(saved.id) is not await members.get_by_id(saved.id)
+
+
+async def test_unit_of_work_commits_all_writes_once(repo, tm, members):
+    saved = await repo.save(_member("uow-c@test.com"))
+
+    async with tm.unit_of_work():
+        member = await members.get_by_id(saved.id)
+        member.upgrade_membership(_premium())
+        await members.save(member)
+        await repo.save(_member("uow-d@test.com"))
+        assert (await members.get_by_id(saved.id)).membership.tier == MembershipTier.PREMIUM
+
+    assert await repo.count() == 2
+    assert (await members.get_by_id(saved.id)).membership.tier == MembershipTier.PREMIUM
+
+
+async def test_unit_of_work_rollback_discards_writes_and_identity_map(repo, tm, members):
+    saved = await repo.save(_member("uow-e@test.com"))
+
+    async with tm.unit_of_work() as uow:
+        member = await members.get_by_id(saved.id)
+        member.upgrade_membership(_premium())
+        await members.save(member)
+        await uow.rollback()
+        reloaded = await members.get_by_id(saved.id)
+
+    assert reloaded is not member
+    assert reloaded.membership.tier == MembershipTier.FREE
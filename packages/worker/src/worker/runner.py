@@ -3,13 +3,18 @@ Worker entry point.
 
 Run with:
     taskiq worker worker.runner:broker
+
+Periodic tasks (e.g. the exercise catalog sync) are enqueued by the scheduler:
+    taskiq scheduler worker.runner:scheduler worker.tasks.exercise_tasks
 """
 
 from taskiq import TaskiqEvents, TaskiqState
 
-from bootstrap.broker import broker
+from bootstrap.broker import broker, scheduler
 from bootstrap.context import WorkerApplicationContext
 
+__all__ = ["broker", "scheduler"]
+
 _ctx: WorkerApplicationContext | None = None
 
 
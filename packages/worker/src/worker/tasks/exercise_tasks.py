@@ -0,0 +1,18 @@
+from dependency_injector.wiring import Provide, inject
+
+from application.core.ports import IExerciseCatalog
+from bootstrap.broker import SYNC_EXERCISE_CATALOG, broker
+from bootstrap.containers import Container
+
+
+@broker.task(task_name=SYNC_EXERCISE_CATALOG)
+@inject
+async def sync_exercise_catalog(
+    catalog: IExerciseCatalog = Provide[Container.exercise_catalog],
+) -> None:
+    """Mirror the wger catalog; scheduled by ``bootstrap.broker.scheduler``.
+
+    Deliberately not ``in_unit_of_work``: every page is upserted and committed on
+    its own, so a long sync never holds one transaction, and it raises no events.
+    """
+    await catalog.sync()
@@ -4,9 +4,11 @@ from application.members.member_service import MemberService
 from bootstrap.broker import broker
 from bootstrap.containers import Container
 from domain.members.member import Member
+from worker.tasks.unit_of_work import in_unit_of_work
 
 
 @broker.task
+@in_unit_of_work
 @inject
 async def log_member_activity(
     member_id: int,
@@ -0,0 +1,30 @@
+import functools
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+
+from dependency_injector.wiring import Provide, inject
+
+from application.core.ports import IOutbox, ITransactionManager, IUnitOfWork
+from application.event_dispatcher import EventDispatcher
+from application.unit_of_work import unit_of_work
+from bootstrap.containers import Container
+
+
+@inject
+def _task_unit_of_work(
+    transaction_manager: ITransactionManager = Provide[Container.transaction_manager],
+    dispatcher: EventDispatcher = Provide[Container.event_dispatcher],
+    outbox: IOutbox = Provide[Container.outbox],
+) -> AbstractAsyncContextManager[IUnitOfWork]:
+    return unit_of_work(transaction_manager, dispatcher, outbox)
+
+
+def in_unit_of_work[**P, R](task: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """Run each execution of ``task`` in one unit of work, committed when it returns."""
+
+    @functools.wraps(task)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        async with _task_unit_of_work():
+            return await task(*args, **kwargs)
+
+    return wrapper